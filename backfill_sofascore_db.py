@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Backfill historical days into the database built by bootstrap_sofascore_db.py.
+
+Usage:
+  # Same DB / API environment variables as the bootstrap
+  python backfill_sofascore_db.py --start 2023-07-01 --end 2025-08-19
+  python backfill_sofascore_db.py --start 2025-08-01 --days-parallel 4
+  python backfill_sofascore_db.py --start 2025-08-01 --redo   # ignore checkpoints
+
+For every day in the range (most recent first) this runs the bootstrap's
+scheduled-events ingest for that date and then its per-event enrichment
+pipeline (details, lineups, statistics, starters' heatmaps/transfers).
+Up to --days-parallel days run at once, each on its own DB connection;
+all of them share the bootstrap's API rate limiter, so the API sees the
+same request rate however many days are in flight.
+
+Progress is checkpointed per day in the backfill_days table. Days marked
+done are skipped on the next run; days left running by a crash, or that
+failed, are processed again. Parallel days write overlapping reference rows
+(teams, tournaments); a day whose transaction is picked as a deadlock
+victim is retried rather than failed.
+
+Configuration via environment variables (in addition to the bootstrap's)
+- BACKFILL_DAYS_PARALLEL (default: 3) — days processed concurrently
+- BACKFILL_DEADLOCK_RETRIES (default: 3) — retries of a day hit by a deadlock
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import random
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Set
+
+import psycopg2.errors
+
+import bootstrap_sofascore_db as bs
+from bootstrap_sofascore_db import PGConnection
+
+DAYS_PARALLEL = int(os.environ.get("BACKFILL_DAYS_PARALLEL", "3"))
+DEADLOCK_RETRIES = int(os.environ.get("BACKFILL_DEADLOCK_RETRIES", "3"))
+
+logger = logging.getLogger("backfill")
+
+
+# ---------------
+# Checkpoints
+# ---------------
+
+def done_days(conn: PGConnection, start: date, end: date) -> Set[date]:
+    with conn.cursor() as cur:
+        cur.execute("SELECT day FROM backfill_days WHERE status = 'done' AND day BETWEEN %s AND %s", (start, end))
+        days = {row[0] for row in cur.fetchall()}
+    conn.commit()
+    return days
+
+
+def mark_day(conn: PGConnection, day: date, status: str, events: Optional[int] = None, error: Optional[str] = None) -> None:
+    now = datetime.now(timezone.utc)
+    with conn.cursor() as cur:
+        if status == "running":
+            cur.execute(
+                "INSERT INTO backfill_days (day, status, started_at) VALUES (%s, %s, %s) "
+                "ON CONFLICT (day) DO UPDATE SET status=EXCLUDED.status, events=NULL, started_at=EXCLUDED.started_at, "
+                "finished_at=NULL, error=NULL",
+                (day, status, now),
+            )
+        else:
+            cur.execute(
+                "UPDATE backfill_days SET status=%s, events=%s, finished_at=%s, error=%s WHERE day=%s",
+                (status, events, now, error, day),
+            )
+    conn.commit()
+
+
+# ---------------
+# Engine
+# ---------------
+
+def backfill_day(day: date, sync: Optional[bs.SyncState]) -> int:
+    """Ingest and enrich one day on a fresh connection; return the number of events."""
+    conn = bs._connect(bs.DB_NAME)
+    try:
+        conn.autocommit = False
+        mark_day(conn, day, "running")
+        attempt = 0
+        while True:
+            try:
+                with bs.writes_as(conn, "scheduled_events"):
+                    event_ids = bs.ingest_scheduled_events(conn, day)
+                pipeline = bs.EnrichmentPipeline(conn, sync=sync, final_events=bs.final_event_ids(conn, event_ids))
+                stats = pipeline.run(event_ids)
+                break
+            except psycopg2.errors.DeadlockDetected as e:
+                conn.rollback()
+                attempt += 1
+                if attempt > DEADLOCK_RETRIES:
+                    mark_day(conn, day, "failed", error=str(e)[:1000])
+                    raise
+                logger.info("%s: deadlock, retrying (%d/%d)", day, attempt, DEADLOCK_RETRIES)
+                time.sleep(random.uniform(0.5, 2.0) * attempt)  # desynchronize from the other days
+            except Exception as e:
+                conn.rollback()
+                mark_day(conn, day, "failed", error=str(e)[:1000])
+                raise
+        mark_day(conn, day, "done", events=len(event_ids))
+        logger.debug("%s pipeline: %s", day, stats)
+        return len(event_ids)
+    finally:
+        bs.publish_changes(conn)
+        conn.close()
+
+
+def days_to_run(start: date, end: date, skip: Set[date]) -> List[date]:
+    """Days in [start, end] not in `skip`, most recent first."""
+    days = []
+    day = end
+    while day >= start:
+        if day not in skip:
+            days.append(day)
+        day -= timedelta(days=1)
+    return days
+
+
+def run_backfill(start: date, end: date, days_parallel: int = DAYS_PARALLEL, redo: bool = False) -> None:
+    with bs._connect(bs.DB_NAME) as conn:
+        conn.autocommit = False
+        bs.run_schema(conn)
+        skip = set() if redo else done_days(conn, start, end)
+        sync = bs.SyncState(conn)
+        days = days_to_run(start, end, skip)
+        logger.info("Backfill %s..%s: %d days to process, %d already done, %d in parallel",
+                    start, end, len(days), len(skip), days_parallel)
+
+        started = time.monotonic()
+        finished = failed = events = 0
+        pool = ThreadPoolExecutor(max_workers=max(1, days_parallel), thread_name_prefix="backfill-day")
+        try:
+            futures = {pool.submit(backfill_day, day, sync): day for day in days}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    n = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.warning("Day %s failed: %s", day, e)
+                    continue
+                finished += 1
+                events += n
+                elapsed = time.monotonic() - started
+                logger.info("Day %s: %d events | %d/%d days, %.1f days/hour, %.2f events/sec",
+                            day, n, finished + failed, len(days), finished * 3600 / elapsed, events / elapsed)
+        except KeyboardInterrupt:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
+    elapsed = time.monotonic() - started
+    logger.info("Backfill finished: %d days done, %d failed, %d events in %.0fs (%.1f days/hour, %.2f events/sec)",
+                finished, failed, events, elapsed, finished * 3600 / elapsed if elapsed else 0.0,
+                events / elapsed if elapsed else 0.0)
+    stats = bs.RATE_LIMITER.stats()
+    logger.info("API requests: %d, throttled: %d, retries: %d", stats["requests"], stats["throttled"], bs.RETRY_POLICY.retries)
+    logger.info("Sync: %s", sync.stats())
+
+
+def _parse_day(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+    parser = argparse.ArgumentParser(description="Backfill historical SofaScore days into Postgres")
+    parser.add_argument("--start", type=_parse_day, required=True, help="first day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=_parse_day, default=yesterday, help="last day (YYYY-MM-DD, default: yesterday UTC)")
+    parser.add_argument("--days-parallel", type=int, default=DAYS_PARALLEL, help="days processed concurrently")
+    parser.add_argument("--redo", action="store_true", help="process days already checkpointed as done")
+    args = parser.parse_args(argv)
+    if args.start > args.end:
+        parser.error("--start is after --end")
+
+    bs.ensure_database_exists()
+    run_backfill(args.start, args.end, args.days_parallel, args.redo)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.warning("Interrupted by user; days in progress will be redone on the next run")
+        sys.exit(130)
+    except Exception as exc:
+        logger.exception("Fatal error: %s", exc)
+        sys.exit(1)
@@ -23,6 +23,9 @@ Usage:
 
   # Run the bootstrap
   python scripts/bootstrap_sofascore_db.py
+  # After a crash: continue the unfinished run, or restart from a stage
+  python scripts/bootstrap_sofascore_db.py --resume
+  python scripts/bootstrap_sofascore_db.py --from-stage images
 
 This script:
 - Creates database (if not exists)
@@ -35,20 +38,38 @@ This script:
   * Player heatmaps for starters
   * Player transfer history for starters
 
+Per-event enrichment runs as a pipeline: BOOTSTRAP_EVENT_WORKERS threads
+fetch event details/lineups/statistics, BOOTSTRAP_PLAYER_WORKERS threads
+fetch per-starter data, and the main thread is the only DB writer.
+
 Notes:
 - Some API endpoints have signature/availability quirks. This script
   uses the ones that were verified working during testing.
 - You can re-run safely; UPSERTs ensure idempotency.
+- BOOTSTRAP_INCREMENTAL=1 skips refetching anything whose sync_state
+  watermark is still fresh (see SYNC_MAX_AGE); finished events are never
+  refetched and unchanged payloads are not rewritten.
+- Changed scores, statuses, incidents, lineups and standings are announced
+  after commit as JSON on the BOOTSTRAP_NOTIFY_CHANNEL channel (Postgres
+  LISTEN sofascore_changes; also Redis pub/sub with BOOTSTRAP_NOTIFY_REDIS=1),
+  coalesced per event / tournament season (see ChangeFeed).
 """
 from __future__ import annotations
 
+import argparse
 import os
+import re
 import sys
 import json
 import time
+import hashlib
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 import psycopg2
@@ -56,6 +77,15 @@ from psycopg2 import extensions as pg_ext
 import psycopg2.extras
 from psycopg2.extensions import connection as PGConnection
 
+try:  # optional: only needed with BOOTSTRAP_NOTIFY_REDIS=1
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    redis = None
+
+from sofascore_ratelimit import AdaptiveRateLimiter, RetryPolicy, send_with_retry
+from sofascore_stream import iter_json_array
+from sofascore_transport import STREAM_CHUNK_SIZE
+
 
 # ---------------
 # Configuration
@@ -72,9 +102,9 @@ DATABASE_URL = os.environ.get("DATABASE_URL") or os.environ.get("PGURI")
 REQUEST_TIMEOUT = int(os.environ.get("REQUEST_TIMEOUT", "20"))
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
-# Bootstrap pacing controls
-MAX_EVENTS = int(os.environ.get("BOOTSTRAP_MAX_EVENTS", "10"))
-MAX_STARTERS = int(os.environ.get("BOOTSTRAP_MAX_STARTERS", "6"))
+# Bootstrap pacing controls (0 = no cap: every event / every starter)
+MAX_EVENTS = int(os.environ.get("BOOTSTRAP_MAX_EVENTS", "0"))
+MAX_STARTERS = int(os.environ.get("BOOTSTRAP_MAX_STARTERS", "0"))
 FETCH_TRANSFERS = os.environ.get("BOOTSTRAP_FETCH_TRANSFERS", "1").lower() in ("1", "true", "yes", "y")
 FETCH_HEATMAPS = os.environ.get("BOOTSTRAP_FETCH_HEATMAPS", "1").lower() in ("1", "true", "yes", "y")
 FETCH_STATISTICS = os.environ.get("BOOTSTRAP_FETCH_STATISTICS", "1").lower() in ("1", "true", "yes", "y")
@@ -85,9 +115,66 @@ FETCH_SUGGESTIONS = os.environ.get("BOOTSTRAP_FETCH_SUGGESTIONS", "1").lower() i
 FETCH_LIVE_COUNTS = os.environ.get("BOOTSTRAP_FETCH_LIVE_COUNTS", "1").lower() in ("1", "true", "yes", "y")
 FETCH_IMAGES = os.environ.get("BOOTSTRAP_FETCH_IMAGES", "1").lower() in ("1", "true", "yes", "y")
 
-# Rate limiting for image downloads
+# Per-event enrichment pipeline: fetch workers per stage feed a single DB writer
+# through bounded queues (a full queue blocks the stage in front of it)
+EVENT_WORKERS = int(os.environ.get("BOOTSTRAP_EVENT_WORKERS", "4"))
+PLAYER_WORKERS = int(os.environ.get("BOOTSTRAP_PLAYER_WORKERS", "8"))
+PIPELINE_QUEUE_SIZE = int(os.environ.get("BOOTSTRAP_QUEUE_SIZE", "64"))
+
+# Incremental sync: with BOOTSTRAP_INCREMENTAL=1, entities whose sync_state watermark
+# is younger than the max age (seconds) of their endpoint are not refetched.
+# Event-scoped data fetched after the event reached a final status is never refetched.
+INCREMENTAL = os.environ.get("BOOTSTRAP_INCREMENTAL", "0").lower() in ("1", "true", "yes", "y")
+SYNC_MAX_AGE: Dict[str, float] = {
+    "categories": 7 * 86400,
+    "tournaments": 86400,
+    "event_details": 6 * 3600,
+    "lineups": 15 * 60,
+    "team_statistics": 15 * 60,
+    "player_heatmap": 15 * 60,
+    "player_statistics": 15 * 60,
+    "player_transfers": 7 * 86400,
+}
+FINAL_STATUS_TYPES = ("finished", "canceled", "abandoned")
+
+# Batched writes: upserts are buffered per statement and flushed as multi-row INSERTs
+BATCH_SIZE = int(os.environ.get("BOOTSTRAP_BATCH_SIZE", "1000"))
+# Reference rows (countries, teams, tournaments, seasons) already written this run
+# with identical values are skipped; this bounds how many are remembered
+ROW_CACHE_SIZE = int(os.environ.get("BOOTSTRAP_ROW_CACHE_SIZE", "50000"))
+
+# Change notifications: rows of the watched tables that were actually inserted or updated
+# are published after commit as JSON on NOTIFY_CHANNEL (Postgres NOTIFY, and Redis PUBLISH
+# with BOOTSTRAP_NOTIFY_REDIS=1), coalesced per event / tournament season for NOTIFY_INTERVAL seconds
+NOTIFY = os.environ.get("BOOTSTRAP_NOTIFY", "1").lower() in ("1", "true", "yes", "y")
+NOTIFY_CHANNEL = os.environ.get("BOOTSTRAP_NOTIFY_CHANNEL", "sofascore_changes")
+NOTIFY_INTERVAL = float(os.environ.get("BOOTSTRAP_NOTIFY_INTERVAL", "2"))
+NOTIFY_REDIS = os.environ.get("BOOTSTRAP_NOTIFY_REDIS", "0").lower() in ("1", "true", "yes", "y")
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
+# Watched table -> (message field, column) pairs naming the entity a changed row belongs to
+NOTIFY_TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "events": (("event_id", "id"),),
+    "event_scores": (("event_id", "event_id"),),
+    "event_incidents": (("event_id", "event_id"),),
+    "lineups": (("event_id", "event_id"),),
+    "lineup_players": (("event_id", "event_id"),),
+    "standings": (("tournament_id", "tournament_id"), ("season_id", "season_id")),
+}
+NOTIFY_MAX_BYTES = 7900  # Postgres rejects NOTIFY payloads of 8000 bytes or more
+
+# Rate limiting: one adaptive token bucket per endpoint class, shared by every api_get call.
+# Image endpoints keep their own, slower bucket (one request per IMAGE_DOWNLOAD_DELAY seconds).
+API_RATE = float(os.environ.get("BOOTSTRAP_API_RATE", "20"))
+API_MAX_RETRIES = int(os.environ.get("BOOTSTRAP_API_MAX_RETRIES", "4"))
 IMAGE_DOWNLOAD_DELAY = float(os.environ.get("BOOTSTRAP_IMAGE_DELAY", "0.5"))
 
+RATE_LIMITER = AdaptiveRateLimiter(
+    rate=API_RATE,
+    rules=[("image", r"/image$", 1.0 / IMAGE_DOWNLOAD_DELAY)] if IMAGE_DOWNLOAD_DELAY > 0 else [],
+)
+RETRY_POLICY = RetryPolicy(max_retries=API_MAX_RETRIES)
+
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
     format="%(asctime)s %(levelname)s %(message)s",
@@ -241,6 +328,21 @@ CREATE TABLE IF NOT EXISTS event_scores (
   away_pen INT
 );
 
+CREATE TABLE IF NOT EXISTS event_incidents (
+  event_id BIGINT REFERENCES events(id),
+  incident_key TEXT,
+  incident_type TEXT,
+  incident_class TEXT,
+  minute INT,
+  added_time INT,
+  is_home BOOLEAN,
+  player_id INT,
+  home_score INT,
+  away_score INT,
+  payload JSONB,
+  PRIMARY KEY (event_id, incident_key)
+);
+
 CREATE TABLE IF NOT EXISTS lineups (
   event_id BIGINT REFERENCES events(id),
   team_id INT REFERENCES teams(id),
@@ -376,6 +478,41 @@ CREATE TABLE IF NOT EXISTS images_tournament (
   fetched_at TIMESTAMP DEFAULT now()
 );
 
+CREATE TABLE IF NOT EXISTS sync_state (
+  endpoint TEXT,
+  entity_id TEXT,
+  fetched_at TIMESTAMPTZ NOT NULL,
+  content_hash TEXT,
+  final BOOLEAN DEFAULT false,
+  PRIMARY KEY (endpoint, entity_id)
+);
+
+CREATE TABLE IF NOT EXISTS backfill_days (
+  day DATE PRIMARY KEY,
+  status TEXT CHECK (status IN ('running','done','failed')),
+  events INT,
+  started_at TIMESTAMPTZ,
+  finished_at TIMESTAMPTZ,
+  error TEXT
+);
+
+CREATE TABLE IF NOT EXISTS bootstrap_runs (
+  id SERIAL PRIMARY KEY,
+  started_at TIMESTAMPTZ,
+  finished_at TIMESTAMPTZ,
+  status TEXT CHECK (status IN ('running','done'))
+);
+
+CREATE TABLE IF NOT EXISTS bootstrap_jobs (
+  run_id INT REFERENCES bootstrap_runs(id),
+  stage TEXT,
+  item TEXT,
+  status TEXT CHECK (status IN ('pending','running','done','failed')),
+  seconds DOUBLE PRECISION,
+  updated_at TIMESTAMPTZ,
+  PRIMARY KEY (run_id, stage, item)
+);
+
 CREATE INDEX IF NOT EXISTS idx_events_start_ts ON events(start_ts);
 CREATE INDEX IF NOT EXISTS idx_event_teams_team ON event_teams(team_id);
 CREATE INDEX IF NOT EXISTS idx_lineup_players_player ON lineup_players(player_id);
@@ -386,15 +523,17 @@ CREATE INDEX IF NOT EXISTS idx_lineup_players_player ON lineup_players(player_id
 # DB Utilities
 # ---------------
 
-def _connect(dbname: str) -> PGConnection:
+def _connect(dbname: str, batched: bool = True) -> PGConnection:
     """Connect to Postgres. Uses DATABASE_URL if provided, else individual params.
 
     If no password is supplied, we avoid passing it so libpq can use
-    .pgpass or peer/ident auth as configured.
+    .pgpass or peer/ident auth as configured. With batched=True the
+    connection is a BatchingConnection (see upsert()).
     """
+    factory = BatchingConnection if batched else PGConnection
     if DATABASE_URL:
         # If DATABASE_URL is provided, assume it points to the intended DB
-        return psycopg2.connect(DATABASE_URL)
+        return psycopg2.connect(DATABASE_URL, connection_factory=factory)
 
     dsn: Dict[str, Any] = {
         "host": PGHOST,
@@ -404,7 +543,7 @@ def _connect(dbname: str) -> PGConnection:
     }
     if PGPASSWORD:
         dsn["password"] = PGPASSWORD
-    return psycopg2.connect(**dsn)
+    return psycopg2.connect(connection_factory=factory, **dsn)
 
 
 def ensure_database_exists() -> None:
@@ -445,6 +584,26 @@ def ensure_database_exists() -> None:
         logger.warning("Could not ensure database exists (might already exist or insufficient privileges)")
 
 
+def _wal_lsn(conn: PGConnection) -> Optional[str]:
+    """Current WAL insert position, or None if the server doesn't expose it to us."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_current_wal_lsn()::text")
+            lsn = cur.fetchone()[0]
+        conn.commit()
+        return lsn
+    except Exception as e:
+        logger.debug("WAL position unavailable: %s", e)
+        conn.rollback()
+        return None
+
+
+def _wal_bytes(conn: PGConnection, start: str, end: str) -> int:
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_wal_lsn_diff(%s::pg_lsn, %s::pg_lsn)", (end, start))
+        return int(cur.fetchone()[0])
+
+
 def run_schema(conn: PGConnection) -> None:
     with conn.cursor() as cur:
         cur.execute(SCHEMA_SQL)
@@ -453,22 +612,700 @@ def run_schema(conn: PGConnection) -> None:
 
 
 def upsert(conn: PGConnection, sql: str, params: Tuple[Any, ...]) -> None:
+    """Queue a row on a BatchingConnection; execute it right away on a plain connection."""
+    writer = getattr(conn, "writer", None)
+    if writer is not None:
+        writer.add(sql, params)
+        return
     with conn.cursor() as cur:
         cur.execute(sql, params)
 
 
+def upsert_reference(conn: PGConnection, sql: str, params: Tuple[Any, ...]) -> None:
+    """upsert() for a reference row keyed by params[0]; skipped if this run already wrote it unchanged."""
+    cache = getattr(conn, "row_cache", None)
+    if cache is not None and cache.seen((sql, params[0]), params):
+        return
+    upsert(conn, sql, params)
+
+
+@contextmanager
+def writes_as(conn: PGConnection, label: str) -> Iterator[None]:
+    """Attribute the rows queued inside the block to `label` in the BatchWriter counters."""
+    writer = getattr(conn, "writer", None)
+    if writer is None:
+        yield
+        return
+    previous, writer.label = writer.label, label
+    try:
+        yield
+    finally:
+        writer.label = previous
+
+
 def commit(conn: PGConnection) -> None:
     conn.commit()
 
 
+# ---------------
+# Batched writes
+# ---------------
+_UPSERT_RE = re.compile(
+    r"^\s*INSERT INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES\s*(\(.*?\))\s*(ON CONFLICT\s*\(([^)]*)\)\s*DO\s+(UPDATE|NOTHING)\b.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_UPDATE_RE = re.compile(r"^\s*UPDATE\s+(\w+)\s+SET\s+(.*?)\s+WHERE\s+(\w+)\s*=\s*%s", re.IGNORECASE | re.DOTALL)
+# Tables are created in foreign-key order, so flushing in this order never
+# inserts a child row before the parent row it references.
+_TABLE_ORDER = {name: i for i, name in enumerate(re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)", SCHEMA_SQL))}
+
+
+def _lock_order(key: Any) -> Tuple[Any, ...]:
+    """Sort key for a batched row's conflict key; NULLs and unhashable keys go last."""
+    if type(key) is not tuple:
+        return ((2, ""),)
+    return tuple((1, "") if v is None else (0, type(v).__name__, v) for v in key)
+
+
+class _BatchedStatement:
+    """One UPSERT_* statement rewritten for execute_values, plus its pending rows."""
+
+    __slots__ = ("table", "sql", "template", "ncols", "columns", "keys", "key_idx", "keep_last", "rows", "order")
+
+    def __init__(self, sql: str, order: int):
+        m = _UPSERT_RE.match(sql)
+        if not m:
+            raise ValueError(f"Not a batchable INSERT ... ON CONFLICT statement: {sql[:80]}")
+        table, cols, values, on_conflict, keys, action = m.groups()
+        columns = [c.strip() for c in cols.split(",")]
+        self.table = table
+        self.sql = f"INSERT INTO {table} ({cols}) VALUES %s {on_conflict}"
+        self.template = values
+        self.ncols = values.count("%s")
+        self.columns = columns
+        self.keys = [k.strip() for k in keys.split(",")]
+        self.key_idx = [columns.index(k) for k in self.keys]
+        # DO UPDATE: the last row for a key wins (as if run one by one);
+        # DO NOTHING: the first one does. Postgres rejects a batch that
+        # touches the same key twice, so duplicates are folded here.
+        self.keep_last = action.upper() == "UPDATE"
+        self.rows: Dict[Any, Tuple[str, Tuple[Any, ...]]] = {}  # key -> (label, params)
+        self.order = (_TABLE_ORDER.get(table, len(_TABLE_ORDER)), order)
+
+
+class BatchWriter:
+    """Buffers upsert rows per statement and writes them with multi-row VALUES.
+
+    Rows are flushed every `batch_size` rows, before any cursor is handed out
+    by the connection (so reads see them) and on commit. Statements that are
+    not INSERT ... ON CONFLICT are executed immediately after a flush.
+
+    Rows are counted per `label` (the ingester that queued them, see
+    writes_as()): "touched" rows were sent, "changed" rows were actually
+    inserted or updated. The UPSERT_* statements only update when a column
+    differs, so the gap between the two is the no-op writes avoided.
+    """
+
+    def __init__(self, conn: PGConnection, batch_size: int = BATCH_SIZE):
+        self.conn = conn
+        self.batch_size = max(1, batch_size)
+        self.pending = 0
+        self.rows_in = 0
+        self.rows_written = 0
+        self.deduped = 0
+        self.round_trips = 0
+        self.label = "other"
+        self.labels: Dict[str, Dict[str, int]] = {}
+        self._statements: Dict[str, Optional[_BatchedStatement]] = {}
+
+    def _count(self, label: str, touched: int = 0, changed: int = 0) -> None:
+        counts = self.labels.get(label)
+        if counts is None:
+            counts = self.labels[label] = {"touched": 0, "changed": 0}
+        counts["touched"] += touched
+        counts["changed"] += changed
+
+    def add(self, sql: str, params: Tuple[Any, ...]) -> None:
+        if sql not in self._statements:
+            try:
+                self._statements[sql] = _BatchedStatement(sql, len(self._statements))
+            except ValueError:
+                self._statements[sql] = None
+        stmt = self._statements[sql]
+        if stmt is None:
+            self.flush()
+            with self.conn.cursor() as cur:
+                cur.execute(sql, params)
+                rowcount = cur.rowcount
+            self._count(self.label, 1, max(rowcount, 0))
+            changes = getattr(self.conn, "changes", None)
+            m = _UPDATE_RE.match(sql) if changes is not None else None
+            if m and changes.watches(m.group(1)):
+                # UPDATE t SET a=%s, b=%s WHERE key=%s ...: the SET values come first, then the key
+                columns = [c.split("=")[0].strip() for c in m.group(2).split(",")]
+                changes.note(m.group(1), columns + [m.group(3)], (m.group(3),),
+                             params[:len(columns) + 1], rowcount > 0)
+            self.rows_in += 1
+            self.rows_written += 1
+            self.round_trips += 1
+            return
+        if len(params) != stmt.ncols:
+            raise ValueError(f"{stmt.table}: expected {stmt.ncols} values, got {len(params)}")
+        key: Any = tuple(params[i] for i in stmt.key_idx)
+        try:
+            hash(key)
+        except TypeError:
+            key = object()  # unhashable key values: never folded
+        self.rows_in += 1
+        self._count(self.label, touched=1)
+        if key in stmt.rows:
+            self.deduped += 1
+            if stmt.keep_last:
+                stmt.rows[key] = (self.label, params)
+        else:
+            stmt.rows[key] = (self.label, params)
+            self.pending += 1
+            if self.pending >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        statements = sorted((s for s in self._statements.values() if s is not None and s.rows), key=lambda s: s.order)
+        batches = []
+        for stmt in statements:
+            # Rows go out in conflict-key order, so connections upserting overlapping rows (parallel
+            # backfill days sharing teams and tournaments) lock them in the same order
+            batches.append((stmt, [stmt.rows[key] for key in sorted(stmt.rows, key=_lock_order)]))
+            stmt.rows.clear()
+        self.pending = 0
+        changes = getattr(self.conn, "changes", None)
+        with self.conn.cursor() as cur:
+            for stmt, rows in batches:
+                watched = changes is not None and changes.watches(stmt.table)
+                # Watched tables return the keys of the rows really inserted or updated
+                sql = f"{stmt.sql} RETURNING {', '.join(stmt.keys)}" if watched else stmt.sql
+                # A page holds the rows of one label (for the counts), without reordering them
+                pages: List[Tuple[str, List[Tuple[Any, ...]]]] = []
+                for label, params in rows:
+                    if pages and pages[-1][0] == label and len(pages[-1][1]) < self.batch_size:
+                        pages[-1][1].append(params)
+                    else:
+                        pages.append((label, [params]))
+                for label, page in pages:
+                    returned = psycopg2.extras.execute_values(cur, sql, page, template=stmt.template,
+                                                              page_size=len(page), fetch=watched)
+                    # rowcount excludes conflicting rows whose DO UPDATE ... WHERE found nothing to change
+                    self._count(label, changed=max(cur.rowcount, 0))
+                    if watched:
+                        changed_keys = {tuple(str(v) for v in key) for key in returned}
+                        for params in page:
+                            key = tuple(str(params[k]) for k in stmt.key_idx)
+                            changes.note(stmt.table, stmt.columns, stmt.keys, params, key in changed_keys)
+                    self.rows_written += len(page)
+                    self.round_trips += 1
+
+    def discard(self) -> None:
+        for stmt in self._statements.values():
+            if stmt is not None:
+                stmt.rows.clear()
+        self.pending = 0
+
+    def stats(self) -> Dict[str, int]:
+        changed = sum(c["changed"] for c in self.labels.values())
+        return {
+            "rows_in": self.rows_in,
+            "rows_written": self.rows_written,
+            "rows_changed": changed,
+            "deduped": self.deduped,
+            "round_trips": self.round_trips,
+        }
+
+
+class RowCache:
+    """Bounded LRU of the last row written per reference entity during this run.
+
+    seen() is True when the same values were already written for the key,
+    so the upsert can be skipped. Entries are dropped on rollback, since
+    the rows they describe may not have reached the database.
+    """
+
+    def __init__(self, max_entries: int = ROW_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self.saved = 0
+        self.written = 0
+        self.evicted = 0
+        self._rows: "OrderedDict[Any, str]" = OrderedDict()
+
+    def seen(self, key: Any, params: Tuple[Any, ...]) -> bool:
+        digest = _content_hash([p.adapted if isinstance(p, psycopg2.extras.Json) else p for p in params])
+        if self._rows.get(key) == digest:
+            self._rows.move_to_end(key)
+            self.saved += 1
+            return True
+        self._rows[key] = digest
+        self._rows.move_to_end(key)
+        self.written += 1
+        if len(self._rows) > self.max_entries:
+            self._rows.popitem(last=False)
+            self.evicted += 1
+        return False
+
+    def clear(self) -> None:
+        self._rows.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"writes_saved": self.saved, "writes": self.written, "entries": len(self._rows), "evicted": self.evicted}
+
+
+def _plain(value: Any) -> Any:
+    return value.adapted if isinstance(value, psycopg2.extras.Json) else value
+
+
+class ChangeFeed:
+    """Publishes the rows of NOTIFY_TABLES that a commit really inserted or updated.
+
+    BatchWriter reports every watched row it sends through note(), saying
+    whether the database changed it (the UPSERT_* statements skip identical
+    rows). The changed columns are the ones that differ from the last values
+    this process sent for the row; a row it has not sent before reports all
+    of its columns. Changes made in a transaction are kept on commit and
+    dropped on rollback.
+
+    Kept changes are merged per entity (an event, or a tournament season for
+    standings) and published at most once per `interval` seconds as
+    {"changes": [{"event_id": 1, "tables": {"event_scores": ["home_current"]}}]}
+    on NOTIFY_CHANNEL, split so each payload stays under NOTIFY_MAX_BYTES.
+    A burst of updates to one match therefore yields one entry per window.
+    """
+
+    def __init__(self, conn: PGConnection, interval: float = NOTIFY_INTERVAL, use_redis: bool = NOTIFY_REDIS):
+        self.conn = conn
+        self.interval = interval
+        self.rows_changed = 0
+        self.entities = 0
+        self.messages = 0
+        self._staged: Dict[Tuple[Any, ...], Dict[str, set]] = {}
+        self._pending: Dict[Tuple[Any, ...], Dict[str, set]] = {}
+        self._values: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._last_publish = time.monotonic()
+        self._redis = None
+        if use_redis:
+            if redis is None:
+                logger.warning("BOOTSTRAP_NOTIFY_REDIS is set but the redis package is not installed; using NOTIFY only")
+            else:
+                self._redis = redis.Redis(host=REDIS_HOST, port=REDIS_PORT)
+
+    @staticmethod
+    def watches(table: str) -> bool:
+        return table in NOTIFY_TABLES
+
+    def note(self, table: str, columns: List[str], keys: Any, params: Tuple[Any, ...], changed: bool) -> None:
+        values = {c: _plain(v) for c, v in zip(columns, params)}
+        row_key = (table,) + tuple(values[k] for k in keys)
+        previous = self._values.pop(row_key, None)
+        self._values[row_key] = {**previous, **values} if previous else values
+        if len(self._values) > ROW_CACHE_SIZE:
+            self._values.popitem(last=False)
+        if not changed:
+            return
+        cols = [c for c in columns if c not in keys and (previous is None or previous.get(c) != values[c])]
+        if not cols:  # changed by someone else since we last wrote it
+            cols = [c for c in columns if c not in keys]
+        entity = tuple((field, values[col]) for field, col in NOTIFY_TABLES[table])
+        self._staged.setdefault(entity, {}).setdefault(table, set()).update(cols)
+        self.rows_changed += 1
+
+    def note_deleted(self, table: str, entity_values: Dict[str, Any], columns: List[str], rows: int = 1) -> None:
+        """Stage rows deleted from a watched table; `columns` (its key) are reported as changed."""
+        entity = tuple((field, _plain(entity_values[col])) for field, col in NOTIFY_TABLES[table])
+        self._staged.setdefault(entity, {}).setdefault(table, set()).update(columns)
+        self.rows_changed += rows
+
+    def commit(self) -> None:
+        for entity, tables in self._staged.items():
+            merged = self._pending.setdefault(entity, {})
+            for table, cols in tables.items():
+                merged.setdefault(table, set()).update(cols)
+        self._staged.clear()
+        self.publish()
+
+    def rollback(self) -> None:
+        self._staged.clear()
+        self._values.clear()
+
+    def publish(self, force: bool = False) -> None:
+        """Send pending changes if the window has passed (or `force`); only between transactions."""
+        if not self._pending or (not force and time.monotonic() - self._last_publish < self.interval):
+            return
+        if self.conn.get_transaction_status() != pg_ext.TRANSACTION_STATUS_IDLE:
+            return  # never commit someone else's open transaction
+        pending, self._pending = self._pending, {}
+        self._last_publish = time.monotonic()
+        messages = []
+        chunk: List[str] = []
+        size = 0
+        for entity, tables in pending.items():
+            entry = dict(entity)
+            entry["tables"] = {table: sorted(cols) for table, cols in tables.items()}
+            text = json.dumps(entry, separators=(",", ":"), default=str)
+            if chunk and size + len(text) + 16 > NOTIFY_MAX_BYTES:
+                messages.append('{"changes":[' + ",".join(chunk) + "]}")
+                chunk, size = [], 0
+            chunk.append(text)
+            size += len(text) + 1
+        messages.append('{"changes":[' + ",".join(chunk) + "]}")
+        try:
+            with PGConnection.cursor(self.conn) as cur:
+                for message in messages:
+                    cur.execute("SELECT pg_notify(%s, %s)", (NOTIFY_CHANNEL, message))
+            PGConnection.commit(self.conn)
+            if self._redis is not None:
+                for message in messages:
+                    self._redis.publish(NOTIFY_CHANNEL, message)
+        except Exception as e:
+            logger.warning("Publishing %d change messages failed: %s", len(messages), e)
+            if self.conn.get_transaction_status() != pg_ext.TRANSACTION_STATUS_IDLE:
+                PGConnection.rollback(self.conn)
+            return
+        self.entities += len(pending)
+        self.messages += len(messages)
+
+    def stats(self) -> Dict[str, int]:
+        return {"rows_changed": self.rows_changed, "entities_published": self.entities, "messages": self.messages}
+
+
+def publish_changes(conn: PGConnection, force: bool = True) -> None:
+    """Send the change notifications still waiting for their coalescing window (no-op without a ChangeFeed)."""
+    changes = getattr(conn, "changes", None)
+    if changes is not None:
+        changes.publish(force=force)
+
+
+class BatchingConnection(PGConnection):
+    """psycopg2 connection whose upsert() rows go through a BatchWriter (and, with NOTIFY, a ChangeFeed)."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.writer = BatchWriter(self)
+        self.row_cache = RowCache()
+        self.changes = ChangeFeed(self) if NOTIFY else None
+        # event_id -> {"home": team_id, "away": team_id} for events whose
+        # event_teams rows are committed (see event_team_ids); rows queued in
+        # the open transaction wait in _staged_event_teams until commit()
+        self.event_teams: Dict[int, Dict[str, int]] = {}
+        self._staged_event_teams: Dict[int, Dict[str, int]] = {}
+        # event_id -> (season_id, tournament_id), staged and promoted the same way (see event_season)
+        self.event_seasons: Dict[int, Optional[Tuple[int, int]]] = {}
+        self._staged_event_seasons: Dict[int, Tuple[int, int]] = {}
+        self._on_commit: List[Callable[[], None]] = []
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run callback once the open transaction commits; a rollback drops it."""
+        self._on_commit.append(callback)
+
+    def cursor(self, *args: Any, **kwargs: Any):
+        self.writer.flush()
+        return super().cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        try:
+            self.writer.flush()
+        except Exception:
+            # The failed batch aborted the transaction; start clean for the next ingester
+            self.writer.discard()
+            self.row_cache.clear()
+            self._staged_event_teams.clear()
+            self._staged_event_seasons.clear()
+            self._on_commit.clear()
+            if self.changes is not None:
+                self.changes.rollback()
+            super().rollback()
+            raise
+        super().commit()
+        self.event_teams.update(self._staged_event_teams)
+        self._staged_event_teams.clear()
+        self.event_seasons.update(self._staged_event_seasons)
+        self._staged_event_seasons.clear()
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            callback()
+        if self.changes is not None:
+            self.changes.commit()
+
+    def rollback(self) -> None:
+        self.writer.discard()
+        self.row_cache.clear()
+        self._staged_event_teams.clear()
+        self._staged_event_seasons.clear()
+        self._on_commit.clear()
+        if self.changes is not None:
+            self.changes.rollback()
+        super().rollback()
+
+
+# ---------------
+# Incremental sync
+# ---------------
+
+def _content_hash(payload: Any) -> str:
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")).hexdigest()
+
+
+class SyncState:
+    """Last fetch time and content hash per (endpoint, entity_id), kept in sync_state.
+
+    The table is read once per run. fresh() is safe to call from fetch
+    workers; record() queues an upsert on the given connection (default:
+    the one the state was loaded from), so it must run on the thread that
+    owns that connection and its row commits with the data it describes.
+    On a BatchingConnection the in-memory hash is only updated once that
+    transaction commits, so a store that fails and rolls back is not
+    reported "unchanged" the next time. One SyncState can serve several
+    writer connections. With enabled=False nothing is skipped, but
+    watermarks are still recorded for later incremental runs.
+    """
+
+    def __init__(self, conn: PGConnection, enabled: bool = INCREMENTAL, max_age: Optional[Dict[str, float]] = None):
+        self.conn = conn
+        self.enabled = enabled
+        self.max_age = SYNC_MAX_AGE if max_age is None else max_age
+        self.avoided: Dict[str, int] = {}
+        self.unchanged: Dict[str, int] = {}
+        self.recorded: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._state: Dict[Tuple[str, str], Tuple[float, Optional[str], bool]] = {}
+        with conn.cursor() as cur:
+            cur.execute("SELECT endpoint, entity_id, fetched_at, content_hash, final FROM sync_state")
+            for endpoint, entity_id, fetched_at, content_hash, final in cur.fetchall():
+                self._state[(endpoint, entity_id)] = (fetched_at.timestamp(), content_hash, bool(final))
+        conn.commit()
+
+    def fresh(self, endpoint: str, entity_id: Any) -> bool:
+        """True if the entity does not need refetching now; counted as an avoided API call."""
+        if not self.enabled:
+            return False
+        state = self._state.get((endpoint, str(entity_id)))
+        if state is None:
+            return False
+        fetched_at, _, final = state
+        max_age = self.max_age.get(endpoint)
+        if not final and (max_age is None or time.time() - fetched_at >= max_age):
+            return False
+        with self._lock:
+            self.avoided[endpoint] = self.avoided.get(endpoint, 0) + 1
+        return True
+
+    def record(self, endpoint: str, entity_id: Any, payload: Any, final: bool = False,
+               conn: Optional[PGConnection] = None) -> bool:
+        """Record a fetch; return False if the payload is identical to the last one (the store can be skipped)."""
+        conn = conn or self.conn
+        key = (endpoint, str(entity_id))
+        content_hash = _content_hash(payload)
+        now = datetime.now(timezone.utc)
+        previous = self._state.get(key)
+        with writes_as(conn, "sync_state"):
+            upsert(conn, UPSERT_SYNC_STATE, (endpoint, key[1], now, content_hash, final))
+
+        def remember() -> None:
+            with self._lock:
+                self._state[key] = (now.timestamp(), content_hash, final)
+
+        after_commit = getattr(conn, "after_commit", None)
+        if after_commit is not None:
+            after_commit(remember)
+        else:
+            remember()  # plain connection: the row was executed already
+        with self._lock:
+            self.recorded[endpoint] = self.recorded.get(endpoint, 0) + 1
+            if previous is not None and previous[1] == content_hash:
+                self.unchanged[endpoint] = self.unchanged.get(endpoint, 0) + 1
+                return not self.enabled
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "api_calls_avoided": sum(self.avoided.values()),
+            "avoided": dict(self.avoided),
+            "unchanged": dict(self.unchanged),
+            "recorded": sum(self.recorded.values()),
+        }
+
+
+def final_event_ids(conn: PGConnection, event_ids: List[int]) -> set:
+    """Events among `event_ids` whose stored status is final (see FINAL_STATUS_TYPES)."""
+    if not event_ids:
+        return set()
+    with conn.cursor() as cur:
+        cur.execute("SELECT id FROM events WHERE id = ANY(%s) AND status_type = ANY(%s)",
+                    (list(event_ids), list(FINAL_STATUS_TYPES)))
+        return {row[0] for row in cur.fetchall()}
+
+
+# ---------------
+# Job ledger
+# ---------------
+# Stages of a bootstrap run, in order (see main())
+STAGES = ("sports", "categories", "tournaments", "scheduled_events", "enrichment", "tournament_seasons",
+          "trending", "suggestions", "live_counts", "images")
+
+
+class JobLedger:
+    """Durable record of a bootstrap run: its stages and their work items (bootstrap_jobs).
+
+    A stage row has item ''. Work items (events, "event:player" starters,
+    "tournament:season" pairs) are marked through upsert(), so a mark
+    commits in the same transaction as the rows the item produced, or with
+    commit_now right after them (the enrichment pipeline, whose items span
+    several transactions).
+
+    A stage is only marked done when none of its items is left pending or
+    failed; otherwise it is marked failed and the run is left unfinished.
+    With resume=True the latest unfinished run is continued: stages and
+    items already done are skipped, failed and pending items are retried.
+    `from_stage` skips every stage before it.
+    """
+
+    def __init__(self, conn: PGConnection, resume: bool = False, from_stage: Optional[str] = None):
+        self.conn = conn
+        self.from_stage = STAGES.index(from_stage) if from_stage else 0
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self._done: set = set()  # (stage, item)
+        self._todo: Dict[str, List[str]] = {}  # stage -> items added but not done
+        self.run_id: Optional[int] = None
+        self.incomplete: List[str] = []  # stages of this run that left items pending or failed
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM bootstrap_runs WHERE status <> 'done' ORDER BY id DESC LIMIT 1")
+            row = cur.fetchone()
+            if row and resume:
+                self.run_id = row[0]
+                cur.execute("UPDATE bootstrap_runs SET status='running' WHERE id=%s", (self.run_id,))
+                cur.execute("SELECT stage, item, status FROM bootstrap_jobs WHERE run_id=%s", (self.run_id,))
+                for stage, item, status in cur.fetchall():
+                    if status == "done":
+                        self._done.add((stage, item))
+                    elif item:
+                        self._todo.setdefault(stage, []).append(item)
+                logger.info("Resuming bootstrap run %s (%d jobs already done)", self.run_id, len(self._done))
+            else:
+                if row:
+                    logger.info("Run %s did not finish; starting a new run (use --resume to continue it)", row[0])
+                cur.execute("INSERT INTO bootstrap_runs (started_at, status) VALUES (%s, 'running') RETURNING id",
+                            (datetime.now(timezone.utc),))
+                self.run_id = cur.fetchone()[0]
+        conn.commit()
+
+    def is_done(self, stage: str, item: str = "") -> bool:
+        return (stage, item) in self._done
+
+    def todo(self, stage: str) -> List[str]:
+        """Items of `stage` that were added (in this or the resumed run) and are not done yet."""
+        return [item for item in self._todo.get(stage, []) if (stage, item) not in self._done]
+
+    def add(self, stage: str, items: List[Any]) -> None:
+        """Register work items as pending; they become todo() until marked done."""
+        now = datetime.now(timezone.utc)
+        known = set(self._todo.get(stage, []))
+        with writes_as(self.conn, "ledger"):
+            for item in map(str, items):
+                if item not in known and (stage, item) not in self._done:
+                    upsert(self.conn, UPSERT_BOOTSTRAP_JOB, (self.run_id, stage, item, "pending", None, now))
+                    self._todo.setdefault(stage, []).append(item)
+                    known.add(item)
+
+    def mark(self, stage: str, item: str, status: str = "done", seconds: Optional[float] = None,
+             commit_now: bool = False) -> None:
+        """Queue the item's status row; with commit_now it is committed before is_done() reports it."""
+        with writes_as(self.conn, "ledger"):
+            upsert(self.conn, UPSERT_BOOTSTRAP_JOB, (self.run_id, stage, item, status, seconds, datetime.now(timezone.utc)))
+        if commit_now:
+            commit(self.conn)
+        if status != "done" and item and item not in self._todo.get(stage, ()):
+            self._todo.setdefault(stage, []).append(item)  # failed: retried by a resumed run
+        if status == "done":
+            self._done.add((stage, item))
+            if item:
+                timing = self.timings.get(stage)
+                if timing is not None:
+                    timing["items"] += 1
+
+    def run_stage(self, stage: str, fn: Any, *args: Any) -> Any:
+        """Run one stage unless it is already done or before --from-stage; time it and record the outcome."""
+        if STAGES.index(stage) < self.from_stage or self.is_done(stage):
+            self.timings[stage] = {"status": "skipped", "seconds": 0.0, "items": 0}
+            return None
+        logger.info("Stage %s", stage)
+        self.timings[stage] = timing = {"status": "running", "seconds": 0.0, "items": 0}
+        self.mark(stage, "", "running")
+        commit(self.conn)
+        started = time.monotonic()
+        try:
+            with writes_as(self.conn, stage):
+                result = fn(*args)
+        except BaseException:
+            timing.update(status="failed", seconds=time.monotonic() - started)
+            self.conn.rollback()
+            self.mark(stage, "", "failed", timing["seconds"])
+            commit(self.conn)
+            raise
+        left = len(self.todo(stage))
+        status = "failed" if left else "done"  # the bootstrap_jobs CHECK has no "partial"
+        timing.update(status="partial" if left else "done", seconds=time.monotonic() - started)
+        self.mark(stage, "", status, timing["seconds"])
+        commit(self.conn)
+        if left:
+            self.incomplete.append(stage)
+            logger.warning("Stage %s left %d items pending or failed", stage, left)
+        return result
+
+    def finish(self) -> None:
+        """Mark the run done, unless a stage left items behind: then it stays unfinished for --resume."""
+        if self.incomplete:
+            logger.warning("Run %s is unfinished (%s); continue it with --resume",
+                           self.run_id, ", ".join(self.incomplete))
+            return
+        with self.conn.cursor() as cur:
+            cur.execute("UPDATE bootstrap_runs SET status='done', finished_at=%s WHERE id=%s",
+                        (datetime.now(timezone.utc), self.run_id))
+        self.conn.commit()
+
+    def log_summary(self) -> None:
+        logger.info("Run %s stages:", self.run_id)
+        for stage in STAGES:
+            timing = self.timings.get(stage)
+            if timing is not None:
+                logger.info("  %-18s %-8s %8.1fs %6d items", stage, timing["status"], timing["seconds"], timing["items"])
+
+
 # ---------------
 # API Utilities
 # ---------------
 
-def api_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+_http = threading.local()
+
+
+def _session() -> requests.Session:
+    """requests.Session of the calling thread: pipeline workers each keep their own keep-alive connections."""
+    session = getattr(_http, "session", None)
+    if session is None:
+        session = _http.session = requests.Session()
+    return session
+
+
+def _api_request(path: str, params: Optional[Dict[str, Any]] = None, stream: bool = False) -> requests.Response:
+    """GET through the shared rate limiter, retrying throttled/5xx/connection failures."""
     url = f"{API_BASE}{path}"
-    r = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+    r = send_with_retry(lambda: _session().get(url, params=params, timeout=REQUEST_TIMEOUT, stream=stream), url,
+                        RATE_LIMITER, RETRY_POLICY, errors=(requests.ConnectionError, requests.Timeout))
+    if r.status_code >= 400:
+        r.close()
     r.raise_for_status()
+    return r
+
+
+def api_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    r = _api_request(path, params)
     try:
         data = r.json()
     except Exception:
@@ -476,90 +1313,140 @@ def api_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
     return data
 
 
+def api_iter_array(path: str, array_path: Tuple[str, ...], params: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Yield the items of the JSON array at `array_path` while the response downloads.
+
+    Use for large list payloads (e.g. a day's scheduled events) so processing
+    starts on the first item and memory stays flat; see sofascore_stream.
+    """
+    with _api_request(path, params, stream=True) as r:
+        yield from iter_json_array(r.iter_content(chunk_size=STREAM_CHUNK_SIZE), array_path)
+
+
 # ---------------
 # Upsert SQLs
 # ---------------
 UPSERT_SPORT = (
     "INSERT INTO sports (id, name, slug) VALUES (%s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, slug = EXCLUDED.slug"
+    " WHERE (sports.name, sports.slug) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug)"
 )
 
 UPSERT_COUNTRY = (
     "INSERT INTO countries (alpha2, alpha3, name, slug) VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (alpha2) DO UPDATE SET alpha3 = EXCLUDED.alpha3, name = EXCLUDED.name, slug = EXCLUDED.slug"
+    " WHERE (countries.alpha3, countries.name, countries.slug) IS DISTINCT FROM (EXCLUDED.alpha3, EXCLUDED.name, EXCLUDED.slug)"
 )
 
 UPSERT_CATEGORY = (
     "INSERT INTO categories (id, name, slug, sport_id, flag, alpha2, translations) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, slug=EXCLUDED.slug, sport_id=EXCLUDED.sport_id, flag=EXCLUDED.flag, alpha2=EXCLUDED.alpha2, translations=EXCLUDED.translations"
+    " WHERE (categories.name, categories.slug, categories.sport_id, categories.flag, categories.alpha2, categories.translations) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug, EXCLUDED.sport_id, EXCLUDED.flag, EXCLUDED.alpha2, EXCLUDED.translations)"
 )
 
 UPSERT_UNIQUE_TOURNAMENT = (
     "INSERT INTO unique_tournaments (id, name, slug, category_id, user_count, flags, colors, translations) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, slug=EXCLUDED.slug, category_id=EXCLUDED.category_id, user_count=EXCLUDED.user_count, flags=EXCLUDED.flags, colors=EXCLUDED.colors, translations=EXCLUDED.translations"
+    " WHERE (unique_tournaments.name, unique_tournaments.slug, unique_tournaments.category_id, unique_tournaments.user_count, unique_tournaments.flags, unique_tournaments.colors, unique_tournaments.translations) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug, EXCLUDED.category_id, EXCLUDED.user_count, EXCLUDED.flags, EXCLUDED.colors, EXCLUDED.translations)"
 )
 
 UPSERT_TOURNAMENT = (
     "INSERT INTO tournaments (id, name, slug, unique_tournament_id, category_id, priority, translations) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, slug=EXCLUDED.slug, unique_tournament_id=EXCLUDED.unique_tournament_id, category_id=EXCLUDED.category_id, priority=EXCLUDED.priority, translations=EXCLUDED.translations"
+    " WHERE (tournaments.name, tournaments.slug, tournaments.unique_tournament_id, tournaments.category_id, tournaments.priority, tournaments.translations) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug, EXCLUDED.unique_tournament_id, EXCLUDED.category_id, EXCLUDED.priority, EXCLUDED.translations)"
 )
 
 UPSERT_SEASON = (
     "INSERT INTO seasons (id, tournament_id, name, year, editor) VALUES (%s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET tournament_id=EXCLUDED.tournament_id, name=EXCLUDED.name, year=EXCLUDED.year, editor=EXCLUDED.editor"
+    " WHERE (seasons.tournament_id, seasons.name, seasons.year, seasons.editor) IS DISTINCT FROM (EXCLUDED.tournament_id, EXCLUDED.name, EXCLUDED.year, EXCLUDED.editor)"
 )
 
 UPSERT_TEAM = (
     "INSERT INTO teams (id, name, slug, short_name, country_alpha2, national, disabled, type, foundation_ts, colors, translations) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, slug=EXCLUDED.slug, short_name=EXCLUDED.short_name, country_alpha2=EXCLUDED.country_alpha2, national=EXCLUDED.national, disabled=EXCLUDED.disabled, type=EXCLUDED.type, foundation_ts=EXCLUDED.foundation_ts, colors=EXCLUDED.colors, translations=EXCLUDED.translations"
+    " WHERE (teams.name, teams.slug, teams.short_name, teams.country_alpha2, teams.national, teams.disabled, teams.type, teams.foundation_ts, teams.colors, teams.translations) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug, EXCLUDED.short_name, EXCLUDED.country_alpha2, EXCLUDED.national, EXCLUDED.disabled, EXCLUDED.type, EXCLUDED.foundation_ts, EXCLUDED.colors, EXCLUDED.translations)"
 )
 
 UPSERT_PLAYER = (
     "INSERT INTO players (id, name, slug, short_name, position, jersey_number, height, date_of_birth_ts, country_alpha2, market_value_eur, extra) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, slug=EXCLUDED.slug, short_name=EXCLUDED.short_name, position=EXCLUDED.position, jersey_number=EXCLUDED.jersey_number, height=EXCLUDED.height, date_of_birth_ts=EXCLUDED.date_of_birth_ts, country_alpha2=EXCLUDED.country_alpha2, market_value_eur=EXCLUDED.market_value_eur, extra=EXCLUDED.extra"
+    " WHERE (players.name, players.slug, players.short_name, players.position, players.jersey_number, players.height, players.date_of_birth_ts, players.country_alpha2, players.market_value_eur, players.extra) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug, EXCLUDED.short_name, EXCLUDED.position, EXCLUDED.jersey_number, EXCLUDED.height, EXCLUDED.date_of_birth_ts, EXCLUDED.country_alpha2, EXCLUDED.market_value_eur, EXCLUDED.extra)"
 )
 
 UPSERT_VENUE = (
     "INSERT INTO venues (id, name, slug, city, capacity, country_alpha2, lat, lon, translations) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, slug=EXCLUDED.slug, city=EXCLUDED.city, capacity=EXCLUDED.capacity, country_alpha2=EXCLUDED.country_alpha2, lat=EXCLUDED.lat, lon=EXCLUDED.lon, translations=EXCLUDED.translations"
+    " WHERE (venues.name, venues.slug, venues.city, venues.capacity, venues.country_alpha2, venues.lat, venues.lon, venues.translations) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.slug, EXCLUDED.city, EXCLUDED.capacity, EXCLUDED.country_alpha2, EXCLUDED.lat, EXCLUDED.lon, EXCLUDED.translations)"
 )
 
 UPSERT_REFEREE = (
     "INSERT INTO referees (id, name, country_alpha2, stats) VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET name=EXCLUDED.name, country_alpha2=EXCLUDED.country_alpha2, stats=EXCLUDED.stats"
+    " WHERE (referees.name, referees.country_alpha2, referees.stats) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.country_alpha2, EXCLUDED.stats)"
 )
 
 UPSERT_EVENT = (
     "INSERT INTO events (id, slug, tournament_id, season_id, round, round_name, status_code, status_desc, status_type, winner_code, start_ts, final_result_only, venue_id, referee_id, has_player_stats, has_player_heatmap, extra) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET slug=EXCLUDED.slug, tournament_id=EXCLUDED.tournament_id, season_id=EXCLUDED.season_id, round=EXCLUDED.round, round_name=EXCLUDED.round_name, status_code=EXCLUDED.status_code, status_desc=EXCLUDED.status_desc, status_type=EXCLUDED.status_type, winner_code=EXCLUDED.winner_code, start_ts=EXCLUDED.start_ts, final_result_only=EXCLUDED.final_result_only, venue_id=EXCLUDED.venue_id, referee_id=EXCLUDED.referee_id, has_player_stats=EXCLUDED.has_player_stats, has_player_heatmap=EXCLUDED.has_player_heatmap, extra=EXCLUDED.extra"
+    " WHERE (events.slug, events.tournament_id, events.season_id, events.round, events.round_name, events.status_code, events.status_desc, events.status_type, events.winner_code, events.start_ts, events.final_result_only, events.venue_id, events.referee_id, events.has_player_stats, events.has_player_heatmap, events.extra) IS DISTINCT FROM (EXCLUDED.slug, EXCLUDED.tournament_id, EXCLUDED.season_id, EXCLUDED.round, EXCLUDED.round_name, EXCLUDED.status_code, EXCLUDED.status_desc, EXCLUDED.status_type, EXCLUDED.winner_code, EXCLUDED.start_ts, EXCLUDED.final_result_only, EXCLUDED.venue_id, EXCLUDED.referee_id, EXCLUDED.has_player_stats, EXCLUDED.has_player_heatmap, EXCLUDED.extra)"
+)
+
+# The event row without the columns UPDATE_EVENT_STATUS owns: the schedule refresh of matches the
+# live updater is polling, whose stored status is newer than the schedule snapshot
+UPSERT_EVENT_KEEP_STATUS = (
+    "INSERT INTO events (id, slug, tournament_id, season_id, round, round_name, final_result_only, venue_id, referee_id, has_player_stats, has_player_heatmap, extra) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
+    "ON CONFLICT (id) DO UPDATE SET slug=EXCLUDED.slug, tournament_id=EXCLUDED.tournament_id, season_id=EXCLUDED.season_id, round=EXCLUDED.round, round_name=EXCLUDED.round_name, final_result_only=EXCLUDED.final_result_only, venue_id=EXCLUDED.venue_id, referee_id=EXCLUDED.referee_id, has_player_stats=EXCLUDED.has_player_stats, has_player_heatmap=EXCLUDED.has_player_heatmap, extra=EXCLUDED.extra"
+    " WHERE (events.slug, events.tournament_id, events.season_id, events.round, events.round_name, events.final_result_only, events.venue_id, events.referee_id, events.has_player_stats, events.has_player_heatmap, events.extra) IS DISTINCT FROM (EXCLUDED.slug, EXCLUDED.tournament_id, EXCLUDED.season_id, EXCLUDED.round, EXCLUDED.round_name, EXCLUDED.final_result_only, EXCLUDED.venue_id, EXCLUDED.referee_id, EXCLUDED.has_player_stats, EXCLUDED.has_player_heatmap, EXCLUDED.extra)"
 )
 
 UPSERT_EVENT_TEAM = (
     "INSERT INTO event_teams (event_id, team_id, side) VALUES (%s, %s, %s) "
     "ON CONFLICT (event_id, side) DO UPDATE SET team_id = EXCLUDED.team_id"
+    " WHERE event_teams.team_id IS DISTINCT FROM EXCLUDED.team_id"
 )
 
 UPSERT_EVENT_SCORES = (
     "INSERT INTO event_scores (event_id, home_current, away_current, home_display, away_display, home_p1, away_p1, home_p2, away_p2, home_normaltime, away_normaltime, home_pen, away_pen) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (event_id) DO UPDATE SET home_current=EXCLUDED.home_current, away_current=EXCLUDED.away_current, home_display=EXCLUDED.home_display, away_display=EXCLUDED.away_display, home_p1=EXCLUDED.home_p1, away_p1=EXCLUDED.away_p1, home_p2=EXCLUDED.home_p2, away_p2=EXCLUDED.away_p2, home_normaltime=EXCLUDED.home_normaltime, away_normaltime=EXCLUDED.away_normaltime, home_pen=EXCLUDED.home_pen, away_pen=EXCLUDED.away_pen"
+    " WHERE (event_scores.home_current, event_scores.away_current, event_scores.home_display, event_scores.away_display, event_scores.home_p1, event_scores.away_p1, event_scores.home_p2, event_scores.away_p2, event_scores.home_normaltime, event_scores.away_normaltime, event_scores.home_pen, event_scores.away_pen) IS DISTINCT FROM (EXCLUDED.home_current, EXCLUDED.away_current, EXCLUDED.home_display, EXCLUDED.away_display, EXCLUDED.home_p1, EXCLUDED.away_p1, EXCLUDED.home_p2, EXCLUDED.away_p2, EXCLUDED.home_normaltime, EXCLUDED.away_normaltime, EXCLUDED.home_pen, EXCLUDED.away_pen)"
+)
+
+UPSERT_EVENT_INCIDENT = (
+    "INSERT INTO event_incidents (event_id, incident_key, incident_type, incident_class, minute, added_time, is_home, player_id, home_score, away_score, payload) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
+    "ON CONFLICT (event_id, incident_key) DO UPDATE SET incident_type=EXCLUDED.incident_type, incident_class=EXCLUDED.incident_class, minute=EXCLUDED.minute, added_time=EXCLUDED.added_time, is_home=EXCLUDED.is_home, player_id=EXCLUDED.player_id, home_score=EXCLUDED.home_score, away_score=EXCLUDED.away_score, payload=EXCLUDED.payload"
+    " WHERE (event_incidents.incident_type, event_incidents.incident_class, event_incidents.minute, event_incidents.added_time, event_incidents.is_home, event_incidents.player_id, event_incidents.home_score, event_incidents.away_score, event_incidents.payload) IS DISTINCT FROM (EXCLUDED.incident_type, EXCLUDED.incident_class, EXCLUDED.minute, EXCLUDED.added_time, EXCLUDED.is_home, EXCLUDED.player_id, EXCLUDED.home_score, EXCLUDED.away_score, EXCLUDED.payload)"
+)
+
+# Incidents withdrawn upstream (e.g. a goal cancelled by VAR); the second parameter is the list of keys to keep
+DELETE_EVENT_INCIDENTS_EXCEPT = "DELETE FROM event_incidents WHERE event_id = %s AND incident_key <> ALL(%s)"
+
+# Status/kickoff refresh of an event row (the live updater); a no-op when nothing changed
+UPDATE_EVENT_STATUS = (
+    "UPDATE events SET status_code=%s, status_desc=%s, status_type=%s, winner_code=%s, start_ts=%s WHERE id=%s"
+    " AND (status_code, status_desc, status_type, winner_code, start_ts) IS DISTINCT FROM (%s::int, %s::text, %s::text, %s::int, %s::bigint)"
 )
 
 UPSERT_LINEUP = (
     "INSERT INTO lineups (event_id, team_id, formation, confirmed) VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (event_id, team_id) DO UPDATE SET formation=EXCLUDED.formation, confirmed=EXCLUDED.confirmed"
+    " WHERE (lineups.formation, lineups.confirmed) IS DISTINCT FROM (EXCLUDED.formation, EXCLUDED.confirmed)"
 )
 
 UPSERT_LINEUP_PLAYER = (
     "INSERT INTO lineup_players (event_id, team_id, player_id, position, shirt_number, role, country_alpha2) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (event_id, team_id, player_id, role) DO UPDATE SET position=EXCLUDED.position, shirt_number=EXCLUDED.shirt_number, country_alpha2=EXCLUDED.country_alpha2"
+    " WHERE (lineup_players.position, lineup_players.shirt_number, lineup_players.country_alpha2) IS DISTINCT FROM (EXCLUDED.position, EXCLUDED.shirt_number, EXCLUDED.country_alpha2)"
 )
 
 UPSERT_PLAYER_HEATMAP_POINT = (
@@ -571,24 +1458,30 @@ UPSERT_PLAYER_TRANSFER = (
     "INSERT INTO player_transfers (id, player_id, from_team_id, to_team_id, transfer_fee_eur, transfer_fee_desc, transfer_ts) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (id) DO UPDATE SET player_id=EXCLUDED.player_id, from_team_id=EXCLUDED.from_team_id, to_team_id=EXCLUDED.to_team_id, transfer_fee_eur=EXCLUDED.transfer_fee_eur, transfer_fee_desc=EXCLUDED.transfer_fee_desc, transfer_ts=EXCLUDED.transfer_ts"
+    " WHERE (player_transfers.player_id, player_transfers.from_team_id, player_transfers.to_team_id, player_transfers.transfer_fee_eur, player_transfers.transfer_fee_desc, player_transfers.transfer_ts) IS DISTINCT FROM (EXCLUDED.player_id, EXCLUDED.from_team_id, EXCLUDED.to_team_id, EXCLUDED.transfer_fee_eur, EXCLUDED.transfer_fee_desc, EXCLUDED.transfer_ts)"
 )
 
+# Per-event statistics, merged into the season row as {"<event_id>": ...} (see store_player_statistics);
+# the merge needs one row per key and transaction, which the per-event store_* calls give
 UPSERT_PLAYER_STATISTICS = (
     "INSERT INTO player_statistics (player_id, season_id, tournament_id, stats) "
     "VALUES (%s, %s, %s, %s) "
-    "ON CONFLICT (player_id, season_id, tournament_id) DO UPDATE SET stats=EXCLUDED.stats"
+    "ON CONFLICT (player_id, season_id, tournament_id) DO UPDATE SET stats=COALESCE(player_statistics.stats, '{}'::jsonb) || EXCLUDED.stats"
+    " WHERE player_statistics.stats IS NULL OR NOT player_statistics.stats @> EXCLUDED.stats"
 )
 
 UPSERT_TEAM_STATISTICS = (
     "INSERT INTO team_statistics (team_id, season_id, tournament_id, stats) "
     "VALUES (%s, %s, %s, %s) "
-    "ON CONFLICT (team_id, season_id, tournament_id) DO UPDATE SET stats=EXCLUDED.stats"
+    "ON CONFLICT (team_id, season_id, tournament_id) DO UPDATE SET stats=COALESCE(team_statistics.stats, '{}'::jsonb) || EXCLUDED.stats"
+    " WHERE team_statistics.stats IS NULL OR NOT team_statistics.stats @> EXCLUDED.stats"
 )
 
 UPSERT_STANDINGS = (
     "INSERT INTO standings (tournament_id, season_id, group_name, team_id, rank, played, wins, draws, losses, gf, ga, gd, points, extra) "
     "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
     "ON CONFLICT (tournament_id, season_id, group_name, team_id) DO UPDATE SET rank=EXCLUDED.rank, played=EXCLUDED.played, wins=EXCLUDED.wins, draws=EXCLUDED.draws, losses=EXCLUDED.losses, gf=EXCLUDED.gf, ga=EXCLUDED.ga, gd=EXCLUDED.gd, points=EXCLUDED.points, extra=EXCLUDED.extra"
+    " WHERE (standings.rank, standings.played, standings.wins, standings.draws, standings.losses, standings.gf, standings.ga, standings.gd, standings.points, standings.extra) IS DISTINCT FROM (EXCLUDED.rank, EXCLUDED.played, EXCLUDED.wins, EXCLUDED.draws, EXCLUDED.losses, EXCLUDED.gf, EXCLUDED.ga, EXCLUDED.gd, EXCLUDED.points, EXCLUDED.extra)"
 )
 
 UPSERT_TOURNAMENT_FEATURED_EVENT = (
@@ -601,48 +1494,79 @@ UPSERT_TOURNAMENT_VIDEO = (
     "INSERT INTO tournament_videos (tournament_id, season_id, video_id, payload) "
     "VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (tournament_id, season_id, video_id) DO UPDATE SET payload=EXCLUDED.payload"
+    " WHERE tournament_videos.payload IS DISTINCT FROM EXCLUDED.payload"
 )
 
 UPSERT_TRENDING_PLAYER = (
     "INSERT INTO trending_players (player_id, event_id, rating, payload) "
     "VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (player_id, event_id) DO UPDATE SET rating=EXCLUDED.rating, payload=EXCLUDED.payload"
+    " WHERE (trending_players.rating, trending_players.payload) IS DISTINCT FROM (EXCLUDED.rating, EXCLUDED.payload)"
 )
 
+# API suggestion type -> suggestions.entity_type (the table's CHECK); other types are not stored
+SUGGESTION_TYPES = {
+    "team": "team",
+    "player": "player",
+    "uniqueTournament": "unique_tournament",
+    "unique_tournament": "unique_tournament",
+    "tournament": "tournament",
+}
+
 UPSERT_SUGGESTION = (
     "INSERT INTO suggestions (entity_type, entity_id, score, payload) "
     "VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (entity_type, entity_id) DO UPDATE SET score=EXCLUDED.score, payload=EXCLUDED.payload"
+    " WHERE (suggestions.score, suggestions.payload) IS DISTINCT FROM (EXCLUDED.score, EXCLUDED.payload)"
 )
 
 UPSERT_LIVE_CATEGORY_COUNT = (
     "INSERT INTO live_category_counts (category_id, live_count) "
     "VALUES (%s, %s) "
     "ON CONFLICT (category_id) DO UPDATE SET live_count=EXCLUDED.live_count"
+    " WHERE live_category_counts.live_count IS DISTINCT FROM EXCLUDED.live_count"
 )
 
 UPSERT_EVENT_COUNT_BY_SPORT = (
     "INSERT INTO event_count_by_sport (sport_slug, live, total) "
     "VALUES (%s, %s, %s) "
     "ON CONFLICT (sport_slug) DO UPDATE SET live=EXCLUDED.live, total=EXCLUDED.total"
+    " WHERE (event_count_by_sport.live, event_count_by_sport.total) IS DISTINCT FROM (EXCLUDED.live, EXCLUDED.total)"
 )
 
+# The guards compare the URL (and kind) only: re-fetching an unchanged image
+# is a no-op, so fetched_at records when the URL was first stored or last
+# changed, not the latest fetch.
 UPSERT_PLAYER_IMAGE = (
     "INSERT INTO images_player (player_id, url, kind, fetched_at) "
     "VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (player_id) DO UPDATE SET url=EXCLUDED.url, kind=EXCLUDED.kind, fetched_at=EXCLUDED.fetched_at"
+    " WHERE (images_player.url, images_player.kind) IS DISTINCT FROM (EXCLUDED.url, EXCLUDED.kind)"
 )
 
 UPSERT_TEAM_IMAGE = (
     "INSERT INTO images_team (team_id, size, url, fetched_at) "
     "VALUES (%s, %s, %s, %s) "
     "ON CONFLICT (team_id, size) DO UPDATE SET url=EXCLUDED.url, fetched_at=EXCLUDED.fetched_at"
+    " WHERE images_team.url IS DISTINCT FROM EXCLUDED.url"
 )
 
 UPSERT_TOURNAMENT_IMAGE = (
     "INSERT INTO images_tournament (tournament_id, url, fetched_at) "
     "VALUES (%s, %s, %s) "
     "ON CONFLICT (tournament_id) DO UPDATE SET url=EXCLUDED.url, fetched_at=EXCLUDED.fetched_at"
+    " WHERE images_tournament.url IS DISTINCT FROM EXCLUDED.url"
+)
+
+UPSERT_SYNC_STATE = (
+    "INSERT INTO sync_state (endpoint, entity_id, fetched_at, content_hash, final) VALUES (%s, %s, %s, %s, %s) "
+    "ON CONFLICT (endpoint, entity_id) DO UPDATE SET fetched_at=EXCLUDED.fetched_at, content_hash=EXCLUDED.content_hash, final=EXCLUDED.final"
+)
+
+UPSERT_BOOTSTRAP_JOB = (
+    "INSERT INTO bootstrap_jobs (run_id, stage, item, status, seconds, updated_at) VALUES (%s, %s, %s, %s, %s, %s) "
+    "ON CONFLICT (run_id, stage, item) DO UPDATE SET status=EXCLUDED.status, seconds=EXCLUDED.seconds, updated_at=EXCLUDED.updated_at"
+    " WHERE (bootstrap_jobs.status, bootstrap_jobs.seconds) IS DISTINCT FROM (EXCLUDED.status, EXCLUDED.seconds)"
 )
 
 
@@ -661,7 +1585,7 @@ def upsert_country_from_obj(conn: PGConnection, obj: Dict[str, Any]) -> Optional
     alpha2 = obj.get("alpha2")
     if not alpha2:
         return None
-    upsert(
+    upsert_reference(
         conn,
         UPSERT_COUNTRY,
         (
@@ -674,13 +1598,20 @@ def upsert_country_from_obj(conn: PGConnection, obj: Dict[str, Any]) -> Optional
     return alpha2
 
 
-def ingest_categories(conn: PGConnection) -> None:
+def ingest_categories(conn: PGConnection, sync: Optional[SyncState] = None) -> None:
+    if sync is not None and sync.fresh("categories", "football"):
+        logger.info("Categories are fresh; skipped")
+        return
     try:
         data = api_get("/football/categories")
         cats = data.get("success") and data.get("data", {}).get("categories")
         if not cats:
             logger.warning("No categories returned")
             return
+        if sync is not None and not sync.record("categories", "football", cats):
+            commit(conn)
+            logger.info("Categories unchanged since last fetch")
+            return
         for c in cats:
             sport = c.get("sport") or {}
             sport_id = sport.get("id") or 1
@@ -707,7 +1638,7 @@ def upsert_team_from_obj(conn: PGConnection, t: Dict[str, Any]) -> None:
     country_alpha2 = None
     if t.get("country"):
         country_alpha2 = upsert_country_from_obj(conn, t["country"]) or None
-    upsert(
+    upsert_reference(
         conn,
         UPSERT_TEAM,
         (
@@ -728,7 +1659,7 @@ def upsert_team_from_obj(conn: PGConnection, t: Dict[str, Any]) -> None:
 
 def upsert_unique_tournament_from_obj(conn: PGConnection, ut: Dict[str, Any]) -> None:
     cat = ut.get("category") or {}
-    upsert(
+    upsert_reference(
         conn,
         UPSERT_UNIQUE_TOURNAMENT,
         (
@@ -747,7 +1678,7 @@ def upsert_unique_tournament_from_obj(conn: PGConnection, ut: Dict[str, Any]) ->
 def upsert_tournament_from_obj(conn: PGConnection, t: Dict[str, Any]) -> None:
     cat = t.get("category") or {}
     ut = t.get("uniqueTournament") or {}
-    upsert(
+    upsert_reference(
         conn,
         UPSERT_TOURNAMENT,
         (
@@ -763,7 +1694,7 @@ def upsert_tournament_from_obj(conn: PGConnection, t: Dict[str, Any]) -> None:
 
 
 def upsert_season_from_obj(conn: PGConnection, season: Dict[str, Any], tournament_id: Optional[int]) -> None:
-    upsert(
+    upsert_reference(
         conn,
         UPSERT_SEASON,
         (
@@ -776,13 +1707,20 @@ def upsert_season_from_obj(conn: PGConnection, season: Dict[str, Any], tournamen
     )
 
 
-def ingest_tournaments_catalog(conn: PGConnection) -> None:
+def ingest_tournaments_catalog(conn: PGConnection, sync: Optional[SyncState] = None) -> None:
+    if sync is not None and sync.fresh("tournaments", "football"):
+        logger.info("Tournaments catalog is fresh; skipped")
+        return
     try:
         data = api_get("/football/tournaments")
         results = data.get("success") and data.get("data", {}).get("results")
         if not results:
             logger.warning("No tournaments returned")
             return
+        if sync is not None and not sync.record("tournaments", "football", results):
+            commit(conn)
+            logger.info("Tournaments catalog unchanged since last fetch")
+            return
         for row in results:
             entity = row.get("entity") or {}
             cat = entity.get("category") or {}
@@ -822,418 +1760,534 @@ def ingest_tournaments_catalog(conn: PGConnection) -> None:
         logger.exception("Failed ingesting tournaments catalog: %s", e)
 
 
+def stage_event_teams(conn: PGConnection, event_id: int, teams: Dict[str, int]) -> None:
+    """Remember an event's queued event_teams rows; event_team_ids() sees them once they commit."""
+    staged = getattr(conn, "_staged_event_teams", None)
+    if staged is not None:
+        staged[event_id] = teams
+
+
+def event_team_ids(conn: PGConnection, event_id: int) -> Dict[str, int]:
+    """Team id per side for an event.
+
+    A BatchingConnection keeps the committed rows of the events it ingested
+    (and each one read here) until forget_event_teams(), so per-event
+    enrichment never has to read them back; other connections always read
+    event_teams.
+    """
+    known = getattr(conn, "event_teams", None)
+    teams = known.get(event_id) if known is not None else None
+    if teams is None:
+        with conn.cursor() as cur:
+            cur.execute("SELECT side, team_id FROM event_teams WHERE event_id=%s", (event_id,))
+            teams = {side: team_id for side, team_id in cur.fetchall()}
+        if known is not None:
+            known[event_id] = teams
+    return teams
+
+
+def stage_event_season(conn: PGConnection, event_id: int, season_id: Any, tournament_id: Any) -> None:
+    """Remember a queued event row's season and tournament; event_season() sees them once they commit."""
+    staged = getattr(conn, "_staged_event_seasons", None)
+    if staged is not None and season_id is not None and tournament_id is not None:
+        staged[event_id] = (season_id, tournament_id)
+
+
+def event_season(conn: PGConnection, event_id: int) -> Optional[Tuple[int, int]]:
+    """(season_id, tournament_id) of a stored event, or None.
+
+    Like event_team_ids(), served from the connection for the events it
+    ingested; the events table is only read for the others.
+    """
+    known = getattr(conn, "event_seasons", None)
+    if known is not None and event_id in known:
+        return known[event_id]
+    with conn.cursor() as cur:
+        cur.execute("SELECT season_id, tournament_id FROM events WHERE id=%s", (event_id,))
+        row = cur.fetchone()
+    season = (row[0], row[1]) if row and row[0] is not None and row[1] is not None else None
+    if known is not None:
+        known[event_id] = season
+    return season
+
+
+def forget_event_teams(conn: PGConnection, event_ids: Iterable[int]) -> None:
+    """Drop events whose enrichment is finished from the connection's event -> teams and season maps."""
+    for attr in ("event_teams", "event_seasons"):
+        known = getattr(conn, attr, None)
+        if known is not None:
+            for event_id in event_ids:
+                known.pop(event_id, None)
+
+
 def _extract_score_val(s: Dict[str, Any], key: str) -> Optional[int]:
     if not isinstance(s, dict):
         return None
     return s.get(key)
 
 
+def event_scores_row(event_id: int, e: Dict[str, Any]) -> Tuple[Any, ...]:
+    """UPSERT_EVENT_SCORES params from an event payload's homeScore/awayScore."""
+    hs = e.get("homeScore") or {}
+    as_ = e.get("awayScore") or {}
+    return (
+        event_id,
+        _extract_score_val(hs, "current"),
+        _extract_score_val(as_, "current"),
+        _extract_score_val(hs, "display"),
+        _extract_score_val(as_, "display"),
+        _extract_score_val(hs, "period1"),
+        _extract_score_val(as_, "period1"),
+        _extract_score_val(hs, "period2"),
+        _extract_score_val(as_, "period2"),
+        _extract_score_val(hs, "normaltime"),
+        _extract_score_val(as_, "normaltime"),
+        _extract_score_val(hs, "penalties"),
+        _extract_score_val(as_, "penalties"),
+    )
+
+
+def event_status_row(event_id: int, e: Dict[str, Any]) -> Tuple[Any, ...]:
+    """UPDATE_EVENT_STATUS params from an event payload."""
+    status = e.get("status") or {}
+    values = (status.get("code"), status.get("description"), status.get("type"), e.get("winnerCode"), e.get("startTimestamp"))
+    return values + (event_id,) + values
+
+
+def ingest_scheduled_events(conn: PGConnection, day: date, keep_status: AbstractSet[int] = frozenset()) -> List[int]:
+    """Ingest the scheduled events of one UTC day; return their ids. API/DB errors propagate.
+
+    Events in `keep_status` (matches the live updater is polling) keep their
+    stored status, kickoff and scores, which are newer than the schedule.
+    """
+    params = {"date": day.isoformat()}
+    # Streamed: each event is upserted as soon as it has been parsed off the socket
+    events = api_iter_array("/football/events/scheduled", ("data", "events"), params=params)
+    ingested_event_ids: List[int] = []
+    for e in events:
+        # unique tournament and tournament rows
+        ut = e.get("tournament", {}).get("uniqueTournament") or {}
+        if ut:
+            upsert_unique_tournament_from_obj(conn, ut)
+        tournament = e.get("tournament") or {}
+        if tournament:
+            upsert_tournament_from_obj(conn, tournament)
+        # season
+        season = e.get("season") or {}
+        if season:
+            upsert_season_from_obj(conn, season, tournament.get("id"))
+        # teams
+        home = e.get("homeTeam") or {}
+        away = e.get("awayTeam") or {}
+        if home:
+            upsert_team_from_obj(conn, home)
+        if away:
+            upsert_team_from_obj(conn, away)
+        # event core
+        status = e.get("status") or {}
+        round_info = e.get("roundInfo") or {}
+        event_id = e.get("id")
+        row = (
+            event_id,
+            e.get("slug"),
+            tournament.get("id"),
+            season.get("id"),
+            round_info.get("round"),
+            round_info.get("name"),
+            status.get("code"),
+            status.get("description"),
+            status.get("type"),
+            e.get("winnerCode"),
+            e.get("startTimestamp"),
+            e.get("finalResultOnly"),
+            None,
+            None,
+            e.get("hasEventPlayerStatistics"),
+            e.get("hasEventPlayerHeatMap"),
+            psycopg2.extras.Json({"priority": tournament.get("priority"), "detailId": e.get("detailId")}),
+        )
+        live = event_id in keep_status
+        if live:
+            upsert(conn, UPSERT_EVENT_KEEP_STATUS, row[:6] + row[11:])
+        else:
+            upsert(conn, UPSERT_EVENT, row)
+        # link teams to event
+        teams: Dict[str, int] = {}
+        stage_event_teams(conn, int(event_id), teams)
+        stage_event_season(conn, int(event_id), season.get("id"), tournament.get("id"))
+        if home.get("id"):
+            upsert(conn, UPSERT_EVENT_TEAM, (event_id, home.get("id"), "home"))
+            teams["home"] = home["id"]
+        if away.get("id"):
+            upsert(conn, UPSERT_EVENT_TEAM, (event_id, away.get("id"), "away"))
+            teams["away"] = away["id"]
+        # scores
+        if not live:
+            upsert(conn, UPSERT_EVENT_SCORES, event_scores_row(event_id, e))
+        ingested_event_ids.append(int(event_id))
+    if not ingested_event_ids:
+        logger.warning("No scheduled events for %s", day)
+        return []
+    commit(conn)
+    logger.info("Ingested %d scheduled events for %s", len(ingested_event_ids), day)
+    return ingested_event_ids
+
+
 def ingest_scheduled_events_for_today(conn: PGConnection) -> List[int]:
-    today = datetime.now(timezone.utc).date().isoformat()
-    params = {"date": today}
     try:
-        data = api_get("/football/events/scheduled", params=params)
-        events = data.get("success") and (data.get("data", {}) or {}).get("events", [])
-        if not events:
-            logger.warning("No scheduled events for %s", today)
-            return []
-        ingested_event_ids: List[int] = []
-        for e in events:
-            # unique tournament and tournament rows
-            ut = e.get("tournament", {}).get("uniqueTournament") or {}
-            if ut:
-                upsert_unique_tournament_from_obj(conn, ut)
-            tournament = e.get("tournament") or {}
-            if tournament:
-                upsert_tournament_from_obj(conn, tournament)
-            # season
-            season = e.get("season") or {}
-            if season:
-                upsert_season_from_obj(conn, season, tournament.get("id"))
-            # teams
-            home = e.get("homeTeam") or {}
-            away = e.get("awayTeam") or {}
-            if home:
-                upsert_team_from_obj(conn, home)
-            if away:
-                upsert_team_from_obj(conn, away)
-            # event core
-            status = e.get("status") or {}
-            round_info = e.get("roundInfo") or {}
-            event_id = e.get("id")
+        return ingest_scheduled_events(conn, datetime.now(timezone.utc).date())
+    except Exception as e:
+        logger.exception("Failed ingesting scheduled events: %s", e)
+        return []
+
+
+def fetch_event_details(event_id: int) -> Optional[Dict[str, Any]]:
+    data = api_get("/football/event/details", params={"event_id": event_id})
+    return data.get("success") and (data.get("data") or {}).get("event") or None
+
+
+def store_event_details(conn: PGConnection, event_id: int, event: Dict[str, Any]) -> None:
+    # Venue
+    venue = event.get("venue") or {}
+    venue_id = venue.get("id")
+    if venue_id:
+        country_alpha2 = None
+        if venue.get("country"):
+            country_alpha2 = upsert_country_from_obj(conn, venue["country"]) or None
+        coords = venue.get("venueCoordinates") or {}
+        upsert(
+            conn,
+            UPSERT_VENUE,
+            (
+                venue_id,
+                venue.get("name"),
+                venue.get("slug"),
+                (venue.get("city") or {}).get("name"),
+                (venue.get("stadium") or {}).get("capacity"),
+                country_alpha2,
+                coords.get("latitude"),
+                coords.get("longitude"),
+                psycopg2.extras.Json(venue.get("fieldTranslations") or {}),
+            ),
+        )
+    # Referee
+    referee = event.get("referee") or {}
+    referee_id = referee.get("id")
+    if referee_id:
+        alpha2 = None
+        if referee.get("country"):
+            alpha2 = upsert_country_from_obj(conn, referee["country"]) or None
+        upsert(
+            conn,
+            UPSERT_REFEREE,
+            (
+                referee_id,
+                referee.get("name"),
+                alpha2,
+                psycopg2.extras.Json({
+                    "yellowCards": referee.get("yellowCards"),
+                    "redCards": referee.get("redCards"),
+                    "yellowRedCards": referee.get("yellowRedCards"),
+                    "games": referee.get("games"),
+                }),
+            ),
+        )
+    # Update event with venue/referee ids & extra
+    upsert(
+        conn,
+        UPSERT_EVENT,
+        (
+            event_id,
+            event.get("slug"),
+            (event.get("tournament") or {}).get("id"),
+            (event.get("season") or {}).get("id"),
+            (event.get("roundInfo") or {}).get("round"),
+            (event.get("roundInfo") or {}).get("name"),
+            (event.get("status") or {}).get("code"),
+            (event.get("status") or {}).get("description"),
+            (event.get("status") or {}).get("type"),
+            event.get("winnerCode"),
+            event.get("startTimestamp"),
+            event.get("finalResultOnly"),
+            venue_id,
+            referee_id,
+            event.get("hasEventPlayerStatistics"),
+            event.get("hasEventPlayerHeatMap"),
+            psycopg2.extras.Json({"defaultPeriodCount": event.get("defaultPeriodCount"), "defaultPeriodLength": event.get("defaultPeriodLength")}),
+        ),
+    )
+
+
+def enrich_event_details(conn: PGConnection, event_id: int) -> None:
+    try:
+        event = fetch_event_details(event_id)
+        if not event:
+            return
+        store_event_details(conn, event_id, event)
+        commit(conn)
+    except Exception as e:
+        logger.warning("Event %s details enrich failed: %s", event_id, e)
+
+
+def fetch_event_incidents(event_id: int) -> Optional[List[Dict[str, Any]]]:
+    """The event's incidents; None (not []) when the API did not answer, so callers never prune on a failure."""
+    data = api_get(f"/event/{event_id}/incidents")
+    if not data.get("success"):
+        return None
+    return (data.get("data") or {}).get("incidents") or []
+
+
+def incident_key(inc: Dict[str, Any]) -> str:
+    """Stable key of an incident within its event; period and injury-time markers have no id."""
+    if inc.get("id") is not None:
+        return f"{inc.get('incidentType')}:{inc['id']}"
+    return f"{inc.get('incidentType')}:{inc.get('time')}:{inc.get('addedTime') or 0}:{inc.get('text') or ''}"
+
+
+def incident_row(event_id: int, inc: Dict[str, Any]) -> Tuple[Any, ...]:
+    """UPSERT_EVENT_INCIDENT params for one incident."""
+    return (
+        event_id,
+        incident_key(inc),
+        inc.get("incidentType"),
+        inc.get("incidentClass"),
+        inc.get("time"),
+        inc.get("addedTime"),
+        inc.get("isHome"),
+        (inc.get("player") or {}).get("id"),
+        inc.get("homeScore"),
+        inc.get("awayScore"),
+        psycopg2.extras.Json(inc),
+    )
+
+
+def store_event_incidents(conn: PGConnection, event_id: int, incidents: List[Dict[str, Any]]) -> None:
+    for inc in incidents:
+        upsert(conn, UPSERT_EVENT_INCIDENT, incident_row(event_id, inc))
+
+
+def fetch_lineups(event_id: int) -> Dict[str, Any]:
+    data = api_get("/football/event/lineups", params={"event_id": event_id})
+    return data.get("success") and data.get("data") or {}
+
+
+def store_lineups(conn: PGConnection, event_id: int, payload: Dict[str, Any]) -> Tuple[List[int], List[int]]:
+    """Return (home_player_ids, away_player_ids) for the starters that were stored."""
+    confirmed = bool(payload.get("confirmed"))
+    starters_home: List[int] = []
+    starters_away: List[int] = []
+    teams = event_team_ids(conn, event_id)
+    for side_key, collect in (("home_team", starters_home), ("away_team", starters_away)):
+        team_block = payload.get(side_key) or {}
+        formation = team_block.get("formation")
+        team_id = teams.get("home" if side_key == "home_team" else "away")
+        if not team_id:
+            continue
+        upsert(conn, UPSERT_LINEUP, (event_id, team_id, formation, confirmed))
+        # starters
+        for p in (team_block.get("starting_eleven") or []):
+            pid = p.get("player_id")
+            if pid:
+                collect.append(int(pid))
+            # upsert player minimal row
             upsert(
                 conn,
-                UPSERT_EVENT,
+                UPSERT_PLAYER,
                 (
-                    event_id,
-                    e.get("slug"),
-                    tournament.get("id"),
-                    season.get("id"),
-                    round_info.get("round"),
-                    round_info.get("name"),
-                    status.get("code"),
-                    status.get("description"),
-                    status.get("type"),
-                    e.get("winnerCode"),
-                    e.get("startTimestamp"),
-                    e.get("finalResultOnly"),
+                    pid,
+                    p.get("name"),
+                    None,
+                    None,
+                    p.get("position"),
+                    p.get("shirt_number"),
                     None,
                     None,
-                    e.get("hasEventPlayerStatistics"),
-                    e.get("hasEventPlayerHeatMap"),
-                    psycopg2.extras.Json({"priority": tournament.get("priority"), "detailId": e.get("detailId")}),
+                    None,
+                    None,
+                    psycopg2.extras.Json({"source": "lineup"}),
                 ),
             )
-            # link teams to event
-            if home.get("id"):
-                upsert(conn, UPSERT_EVENT_TEAM, (event_id, home.get("id"), "home"))
-            if away.get("id"):
-                upsert(conn, UPSERT_EVENT_TEAM, (event_id, away.get("id"), "away"))
-            # scores
-            hs = e.get("homeScore") or {}
-            as_ = e.get("awayScore") or {}
             upsert(
                 conn,
-                UPSERT_EVENT_SCORES,
+                UPSERT_LINEUP_PLAYER,
                 (
                     event_id,
-                    _extract_score_val(hs, "current"),
-                    _extract_score_val(as_, "current"),
-                    _extract_score_val(hs, "display"),
-                    _extract_score_val(as_, "display"),
-                    _extract_score_val(hs, "period1"),
-                    _extract_score_val(as_, "period1"),
-                    _extract_score_val(hs, "period2"),
-                    _extract_score_val(as_, "period2"),
-                    _extract_score_val(hs, "normaltime"),
-                    _extract_score_val(as_, "normaltime"),
-                    _extract_score_val(hs, "penalties"),
-                    _extract_score_val(as_, "penalties"),
+                    team_id,
+                    pid,
+                    p.get("position"),
+                    p.get("shirt_number"),
+                    "starter",
+                    None,
                 ),
             )
-            ingested_event_ids.append(int(event_id))
-        commit(conn)
-        logger.info("Ingested %d scheduled events for %s", len(ingested_event_ids), today)
-        return ingested_event_ids
-    except Exception as e:
-        logger.exception("Failed ingesting scheduled events: %s", e)
-        return []
-
-
-def enrich_event_details(conn: PGConnection, event_id: int) -> None:
-    try:
-        data = api_get("/football/event/details", params={"event_id": event_id})
-        event = data.get("success") and (data.get("data") or {}).get("event")
-        if not event:
-            return
-        # Venue
-        venue = event.get("venue") or {}
-        venue_id = venue.get("id")
-        if venue_id:
-            country_alpha2 = None
-            if venue.get("country"):
-                country_alpha2 = upsert_country_from_obj(conn, venue["country"]) or None
-            coords = venue.get("venueCoordinates") or {}
+        # subs
+        for p in (team_block.get("substitutes") or []):
+            pid = p.get("player_id")
             upsert(
                 conn,
-                UPSERT_VENUE,
+                UPSERT_PLAYER,
                 (
-                    venue_id,
-                    venue.get("name"),
-                    venue.get("slug"),
-                    (venue.get("city") or {}).get("name"),
-                    (venue.get("stadium") or {}).get("capacity"),
-                    country_alpha2,
-                    coords.get("latitude"),
-                    coords.get("longitude"),
-                    psycopg2.extras.Json(venue.get("fieldTranslations") or {}),
+                    pid,
+                    p.get("name"),
+                    None,
+                    None,
+                    p.get("position"),
+                    p.get("shirt_number"),
+                    None,
+                    None,
+                    None,
+                    None,
+                    psycopg2.extras.Json({"source": "lineup"}),
                 ),
             )
-        # Referee
-        referee = event.get("referee") or {}
-        referee_id = referee.get("id")
-        if referee_id:
-            alpha2 = None
-            if referee.get("country"):
-                alpha2 = upsert_country_from_obj(conn, referee["country"]) or None
             upsert(
                 conn,
-                UPSERT_REFEREE,
+                UPSERT_LINEUP_PLAYER,
                 (
-                    referee_id,
-                    referee.get("name"),
-                    alpha2,
-                    psycopg2.extras.Json({
-                        "yellowCards": referee.get("yellowCards"),
-                        "redCards": referee.get("redCards"),
-                        "yellowRedCards": referee.get("yellowRedCards"),
-                        "games": referee.get("games"),
-                    }),
+                    event_id,
+                    team_id,
+                    pid,
+                    p.get("position"),
+                    p.get("shirt_number"),
+                    "sub",
+                    None,
                 ),
             )
-        # Update event with venue/referee ids & extra
-        upsert(
-            conn,
-            UPSERT_EVENT,
-            (
-                event_id,
-                event.get("slug"),
-                (event.get("tournament") or {}).get("id"),
-                (event.get("season") or {}).get("id"),
-                (event.get("roundInfo") or {}).get("round"),
-                (event.get("roundInfo") or {}).get("name"),
-                (event.get("status") or {}).get("code"),
-                (event.get("status") or {}).get("description"),
-                (event.get("status") or {}).get("type"),
-                event.get("winnerCode"),
-                event.get("startTimestamp"),
-                event.get("finalResultOnly"),
-                venue_id,
-                referee_id,
-                event.get("hasEventPlayerStatistics"),
-                event.get("hasEventPlayerHeatMap"),
-                psycopg2.extras.Json({"defaultPeriodCount": event.get("defaultPeriodCount"), "defaultPeriodLength": event.get("defaultPeriodLength")}),
-            ),
-        )
-        commit(conn)
-    except Exception as e:
-        logger.warning("Event %s details enrich failed: %s", event_id, e)
+    return starters_home, starters_away
 
 
 def ingest_lineups(conn: PGConnection, event_id: int) -> Tuple[List[int], List[int]]:
     """Return (home_player_ids, away_player_ids) for starters."""
     try:
-        data = api_get("/football/event/lineups", params={"event_id": event_id})
-        payload = data.get("success") and data.get("data") or {}
-        confirmed = bool(payload.get("confirmed"))
-        starters_home: List[int] = []
-        starters_away: List[int] = []
-        for side_key, collect in (("home_team", starters_home), ("away_team", starters_away)):
-            team_block = payload.get(side_key) or {}
-            formation = team_block.get("formation")
-            # We need team_id from events table (event_teams)
-            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-                cur.execute("SELECT team_id FROM event_teams WHERE event_id=%s AND side=%s", (event_id, "home" if side_key=="home_team" else "away"))
-                row = cur.fetchone()
-                if not row:
-                    continue
-                team_id = row[0]
-            upsert(conn, UPSERT_LINEUP, (event_id, team_id, formation, confirmed))
-            # starters
-            for p in (team_block.get("starting_eleven") or []):
-                pid = p.get("player_id")
-                if pid:
-                    collect.append(int(pid))
-                # upsert player minimal row
-                upsert(
-                    conn,
-                    UPSERT_PLAYER,
-                    (
-                        pid,
-                        p.get("name"),
-                        None,
-                        None,
-                        p.get("position"),
-                        p.get("shirt_number"),
-                        None,
-                        None,
-                        None,
-                        None,
-                        psycopg2.extras.Json({"source": "lineup"}),
-                    ),
-                )
-                upsert(
-                    conn,
-                    UPSERT_LINEUP_PLAYER,
-                    (
-                        event_id,
-                        team_id,
-                        pid,
-                        p.get("position"),
-                        p.get("shirt_number"),
-                        "starter",
-                        None,
-                    ),
-                )
-            # subs
-            for p in (team_block.get("substitutes") or []):
-                pid = p.get("player_id")
-                upsert(
-                    conn,
-                    UPSERT_PLAYER,
-                    (
-                        pid,
-                        p.get("name"),
-                        None,
-                        None,
-                        p.get("position"),
-                        p.get("shirt_number"),
-                        None,
-                        None,
-                        None,
-                        None,
-                        psycopg2.extras.Json({"source": "lineup"}),
-                    ),
-                )
-                upsert(
-                    conn,
-                    UPSERT_LINEUP_PLAYER,
-                    (
-                        event_id,
-                        team_id,
-                        pid,
-                        p.get("position"),
-                        p.get("shirt_number"),
-                        "sub",
-                        None,
-                    ),
-                )
+        starters = store_lineups(conn, event_id, fetch_lineups(event_id))
         commit(conn)
-        return starters_home, starters_away
+        return starters
     except Exception as e:
         logger.warning("Event %s lineups ingest failed: %s", event_id, e)
         return [], []
 
 
+def fetch_player_heatmap(event_id: int, player_id: int) -> List[Dict[str, Any]]:
+    data = api_get("/football/player/heatmap", params={"event_id": event_id, "player_id": player_id})
+    return data.get("success") and (data.get("data") or {}).get("heatmap") or []
+
+
+def store_player_heatmap(conn: PGConnection, event_id: int, player_id: int, points: List[Dict[str, Any]]) -> None:
+    for idx, pt in enumerate(points):
+        upsert(
+            conn,
+            UPSERT_PLAYER_HEATMAP_POINT,
+            (event_id, player_id, idx, pt.get("x"), pt.get("y")),
+        )
+
+
 def ingest_player_heatmap(conn: PGConnection, event_id: int, player_id: int) -> None:
     try:
-        data = api_get("/football/player/heatmap", params={"event_id": event_id, "player_id": player_id})
-        points = data.get("success") and (data.get("data") or {}).get("heatmap") or []
-        for idx, pt in enumerate(points):
-            upsert(
-                conn,
-                UPSERT_PLAYER_HEATMAP_POINT,
-                (event_id, player_id, idx, pt.get("x"), pt.get("y")),
-            )
+        store_player_heatmap(conn, event_id, player_id, fetch_player_heatmap(event_id, player_id))
         commit(conn)
     except Exception as e:
         logger.debug("Heatmap fetch failed for event %s player %s: %s", event_id, player_id, e)
 
 
+def fetch_player_transfers(player_id: int) -> List[Dict[str, Any]]:
+    data = api_get("/football/player/transfer-history", params={"player_id": player_id})
+    return data.get("success") and (data.get("data") or {}).get("transferHistory") or []
+
+
+def store_player_transfers(conn: PGConnection, player_id: int, history: List[Dict[str, Any]]) -> None:
+    for tr in history:
+        tr_id = tr.get("id")
+        p = tr.get("player") or {}
+        from_team = tr.get("transferFrom") or {}
+        to_team = tr.get("transferTo") or {}
+        # ensure teams in DB
+        if from_team:
+            upsert_team_from_obj(conn, from_team)
+        if to_team:
+            upsert_team_from_obj(conn, to_team)
+        upsert(
+            conn,
+            UPSERT_PLAYER_TRANSFER,
+            (
+                tr_id,
+                p.get("id") or player_id,
+                from_team.get("id"),
+                to_team.get("id"),
+                (tr.get("transferFeeRaw") or {}).get("value"),
+                tr.get("transferFeeDescription"),
+                tr.get("transferDateTimestamp"),
+            ),
+        )
+
+
 def ingest_player_transfers(conn: PGConnection, player_id: int) -> None:
     try:
-        data = api_get("/football/player/transfer-history", params={"player_id": player_id})
-        history = data.get("success") and (data.get("data") or {}).get("transferHistory") or []
-        for tr in history:
-            tr_id = tr.get("id")
-            p = tr.get("player") or {}
-            from_team = tr.get("transferFrom") or {}
-            to_team = tr.get("transferTo") or {}
-            # ensure teams in DB
-            if from_team:
-                upsert_team_from_obj(conn, from_team)
-            if to_team:
-                upsert_team_from_obj(conn, to_team)
-            upsert(
-                conn,
-                UPSERT_PLAYER_TRANSFER,
-                (
-                    tr_id,
-                    p.get("id") or player_id,
-                    from_team.get("id"),
-                    to_team.get("id"),
-                    (tr.get("transferFeeRaw") or {}).get("value"),
-                    tr.get("transferFeeDescription"),
-                    tr.get("transferDateTimestamp"),
-                ),
-            )
+        store_player_transfers(conn, player_id, fetch_player_transfers(player_id))
         commit(conn)
     except Exception as e:
         logger.debug("Transfers fetch failed for player %s: %s", player_id, e)
 
 
+def fetch_player_statistics(event_id: int, player_id: int) -> Dict[str, Any]:
+    data = api_get("/football/event/player/statistics", params={"event_id": event_id, "player_id": player_id})
+    return data.get("success") and (data.get("data") or {}).get("statistics") or {}
+
+
+def store_player_statistics(conn: PGConnection, event_id: int, player_id: int, stats: Dict[str, Any]) -> None:
+    """Merge one event's statistics into the player's season row, under the event id."""
+    season = event_season(conn, event_id) if stats else None
+    if season:
+        upsert(conn, UPSERT_PLAYER_STATISTICS, (player_id, *season, psycopg2.extras.Json({str(event_id): stats})))
+
+
 def ingest_player_statistics(conn: PGConnection, event_id: int, player_id: int) -> None:
     """Ingest player statistics for a specific event."""
     try:
-        data = api_get("/football/event/player/statistics", params={"event_id": event_id, "player_id": player_id})
-        stats = data.get("success") and (data.get("data") or {}).get("statistics") or {}
-        if stats:
-            upsert(
-                conn,
-                UPSERT_PLAYER_STATISTICS,
-                (
-                    event_id,
-                    player_id,
-                    stats.get("minutesPlayed"),
-                    stats.get("goals"),
-                    stats.get("assists"),
-                    stats.get("yellowCards"),
-                    stats.get("redCards"),
-                    stats.get("shots"),
-                    stats.get("shotsOnTarget"),
-                    stats.get("passes"),
-                    stats.get("passesAccurate"),
-                    stats.get("tackles"),
-                    stats.get("interceptions"),
-                    stats.get("fouls"),
-                    stats.get("rating"),
-                    psycopg2.extras.Json(stats),
-                ),
-            )
+        store_player_statistics(conn, event_id, player_id, fetch_player_statistics(event_id, player_id))
         commit(conn)
     except Exception as e:
         logger.debug("Player statistics fetch failed for event %s player %s: %s", event_id, player_id, e)
 
 
+def fetch_team_statistics(event_id: int) -> List[Dict[str, Any]]:
+    data = api_get("/football/event/statistics", params={"event_id": event_id})
+    return data.get("success") and (data.get("data") or {}).get("statistics") or []
+
+
+def store_team_statistics(conn: PGConnection, event_id: int, stats_data: List[Dict[str, Any]]) -> None:
+    """Merge one event's statistics into each team's season row, under the event id.
+
+    Stored per side as {"<event_id>": {"side": ..., "groups": {group: {name: value}}}}.
+    """
+    teams = event_team_ids(conn, event_id)
+    season = event_season(conn, event_id) if teams and stats_data else None
+    if not season:
+        return
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {"home": {}, "away": {}}
+    for stat_group in stats_data:
+        group_name = stat_group.get("groupName")
+        for item in stat_group.get("statisticsItems") or []:
+            for side in ("home", "away"):
+                value = item.get(f"{side}Value")
+                if value is not None:
+                    groups[side].setdefault(group_name, {})[item.get("name")] = value
+    for side, side_groups in groups.items():
+        if side in teams and side_groups:
+            stats = {str(event_id): {"side": side, "groups": side_groups}}
+            upsert(conn, UPSERT_TEAM_STATISTICS, (teams[side], *season, psycopg2.extras.Json(stats)))
+
+
 def ingest_team_statistics(conn: PGConnection, event_id: int) -> None:
     """Ingest team statistics for a specific event."""
     try:
-        data = api_get("/football/event/statistics", params={"event_id": event_id})
-        stats_data = data.get("success") and (data.get("data") or {}).get("statistics") or []
-        
-        # Get team IDs for this event
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-            cur.execute("SELECT team_id, side FROM event_teams WHERE event_id=%s", (event_id,))
-            teams = {row[1]: row[0] for row in cur.fetchall()}
-        
-        for stat_group in stats_data:
-            group_name = stat_group.get("groupName")
-            stats_items = stat_group.get("statisticsItems") or []
-            
-            for item in stats_items:
-                home_value = item.get("homeValue")
-                away_value = item.get("awayValue")
-                stat_name = item.get("name")
-                
-                # Insert for home team
-                if "home" in teams and home_value is not None:
-                    upsert(
-                        conn,
-                        UPSERT_TEAM_STATISTICS,
-                        (
-                            event_id,
-                            teams["home"],
-                            "home",
-                            group_name,
-                            stat_name,
-                            home_value,
-                            psycopg2.extras.Json(item),
-                        ),
-                    )
-                
-                # Insert for away team
-                if "away" in teams and away_value is not None:
-                    upsert(
-                        conn,
-                        UPSERT_TEAM_STATISTICS,
-                        (
-                            event_id,
-                            teams["away"],
-                            "away",
-                            group_name,
-                            stat_name,
-                            away_value,
-                            psycopg2.extras.Json(item),
-                        ),
-                    )
-        
+        store_team_statistics(conn, event_id, fetch_team_statistics(event_id))
         commit(conn)
     except Exception as e:
         logger.debug("Team statistics fetch failed for event %s: %s", event_id, e)
 
 
-def ingest_standings(conn: PGConnection, tournament_id: int, season_id: int) -> None:
-    """Ingest standings for a tournament season."""
+def ingest_standings(conn: PGConnection, tournament_id: int, season_id: int) -> bool:
+    """Ingest standings for a tournament season; False (rolled back) if it failed."""
     try:
         data = api_get("/football/tournament/standings", params={"tournament_id": tournament_id, "season_id": season_id})
         standings_data = data.get("success") and (data.get("data") or {}).get("standings") or []
@@ -1250,33 +2304,38 @@ def ingest_standings(conn: PGConnection, tournament_id: int, season_id: int) ->
                     # Ensure team exists in database
                     upsert_team_from_obj(conn, team)
                     
+                    goals_for, goals_against = row.get("scoresFor"), row.get("scoresAgainst")
                     upsert(
                         conn,
                         UPSERT_STANDINGS,
                         (
                             tournament_id,
                             season_id,
-                            team_id,
                             group_name,
+                            team_id,
                             row.get("position"),
                             row.get("matches"),
                             row.get("wins"),
                             row.get("draws"),
                             row.get("losses"),
-                            row.get("scoresFor"),
-                            row.get("scoresAgainst"),
+                            goals_for,
+                            goals_against,
+                            goals_for - goals_against if goals_for is not None and goals_against is not None else None,
                             row.get("points"),
                             psycopg2.extras.Json(row),
                         ),
                     )
         
         commit(conn)
+        return True
     except Exception as e:
+        conn.rollback()
         logger.debug("Standings fetch failed for tournament %s season %s: %s", tournament_id, season_id, e)
+        return False
 
 
-def ingest_tournament_featured_events(conn: PGConnection, tournament_id: int) -> None:
-    """Ingest featured events for a tournament."""
+def ingest_tournament_featured_events(conn: PGConnection, tournament_id: int) -> bool:
+    """Ingest featured events for a tournament; False (rolled back) if it failed."""
     try:
         data = api_get("/football/tournament/featured-events", params={"tournament_id": tournament_id})
         events = data.get("success") and (data.get("data") or {}).get("events") or []
@@ -1284,25 +2343,18 @@ def ingest_tournament_featured_events(conn: PGConnection, tournament_id: int) ->
         for event in events:
             event_id = event.get("id")
             if event_id:
-                upsert(
-                    conn,
-                    UPSERT_TOURNAMENT_FEATURED_EVENTS,
-                    (
-                        tournament_id,
-                        event_id,
-                        event.get("priority"),
-                        event.get("featured"),
-                        psycopg2.extras.Json(event),
-                    ),
-                )
+                upsert(conn, UPSERT_TOURNAMENT_FEATURED_EVENT, (tournament_id, event_id))
         
         commit(conn)
+        return True
     except Exception as e:
+        conn.rollback()
         logger.debug("Tournament featured events fetch failed for tournament %s: %s", tournament_id, e)
+        return False
 
 
-def ingest_tournament_videos(conn: PGConnection, tournament_id: int) -> None:
-    """Ingest videos for a tournament."""
+def ingest_tournament_videos(conn: PGConnection, tournament_id: int, season_id: int) -> bool:
+    """Ingest videos for a tournament; False (rolled back) if it failed."""
     try:
         data = api_get("/football/tournament/videos", params={"tournament_id": tournament_id})
         videos = data.get("success") and (data.get("data") or {}).get("videos") or []
@@ -1312,22 +2364,16 @@ def ingest_tournament_videos(conn: PGConnection, tournament_id: int) -> None:
             if video_id:
                 upsert(
                     conn,
-                    UPSERT_TOURNAMENT_VIDEOS,
-                    (
-                        tournament_id,
-                        video_id,
-                        video.get("title"),
-                        video.get("url"),
-                        video.get("thumbnail"),
-                        video.get("duration"),
-                        video.get("publishedAt"),
-                        psycopg2.extras.Json(video),
-                    ),
+                    UPSERT_TOURNAMENT_VIDEO,
+                    (tournament_id, season_id, str(video_id), psycopg2.extras.Json(video)),
                 )
         
         commit(conn)
+        return True
     except Exception as e:
+        conn.rollback()
         logger.debug("Tournament videos fetch failed for tournament %s: %s", tournament_id, e)
+        return False
 
 
 def ingest_trending_players(conn: PGConnection) -> None:
@@ -1339,8 +2385,9 @@ def ingest_trending_players(conn: PGConnection) -> None:
         for player_data in players:
             player = player_data.get("player") or {}
             player_id = player.get("id")
+            event_id = (player_data.get("event") or {}).get("id")
             
-            if player_id:
+            if player_id and event_id:  # trending_players is keyed by (player, event)
                 # Ensure player exists in database
                 upsert(
                     conn,
@@ -1362,12 +2409,11 @@ def ingest_trending_players(conn: PGConnection) -> None:
                 
                 upsert(
                     conn,
-                    UPSERT_TRENDING_PLAYERS,
+                    UPSERT_TRENDING_PLAYER,
                     (
                         player_id,
-                        player_data.get("trendingRank"),
-                        player_data.get("trendingScore"),
-                        player_data.get("category"),
+                        event_id,
+                        player_data.get("rating") or player_data.get("trendingScore"),
                         psycopg2.extras.Json(player_data),
                     ),
                 )
@@ -1385,19 +2431,12 @@ def ingest_suggestions(conn: PGConnection, query: str = "football") -> None:
         
         for suggestion in suggestions:
             suggestion_id = suggestion.get("id")
-            if suggestion_id:
+            entity_type = SUGGESTION_TYPES.get(suggestion.get("type"))
+            if suggestion_id and entity_type:
                 upsert(
                     conn,
-                    UPSERT_SUGGESTIONS,
-                    (
-                        suggestion_id,
-                        query,
-                        suggestion.get("type"),
-                        suggestion.get("name"),
-                        suggestion.get("slug"),
-                        suggestion.get("priority"),
-                        psycopg2.extras.Json(suggestion),
-                    ),
+                    UPSERT_SUGGESTION,
+                    (entity_type, str(suggestion_id), suggestion.get("priority"), psycopg2.extras.Json(suggestion)),
                 )
         
         commit(conn)
@@ -1414,17 +2453,7 @@ def ingest_live_category_counts(conn: PGConnection) -> None:
         for category in categories:
             category_id = category.get("id")
             if category_id:
-                upsert(
-                    conn,
-                    UPSERT_LIVE_CATEGORY_COUNTS,
-                    (
-                        category_id,
-                        category.get("name"),
-                        category.get("liveCount"),
-                        category.get("totalCount"),
-                        psycopg2.extras.Json(category),
-                    ),
-                )
+                upsert(conn, UPSERT_LIVE_CATEGORY_COUNT, (category_id, category.get("liveCount")))
         
         commit(conn)
     except Exception as e:
@@ -1438,18 +2467,12 @@ def ingest_event_count_by_sport(conn: PGConnection) -> None:
         sports = data.get("success") and (data.get("data") or {}).get("sports") or []
         
         for sport in sports:
-            sport_id = sport.get("id")
-            if sport_id:
+            sport_slug = sport.get("slug")
+            if sport_slug:
                 upsert(
                     conn,
                     UPSERT_EVENT_COUNT_BY_SPORT,
-                    (
-                        sport_id,
-                        sport.get("name"),
-                        sport.get("eventCount"),
-                        sport.get("liveEventCount"),
-                        psycopg2.extras.Json(sport),
-                    ),
+                    (sport_slug, sport.get("liveEventCount"), sport.get("eventCount")),
                 )
         
         commit(conn)
@@ -1458,7 +2481,7 @@ def ingest_event_count_by_sport(conn: PGConnection) -> None:
 
 
 def ingest_player_images(conn: PGConnection) -> None:
-    """Ingest player images with rate limiting."""
+    """Ingest player images (paced by the "image" rate-limit bucket)."""
     try:
         # Get all players from database to fetch their images
         cursor = conn.cursor()
@@ -1467,25 +2490,10 @@ def ingest_player_images(conn: PGConnection) -> None:
         
         for player_id, player_slug in players:
             try:
-                # Add rate limiting delay
-                time.sleep(IMAGE_DOWNLOAD_DELAY)
-                
                 data = api_get(f"/player/{player_id}/image")
                 if data.get("success") and data.get("data"):
                     image_data = data["data"]
-                    upsert(
-                        conn,
-                        UPSERT_IMAGES_PLAYER,
-                        (
-                            player_id,
-                            image_data.get("url"),
-                            image_data.get("type"),
-                            image_data.get("width"),
-                            image_data.get("height"),
-                            image_data.get("size"),
-                            psycopg2.extras.Json(image_data),
-                        ),
-                    )
+                    upsert(conn, UPSERT_PLAYER_IMAGE, (player_id, image_data.get("url"), image_data.get("type"), datetime.now(timezone.utc)))
             except Exception as e:
                 logger.debug("Player image fetch failed for player %s: %s", player_id, e)
                 continue
@@ -1496,7 +2504,7 @@ def ingest_player_images(conn: PGConnection) -> None:
 
 
 def ingest_team_images(conn: PGConnection) -> None:
-    """Ingest team images with rate limiting."""
+    """Ingest team images (paced by the "image" rate-limit bucket)."""
     try:
         # Get all teams from database to fetch their images
         cursor = conn.cursor()
@@ -1505,25 +2513,10 @@ def ingest_team_images(conn: PGConnection) -> None:
         
         for team_id, team_slug in teams:
             try:
-                # Add rate limiting delay
-                time.sleep(IMAGE_DOWNLOAD_DELAY)
-                
                 data = api_get(f"/team/{team_id}/image")
                 if data.get("success") and data.get("data"):
                     image_data = data["data"]
-                    upsert(
-                        conn,
-                        UPSERT_IMAGES_TEAM,
-                        (
-                            team_id,
-                            image_data.get("url"),
-                            image_data.get("type"),
-                            image_data.get("width"),
-                            image_data.get("height"),
-                            image_data.get("size"),
-                            psycopg2.extras.Json(image_data),
-                        ),
-                    )
+                    upsert(conn, UPSERT_TEAM_IMAGE, (team_id, "full", image_data.get("url"), datetime.now(timezone.utc)))
             except Exception as e:
                 logger.debug("Team image fetch failed for team %s: %s", team_id, e)
                 continue
@@ -1534,7 +2527,7 @@ def ingest_team_images(conn: PGConnection) -> None:
 
 
 def ingest_tournament_images(conn: PGConnection) -> None:
-    """Ingest tournament images with rate limiting."""
+    """Ingest tournament images (paced by the "image" rate-limit bucket)."""
     try:
         # Get all tournaments from database to fetch their images
         cursor = conn.cursor()
@@ -1543,25 +2536,10 @@ def ingest_tournament_images(conn: PGConnection) -> None:
         
         for tournament_id, tournament_slug in tournaments:
             try:
-                # Add rate limiting delay
-                time.sleep(IMAGE_DOWNLOAD_DELAY)
-                
                 data = api_get(f"/tournament/{tournament_id}/image")
                 if data.get("success") and data.get("data"):
                     image_data = data["data"]
-                    upsert(
-                        conn,
-                        UPSERT_IMAGES_TOURNAMENT,
-                        (
-                            tournament_id,
-                            image_data.get("url"),
-                            image_data.get("type"),
-                            image_data.get("width"),
-                            image_data.get("height"),
-                            image_data.get("size"),
-                            psycopg2.extras.Json(image_data),
-                        ),
-                    )
+                    upsert(conn, UPSERT_TOURNAMENT_IMAGE, (tournament_id, image_data.get("url"), datetime.now(timezone.utc)))
             except Exception as e:
                 logger.debug("Tournament image fetch failed for tournament %s: %s", tournament_id, e)
                 continue
@@ -1571,91 +2549,420 @@ def ingest_tournament_images(conn: PGConnection) -> None:
         logger.debug("Tournament images ingestion failed: %s", e)
 
 
+# ---------------
+# Enrichment pipeline
+# ---------------
+_DONE = object()
+
+
+def _fetch(what: str, fn: Any, *args: Any) -> Any:
+    """Run a fetch_* call on a worker thread; a failure is logged and gives None."""
+    try:
+        return fn(*args)
+    except Exception as e:
+        logger.debug("%s fetch failed: %s", what, e)
+        return None
+
+
+class EnrichmentPipeline:
+    """Fetch per-event and per-starter data concurrently, store it from one thread.
+
+    Stages, each with its own worker count:
+      events  - event details, lineups and team statistics for an event id
+      players - heatmap, transfer history and statistics for a starter
+      writer  - the thread calling run(); the only user of `conn`
+
+    Queues between stages are bounded, so a slow database blocks the fetch
+    workers (and a slow player stage the event workers) instead of piling
+    payloads up in memory. An event's result is queued before its player
+    jobs, so the lineup (and the player rows it creates) is always stored
+    before the heatmap/statistics rows that reference it.
+
+    With a SyncState, workers skip endpoints whose watermark is fresh and
+    the writer records every fetch, skipping the store when the payload is
+    unchanged. Per-starter data is only fetched alongside a lineup fetch,
+    so a fresh lineup also defers its players. `final_events` are the
+    events already in a final status; their watermarks never expire.
+
+    With a JobLedger, each starter is marked done (item "event:player") once
+    its rows are stored and the event itself once all of its starters are;
+    starters already done in a resumed run are not fetched again. An item
+    with a failed fetch or write is marked failed instead, so --resume
+    retries it.
+    """
+
+    def __init__(self, conn: PGConnection, event_workers: int = EVENT_WORKERS,
+                 player_workers: int = PLAYER_WORKERS, queue_size: int = PIPELINE_QUEUE_SIZE,
+                 sync: Optional[SyncState] = None, final_events: Optional[set] = None,
+                 ledger: Optional["JobLedger"] = None):
+        self.conn = conn
+        self.sync = sync
+        self.ledger = ledger
+        self._open: Dict[int, int] = {}  # event_id -> player results still to store
+        self._failed_events: set = set()  # open events with a failed write or fetch
+        self.final_events = final_events or set()
+        self.event_workers = max(1, event_workers)
+        self.player_workers = max(1, player_workers)
+        self._events: queue.Queue = queue.Queue(max(1, queue_size))
+        self._players: queue.Queue = queue.Queue(max(1, queue_size))
+        self._results: queue.Queue = queue.Queue(max(1, queue_size))
+        self._starters: Dict[int, set] = {}  # event_id -> starters whose lineup rows were stored
+        self._transfer_players: set = set()  # transfer history is per player, fetch it once per run
+        self._lock = threading.Lock()
+        self.counts = {"events": 0, "players": 0, "writes": 0, "failed": 0}
+        self.max_backlog = 0
+        self.seconds = 0.0
+
+    def run(self, event_ids: List[int]) -> Dict[str, Any]:
+        started = time.monotonic()
+        event_threads = [self._spawn(self._event_worker, f"event-{i}") for i in range(self.event_workers)]
+        player_threads = [self._spawn(self._player_worker, f"player-{i}") for i in range(self.player_workers)]
+        self._spawn(lambda: self._feed(event_ids, event_threads, player_threads), "feed")
+        try:
+            while True:
+                item = self._results.get()
+                if item is _DONE:
+                    break
+                self.max_backlog = max(self.max_backlog, self._results.qsize() + 1)
+                self._store(item)
+            commit(self.conn)  # watermarks of unchanged payloads
+        finally:
+            forget_event_teams(self.conn, event_ids)
+        self.seconds = time.monotonic() - started
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            self.counts,
+            max_backlog=self.max_backlog,
+            seconds=round(self.seconds, 1),
+            events_per_s=round(self.counts["events"] / self.seconds, 2) if self.seconds else None,
+        )
+
+    @staticmethod
+    def _spawn(target: Any, name: str) -> threading.Thread:
+        thread = threading.Thread(target=target, name=f"bootstrap-{name}", daemon=True)
+        thread.start()
+        return thread
+
+    def _feed(self, event_ids: List[int], event_threads: List[threading.Thread],
+              player_threads: List[threading.Thread]) -> None:
+        for eid in event_ids:
+            self._events.put(eid)
+        for _ in event_threads:
+            self._events.put(_DONE)
+        for thread in event_threads:
+            thread.join()
+        for _ in player_threads:
+            self._players.put(_DONE)
+        for thread in player_threads:
+            thread.join()
+        self._results.put(_DONE)
+
+    def _event_worker(self) -> None:
+        while True:
+            eid = self._events.get()
+            if eid is _DONE:
+                return
+            # A dead worker would leave _feed blocked on the bounded queue, so
+            # any failure becomes a result the writer accounts for
+            try:
+                item, pids = self._fetch_event(eid)
+            except Exception as e:
+                logger.warning("Event %s enrichment failed: %s", eid, e)
+                item, pids = ("event_failed", eid), []
+            self._results.put(item)
+            for pid in pids:
+                self._players.put((eid, pid))
+
+    def _fetch_event(self, eid: int) -> Tuple[Tuple[Any, ...], List[int]]:
+        details = lineups = team_stats = None
+        if not self._fresh("event_details", eid):
+            details = _fetch(f"Event {eid} details", fetch_event_details, eid)
+        if not self._fresh("lineups", eid):
+            lineups = _fetch(f"Event {eid} lineups", fetch_lineups, eid)
+        if FETCH_STATISTICS and not self._fresh("team_statistics", eid):
+            team_stats = _fetch(f"Event {eid} team statistics", fetch_team_statistics, eid)
+        pids = []
+        if FETCH_HEATMAPS or FETCH_TRANSFERS or FETCH_STATISTICS:
+            pids = [pid for pid in self._starter_ids(lineups or {})
+                    if not (self.ledger and self.ledger.is_done("enrichment", f"{eid}:{pid}"))]
+        return ("event", eid, details, lineups, team_stats, len(pids)), pids
+
+    def _player_worker(self) -> None:
+        while True:
+            job = self._players.get()
+            if job is _DONE:
+                return
+            eid, pid = job
+            try:
+                item = self._fetch_player(eid, pid)
+            except Exception as e:
+                logger.warning("Event %s player %s enrichment failed: %s", eid, pid, e)
+                item = ("player_failed", eid, pid)
+            self._results.put(item)
+
+    def _fetch_player(self, eid: int, pid: int) -> Tuple[Any, ...]:
+        heatmap = transfers = stats = None
+        if FETCH_HEATMAPS and not self._fresh("player_heatmap", f"{eid}:{pid}"):
+            heatmap = _fetch(f"Event {eid} player {pid} heatmap", fetch_player_heatmap, eid, pid)
+        if FETCH_TRANSFERS:
+            with self._lock:
+                first = pid not in self._transfer_players
+                self._transfer_players.add(pid)
+            if first and not self._fresh("player_transfers", pid):
+                transfers = _fetch(f"Player {pid} transfers", fetch_player_transfers, pid)
+        if FETCH_STATISTICS and not self._fresh("player_statistics", f"{eid}:{pid}"):
+            stats = _fetch(f"Event {eid} player {pid} statistics", fetch_player_statistics, eid, pid)
+        return ("player", eid, pid, heatmap, transfers, stats)
+
+    @staticmethod
+    def _starter_ids(lineups: Dict[str, Any]) -> List[int]:
+        ids: List[int] = []
+        for side_key in ("home_team", "away_team"):
+            starters = [int(p["player_id"]) for p in ((lineups.get(side_key) or {}).get("starting_eleven") or []) if p.get("player_id")]
+            ids.extend(starters[:MAX_STARTERS] if MAX_STARTERS else starters)
+        return ids
+
+    def _fresh(self, endpoint: str, entity_id: Any) -> bool:
+        return self.sync is not None and self.sync.fresh(endpoint, entity_id)
+
+    def _changed(self, endpoint: str, entity_id: Any, payload: Any, final: bool = False) -> bool:
+        return self.sync is None or self.sync.record(endpoint, entity_id, payload, final, conn=self.conn)
+
+    def _store(self, item: Tuple[Any, ...]) -> None:
+        if item[0] == "event_failed":
+            eid = item[1]
+            self.counts["events"] += 1
+            self.counts["failed"] += 1
+            self._open[eid] = 0
+            self._failed_events.add(eid)
+            self._item_done(eid)
+            return
+        if item[0] == "player_failed":
+            _, eid, pid = item
+            self.counts["players"] += 1
+            self.counts["failed"] += 1
+            self._open[eid] -= 1
+            self._mark(f"{eid}:{pid}", "failed")
+            self._failed_events.add(eid)
+            self._item_done(eid)
+            return
+        if item[0] == "event":
+            _, eid, details, lineups, team_stats, players = item
+            final = eid in self.final_events
+            self.counts["events"] += 1
+            self._open[eid] = players
+            ok = True
+            if details and self._changed("event_details", eid, details, final):
+                ok &= self._write(logging.WARNING, f"Event {eid} details", store_event_details, eid, details)[0]
+            if lineups:
+                if self._changed("lineups", eid, lineups, final):
+                    stored, starters = self._write(logging.WARNING, f"Event {eid} lineups", store_lineups, eid, lineups)
+                    ok &= stored
+                    if starters:
+                        self._starters[eid] = set(starters[0]) | set(starters[1])
+                else:
+                    self._starters[eid] = set(self._starter_ids(lineups))  # stored by an earlier run
+            if team_stats and self._changed("team_statistics", eid, team_stats, final):
+                ok &= self._write(logging.DEBUG, f"Event {eid} team statistics", store_team_statistics, eid, team_stats)[0]
+            if not ok:
+                self._failed_events.add(eid)
+            self._item_done(eid)
+            return
+        _, eid, pid, heatmap, transfers, stats = item
+        final = eid in self.final_events
+        self.counts["players"] += 1
+        self._open[eid] -= 1
+        ok = True
+        if pid in self._starters.get(eid, ()):  # else: lineup side not stored, the player row is missing
+            if heatmap and self._changed("player_heatmap", f"{eid}:{pid}", heatmap, final):
+                ok &= self._write(logging.DEBUG, f"Event {eid} player {pid} heatmap", store_player_heatmap, eid, pid, heatmap)[0]
+            if transfers and self._changed("player_transfers", pid, transfers):
+                ok &= self._write(logging.DEBUG, f"Player {pid} transfers", store_player_transfers, pid, transfers)[0]
+            if stats and self._changed("player_statistics", f"{eid}:{pid}", stats, final):
+                ok &= self._write(logging.DEBUG, f"Event {eid} player {pid} statistics", store_player_statistics, eid, pid, stats)[0]
+        self._mark(f"{eid}:{pid}", "done" if ok else "failed")
+        if not ok:
+            self._failed_events.add(eid)
+        self._item_done(eid)
+
+    def _item_done(self, eid: int) -> None:
+        if self._open[eid] == 0:
+            del self._open[eid]
+            forget_event_teams(self.conn, (eid,))
+            failed = eid in self._failed_events
+            self._failed_events.discard(eid)
+            self._mark(str(eid), "failed" if failed else "done")
+
+    def _mark(self, item: str, status: str) -> None:
+        """Record an item's outcome in the ledger, committed right away.
+
+        Items are only marked "done" once all of their writes committed; a
+        failed item is retried by --resume. Committing here keeps the mark
+        from being queued into (and rolled back with) the next item's write.
+        """
+        if self.ledger is None:
+            return
+        try:
+            self.ledger.mark("enrichment", item, status, commit_now=True)
+        except Exception as e:
+            logger.warning("Ledger mark of %s failed: %s", item, e)
+            self.conn.rollback()
+
+    def _write(self, level: int, what: str, store: Any, *args: Any) -> Tuple[bool, Any]:
+        """One store_* call in its own transaction, like the ingest_* wrappers; returns (committed, result)."""
+        try:
+            with writes_as(self.conn, store.__name__[len("store_"):]):
+                result = store(self.conn, *args)
+            commit(self.conn)
+            self.counts["writes"] += 1
+            return True, result
+        except Exception as e:
+            self.counts["failed"] += 1
+            logger.log(level, "%s store failed: %s", what, e)
+            self.conn.rollback()
+            return False, None
+
+
 # ---------------
 # Main flow
 # ---------------
 
-def main() -> None:
+def todays_event_ids(conn: PGConnection) -> List[int]:
+    """Ids of today's (UTC) events already in the database."""
+    start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    with conn.cursor() as cur:
+        cur.execute("SELECT id FROM events WHERE start_ts >= %s AND start_ts < %s ORDER BY id",
+                    (int(start.timestamp()), int(start.timestamp()) + 86400))
+        return [row[0] for row in cur.fetchall()]
+
+
+def stage_scheduled_events(conn: PGConnection, ledger: JobLedger) -> None:
+    ledger.add("enrichment", ingest_scheduled_events_for_today(conn))
+    commit(conn)
+
+
+def stage_enrichment(conn: PGConnection, ledger: JobLedger, sync: SyncState) -> None:
+    """Enrich every event (details, lineups, team statistics) and its starters
+    (heatmaps, transfers, statistics): concurrent fetch workers, one DB writer."""
+    event_ids = [int(item) for item in ledger.todo("enrichment") if ":" not in item]
+    if not event_ids and not ledger.is_done("scheduled_events"):
+        # scheduled_events was skipped (--from-stage): enrich today's events already stored
+        event_ids = todays_event_ids(conn)
+        ledger.add("enrichment", event_ids)
+    if MAX_EVENTS:
+        event_ids = event_ids[:MAX_EVENTS]
+    pipeline = EnrichmentPipeline(conn, sync=sync, final_events=final_event_ids(conn, event_ids), ledger=ledger)
+    logger.info("Enrichment pipeline: %s", pipeline.run(event_ids))
+
+
+def stage_tournament_seasons(conn: PGConnection, ledger: JobLedger) -> None:
+    # Get unique tournaments from processed events
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT DISTINCT t.unique_tournament_id, s.id as season_id
+            FROM events e
+            JOIN tournaments t ON e.tournament_id = t.id
+            JOIN seasons s ON e.season_id = s.id
+            WHERE t.unique_tournament_id IS NOT NULL
+            LIMIT 10
+        """)
+        tournament_seasons = cursor.fetchall()
+    ledger.add("tournament_seasons", [f"{ut}:{season}" for ut, season in tournament_seasons])
+    commit(conn)
+
+    for unique_tournament_id, season_id in tournament_seasons:
+        item = f"{unique_tournament_id}:{season_id}"
+        if ledger.is_done("tournament_seasons", item):
+            continue
+        ok = True
+        if FETCH_STANDINGS:
+            ok &= ingest_standings(conn, unique_tournament_id, season_id)
+        if FETCH_TOURNAMENT_FEATURES:
+            ok &= ingest_tournament_featured_events(conn, unique_tournament_id)
+            ok &= ingest_tournament_videos(conn, unique_tournament_id, season_id)
+        ledger.mark("tournament_seasons", item, "done" if ok else "failed")
+        commit(conn)
+
+
+def stage_suggestions(conn: PGConnection) -> None:
+    for query in ("football", "basketball", "tennis"):
+        ingest_suggestions(conn, query)
+
+
+def stage_live_counts(conn: PGConnection) -> None:
+    ingest_live_category_counts(conn)
+    ingest_event_count_by_sport(conn)
+
+
+def stage_images(conn: PGConnection) -> None:
+    # Images (with rate limiting)
+    logger.info("Starting image ingestion with rate limiting...")
+    ingest_player_images(conn)
+    ingest_team_images(conn)
+    ingest_tournament_images(conn)
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bootstrap and populate the local SofaScore Postgres database")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the latest unfinished run, skipping the stages and work items it finished")
+    parser.add_argument("--from-stage", choices=STAGES, help="skip every stage before this one")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
     logger.info("API base: %s", API_BASE)
     ensure_database_exists()
 
     with _connect(DB_NAME) as conn:
         conn.autocommit = False
         run_schema(conn)
-
-        # Seed reference
-        seed_sports(conn)
-
-        # Ingest categories and tournaments catalog
-        ingest_categories(conn)
-        ingest_tournaments_catalog(conn)
-
-        # Ingest today's scheduled events
-        event_ids = ingest_scheduled_events_for_today(conn)
-
-        # For each event, enrich and pull lineups+heatmaps+transfers for starters
-        # Cap events processed to avoid long first run
-        for eid in event_ids[:MAX_EVENTS]:
-            enrich_event_details(conn, eid)
-            starters_home, starters_away = ingest_lineups(conn, eid)
-
-            # Heatmaps and transfers for starters (limit to avoid overload)
-            for pid in starters_home[:MAX_STARTERS] + starters_away[:MAX_STARTERS]:
-                if FETCH_HEATMAPS:
-                    ingest_player_heatmap(conn, eid, pid)
-                if FETCH_TRANSFERS:
-                    ingest_player_transfers(conn, pid)
-                    time.sleep(0.05)
-                # Ingest player statistics for each player
-                if FETCH_STATISTICS:
-                    ingest_player_statistics(conn, eid, pid)
-            
-            # Ingest team statistics for the event (outside player loop)
-            if FETCH_STATISTICS:
-                ingest_team_statistics(conn, eid)
-        
-        # Ingest tournament-level data
+        wal_start = _wal_lsn(conn)
+        sync = SyncState(conn)
+        if sync.enabled:
+            logger.info("Incremental mode: skipping entities with fresh sync_state watermarks")
+        ledger = JobLedger(conn, resume=args.resume, from_stage=args.from_stage)
+
+        ledger.run_stage("sports", seed_sports, conn)
+        ledger.run_stage("categories", ingest_categories, conn, sync)
+        ledger.run_stage("tournaments", ingest_tournaments_catalog, conn, sync)
+        ledger.run_stage("scheduled_events", stage_scheduled_events, conn, ledger)
+        ledger.run_stage("enrichment", stage_enrichment, conn, ledger, sync)
         if FETCH_STANDINGS or FETCH_TOURNAMENT_FEATURES:
-            # Get unique tournaments from processed events
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT t.unique_tournament_id, s.id as season_id
-                FROM events e
-                JOIN tournaments t ON e.tournament_id = t.id
-                JOIN seasons s ON e.season_id = s.id
-                WHERE t.unique_tournament_id IS NOT NULL
-                LIMIT 10
-            """)
-            tournament_seasons = cursor.fetchall()
-            
-            for unique_tournament_id, season_id in tournament_seasons:
-                if FETCH_STANDINGS:
-                    ingest_standings(conn, unique_tournament_id, season_id)
-                if FETCH_TOURNAMENT_FEATURES:
-                    ingest_tournament_featured_events(conn, unique_tournament_id)
-                    ingest_tournament_videos(conn, unique_tournament_id)
-        
-        # Ingest trending and suggestion data
+            ledger.run_stage("tournament_seasons", stage_tournament_seasons, conn, ledger)
         if FETCH_TRENDING:
-            ingest_trending_players(conn)
-        
+            ledger.run_stage("trending", ingest_trending_players, conn)
         if FETCH_SUGGESTIONS:
-            ingest_suggestions(conn, "football")
-            ingest_suggestions(conn, "basketball")
-            ingest_suggestions(conn, "tennis")
-        
-        # Ingest live counts and event counts
+            ledger.run_stage("suggestions", stage_suggestions, conn)
         if FETCH_LIVE_COUNTS:
-            ingest_live_category_counts(conn)
-            ingest_event_count_by_sport(conn)
-        
-        # Ingest images (with rate limiting)
+            ledger.run_stage("live_counts", stage_live_counts, conn)
         if FETCH_IMAGES:
-            logger.info("Starting image ingestion with rate limiting...")
-            ingest_player_images(conn)
-            ingest_team_images(conn)
-            ingest_tournament_images(conn)
-
+            ledger.run_stage("images", stage_images, conn)
+
+        ledger.finish()
+        publish_changes(conn)
+        wal_end = _wal_lsn(conn)
+
+    ledger.log_summary()
+    writer = getattr(conn, "writer", None)
+    if writer is not None:
+        logger.info("DB writes: %s", writer.stats())
+        for label, counts in writer.labels.items():
+            logger.info("  %s: %d rows changed of %d touched", label, counts["changed"], counts["touched"])
+        logger.info("Reference row cache: %s", conn.row_cache.stats())
+    if getattr(conn, "changes", None) is not None:
+        logger.info("Change notifications on %s: %s", NOTIFY_CHANNEL, conn.changes.stats())
+    if wal_start and wal_end:
+        logger.info("WAL generated during the run (cluster-wide): %.1f MiB", _wal_bytes(conn, wal_start, wal_end) / (1024 * 1024))
+    logger.info("Sync: %s", sync.stats())
+    stats = RATE_LIMITER.stats()
+    logger.info("API requests: %d, throttled: %d, retries: %d",
+                stats["requests"], stats["throttled"], RETRY_POLICY.retries)
+    for name, bucket in stats["buckets"].items():
+        logger.info("  %s: %s", name, bucket)
     logger.info("Bootstrap completed successfully")
 
 
@@ -1663,7 +2970,7 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        logger.warning("Interrupted by user")
+        logger.warning("Interrupted by user; run again with --resume to continue")
         sys.exit(130)
     except Exception as exc:
         logger.exception("Fatal error: %s", exc)
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Keep live matches fresh in the database built by bootstrap_sofascore_db.py.
+
+Usage:
+  # Same DB / API environment variables as the bootstrap
+  python live_updater.py
+  python live_updater.py --workers 32
+
+Runs until interrupted. Every LIVE_DISCOVERY_INTERVAL seconds the events
+table is scanned for matches in progress (status_type = 'inprogress') and
+matches about to kick off; today's schedule is re-ingested every
+LIVE_SCHEDULE_INTERVAL seconds so that status changes made upstream
+(kickoffs, postponements) show up in that scan. Matches already tracked
+keep the status and scores their own polls wrote.
+
+Each tracked match has its own next-poll time, chosen from its state:
+- LIVE_FAST_INTERVAL right at kickoff, in the first minutes and in the
+  closing minutes of the second half / extra time, and during penalties
+- LIVE_SLOW_INTERVAL at half-time and other breaks
+- LIVE_INTERVAL otherwise
+
+A poll fetches the event details; incidents are fetched too when the
+score or status moved, or when the last incidents fetch is older than
+LIVE_INCIDENTS_INTERVAL. Fetch workers only talk to the API; the main
+thread is the only DB writer. It remembers what it last wrote per match
+and only sends scores, status and incidents that changed (the statements
+are also guarded with IS DISTINCT FROM). Incidents missing from a fetch
+(e.g. a goal cancelled by VAR) are deleted. Matches are dropped once they
+reach a final status, or are still not started STALE_AFTER_SECONDS after
+their kickoff. What changed is announced through the bootstrap's
+ChangeFeed (Postgres NOTIFY / Redis), coalesced per match.
+
+All requests go through the bootstrap's API rate limiter, so the number of
+matches one process can follow is bounded by BOOTSTRAP_API_RATE rather than
+by the number of workers: 300 matches at a 30s interval is ~10 requests/s.
+
+Configuration via environment variables (in addition to the bootstrap's)
+- LIVE_WORKERS (default: 16) — concurrent API fetches
+- LIVE_FAST_INTERVAL (default: 10), LIVE_INTERVAL (default: 30),
+  LIVE_SLOW_INTERVAL (default: 90) — poll intervals in seconds
+- LIVE_CLOSING_MINUTES (default: 10) — length of the closing-minutes window
+- LIVE_INCIDENTS_INTERVAL (default: 60) — max age of a match's incidents
+- LIVE_DISCOVERY_INTERVAL (default: 60), LIVE_SCHEDULE_INTERVAL (default: 600)
+- LIVE_REPORT_INTERVAL (default: 300) — seconds between progress log lines
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import os
+import sys
+import time
+import queue
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import bootstrap_sofascore_db as bs
+from bootstrap_sofascore_db import PGConnection
+
+LIVE_WORKERS = int(os.environ.get("LIVE_WORKERS", "16"))
+LIVE_FAST_INTERVAL = float(os.environ.get("LIVE_FAST_INTERVAL", "10"))
+LIVE_INTERVAL = float(os.environ.get("LIVE_INTERVAL", "30"))
+LIVE_SLOW_INTERVAL = float(os.environ.get("LIVE_SLOW_INTERVAL", "90"))
+LIVE_CLOSING_MINUTES = int(os.environ.get("LIVE_CLOSING_MINUTES", "10"))
+LIVE_INCIDENTS_INTERVAL = float(os.environ.get("LIVE_INCIDENTS_INTERVAL", "60"))
+LIVE_DISCOVERY_INTERVAL = float(os.environ.get("LIVE_DISCOVERY_INTERVAL", "60"))
+LIVE_SCHEDULE_INTERVAL = float(os.environ.get("LIVE_SCHEDULE_INTERVAL", "600"))
+LIVE_REPORT_INTERVAL = float(os.environ.get("LIVE_REPORT_INTERVAL", "300"))
+
+# First minutes after kickoff are polled fast; a match still "notstarted" this long
+# after its scheduled kickoff is treated as delayed and polled slowly
+KICKOFF_FAST_SECONDS = 5 * 60
+KICKOFF_GRACE_SECONDS = 15 * 60
+# Not-started matches older than this are left alone (postponed without an update)
+STALE_AFTER_SECONDS = 6 * 3600
+
+# SofaScore football status codes
+FIRST_HALF = 6
+BREAK_CODES = (31, 32, 33, 34)  # half-time, awaiting extra time, extra-time half-time, awaiting penalties
+CLOSING_CODES = (7, 41, 42)  # second half, first/second half of extra time
+PENALTIES = 50
+DROP_STATUS_TYPES = bs.FINAL_STATUS_TYPES + ("postponed",)
+
+logger = logging.getLogger("live")
+
+_DONE = object()
+
+DISCOVER_SQL = (
+    "SELECT e.id, e.status_code, e.status_desc, e.status_type, e.winner_code, e.start_ts, "
+    "s.home_current, s.away_current, s.home_display, s.away_display, s.home_p1, s.away_p1, s.home_p2, s.away_p2, "
+    "s.home_normaltime, s.away_normaltime, s.home_pen, s.away_pen "
+    "FROM events e LEFT JOIN event_scores s ON s.event_id = e.id "
+    "WHERE e.status_type = 'inprogress' OR (e.status_type = 'notstarted' AND e.start_ts BETWEEN %s AND %s)"
+)
+
+
+def poll_interval(event: Dict[str, Any], now: float) -> Optional[float]:
+    """Seconds until the next poll of a match, or None when it no longer needs polling."""
+    status = event.get("status") or {}
+    code, status_type = status.get("code"), status.get("type")
+    start = event.get("startTimestamp") or now
+    if status_type in DROP_STATUS_TYPES:
+        return None
+    if status_type == "notstarted":
+        if now < start:
+            if start - now > LIVE_INTERVAL:
+                return None  # kickoff moved; discovery picks it up again
+            return max(LIVE_FAST_INTERVAL, start - now)
+        if now - start > STALE_AFTER_SECONDS:
+            return None  # postponed without an update; discovery skips it too
+        return LIVE_FAST_INTERVAL if now - start < KICKOFF_GRACE_SECONDS else LIVE_SLOW_INTERVAL
+    if status_type != "inprogress":
+        return LIVE_SLOW_INTERVAL  # interrupted, or a type we do not know
+    if code in BREAK_CODES:
+        return LIVE_SLOW_INTERVAL
+    if code == PENALTIES:
+        return LIVE_FAST_INTERVAL
+    clock = event.get("time") or {}
+    period_start = clock.get("currentPeriodStartTimestamp")
+    if not period_start:
+        return LIVE_INTERVAL
+    # Match clock in seconds: offset of the current period plus time played in it
+    elapsed = (clock.get("initial") or 0) + max(0, now - period_start)
+    if code == FIRST_HALF and elapsed < KICKOFF_FAST_SECONDS:
+        return LIVE_FAST_INTERVAL
+    period_end = clock.get("max")
+    if code in CLOSING_CODES and period_end and elapsed >= period_end - LIVE_CLOSING_MINUTES * 60:
+        return LIVE_FAST_INTERVAL
+    return LIVE_INTERVAL
+
+
+def _signature(event_id: int, event: Dict[str, Any]) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    return bs.event_scores_row(event_id, event), bs.event_status_row(event_id, event)
+
+
+class _Match:
+    """What the writer last stored for one tracked match, plus its poll schedule."""
+
+    __slots__ = ("event_id", "due", "in_flight", "scores", "status", "incidents", "incidents_at")
+
+    def __init__(self, event_id: int, scores: Optional[Tuple[Any, ...]] = None,
+                 status: Optional[Tuple[Any, ...]] = None):
+        self.event_id = event_id
+        self.due = 0.0
+        self.in_flight = False
+        self.scores = scores
+        self.status = status
+        self.incidents: Dict[str, str] = {}  # incident key -> content hash
+        self.incidents_at = 0.0
+
+
+class LiveUpdater:
+    """Polls tracked matches on their own schedules; one writer, `workers` fetch threads.
+
+    run() owns the connection: it discovers matches, hands due ones to the
+    workers through an unbounded job queue (a match is never in flight
+    twice, so it holds at most one job per match) and applies their results.
+    """
+
+    def __init__(self, conn: PGConnection, workers: int = LIVE_WORKERS):
+        self.conn = conn
+        self.workers = max(1, workers)
+        self._matches: Dict[int, _Match] = {}
+        self._due: List[Tuple[float, int]] = []  # (due, event_id); stale entries are skipped
+        self._jobs: "queue.Queue[Any]" = queue.Queue()
+        self._results: "queue.Queue[Any]" = queue.Queue()
+        self._next_discovery = 0.0
+        self._next_schedule = 0.0
+        self.polls = 0
+        self.errors = 0
+        self.score_writes = 0
+        self.status_writes = 0
+        self.incident_writes = 0
+        self.incident_deletes = 0
+        self.finished = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+
+    # -- main loop ---------------------------------------------------------
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        stop = stop or threading.Event()
+        threads = [threading.Thread(target=self._worker, name=f"live-fetch-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for t in threads:
+            t.start()
+        next_report = time.time() + LIVE_REPORT_INTERVAL
+        try:
+            while not stop.is_set():
+                now = time.time()
+                if now >= self._next_discovery:
+                    self.discover(now)
+                self._dispatch(now)
+                wait = min(1.0, self._due[0][0] - now) if self._due else 1.0
+                try:
+                    item = self._results.get(timeout=max(0.05, wait))
+                except queue.Empty:
+                    item = None
+                while item is not None:
+                    self._apply(*item)
+                    try:
+                        item = self._results.get_nowait()
+                    except queue.Empty:
+                        item = None
+                bs.publish_changes(self.conn, force=False)
+                if now >= next_report:
+                    self.log_report()
+                    next_report = now + LIVE_REPORT_INTERVAL
+        finally:
+            for _ in threads:
+                self._jobs.put(_DONE)
+            bs.publish_changes(self.conn)
+
+    def discover(self, now: float) -> None:
+        """Refresh today's schedule when due, then start tracking live and kicking-off matches."""
+        self._next_discovery = now + LIVE_DISCOVERY_INTERVAL
+        if now >= self._next_schedule:
+            self._next_schedule = now + LIVE_SCHEDULE_INTERVAL
+            try:
+                # The schedule snapshot may be older than our last poll: tracked matches keep their status and scores
+                with bs.writes_as(self.conn, "live_schedule"):
+                    event_ids = bs.ingest_scheduled_events(self.conn, datetime.now(timezone.utc).date(),
+                                                           keep_status=self._matches.keys())
+            except Exception as e:
+                self.conn.rollback()
+                logger.warning("Schedule refresh failed: %s", e)
+            else:
+                bs.forget_event_teams(self.conn, event_ids)  # the daemon never enriches; don't keep them
+        with self.conn.cursor() as cur:
+            cur.execute(DISCOVER_SQL, (int(now) - STALE_AFTER_SECONDS, int(now + LIVE_INTERVAL)))
+            rows = cur.fetchall()
+        self.conn.commit()
+        added = 0
+        for row in rows:
+            event_id = int(row[0])
+            if event_id in self._matches:
+                continue
+            status = tuple(row[1:6])
+            scores = (event_id,) + tuple(row[6:]) if any(v is not None for v in row[6:]) else None
+            match = self._matches[event_id] = _Match(event_id, scores, status + (event_id,) + status)
+            self._schedule(match, now)
+            added += 1
+        if added:
+            logger.info("Tracking %d new matches (%d live)", added, len(self._matches))
+
+    def _schedule(self, match: _Match, due: float) -> None:
+        match.due = due
+        heapq.heappush(self._due, (due, match.event_id))
+
+    def _dispatch(self, now: float) -> None:
+        while self._due and self._due[0][0] <= now:
+            due, event_id = heapq.heappop(self._due)
+            match = self._matches.get(event_id)
+            if match is None or match.in_flight or match.due != due:
+                continue
+            match.in_flight = True
+            lag = now - due
+            self.lag_total += lag
+            self.lag_max = max(self.lag_max, lag)
+            signature = (match.scores, match.status) if match.scores is not None else None
+            want_incidents = now - match.incidents_at >= LIVE_INCIDENTS_INTERVAL
+            self._jobs.put((event_id, signature, want_incidents))
+
+    # -- fetch side ----------------------------------------------------------
+
+    def _worker(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is _DONE:
+                return
+            event_id, signature, want_incidents = job
+            try:
+                event = bs.fetch_event_details(event_id)
+                incidents = None
+                if event and (want_incidents or _signature(event_id, event) != signature):
+                    incidents = bs.fetch_event_incidents(event_id)
+                self._results.put((event_id, event, incidents, None))
+            except Exception as e:
+                self._results.put((event_id, None, None, e))
+
+    # -- write side ----------------------------------------------------------
+
+    def _apply(self, event_id: int, event: Optional[Dict[str, Any]], incidents: Optional[List[Dict[str, Any]]],
+               error: Optional[BaseException]) -> None:
+        match = self._matches.get(event_id)
+        if match is None:
+            return
+        match.in_flight = False
+        self.polls += 1
+        now = time.time()
+        if error is not None or not event:
+            self.errors += 1
+            logger.debug("Event %s poll failed: %s", event_id, error or "no details")
+            self._schedule(match, now + LIVE_INTERVAL)
+            return
+
+        scores, status = _signature(event_id, event)
+        changed_incidents: Dict[str, str] = {}
+        removed_incidents = 0
+        try:
+            if scores != match.scores:
+                with bs.writes_as(self.conn, "live_scores"):
+                    bs.upsert(self.conn, bs.UPSERT_EVENT_SCORES, scores)
+            if status != match.status:
+                with bs.writes_as(self.conn, "live_status"):
+                    bs.upsert(self.conn, bs.UPDATE_EVENT_STATUS, status)
+            if incidents is not None:
+                with bs.writes_as(self.conn, "live_incidents"):
+                    for inc in incidents:
+                        key, digest = bs.incident_key(inc), bs._content_hash(inc)
+                        if match.incidents.get(key) != digest:
+                            bs.upsert(self.conn, bs.UPSERT_EVENT_INCIDENT, bs.incident_row(event_id, inc))
+                            changed_incidents[key] = digest
+                fetched = {bs.incident_key(inc) for inc in incidents}
+                # The first fetch after tracking starts also prunes rows stored before (the bootstrap, an earlier run)
+                if not match.incidents_at or not fetched.issuperset(match.incidents):
+                    with self.conn.cursor() as cur:
+                        cur.execute(bs.DELETE_EVENT_INCIDENTS_EXCEPT, (event_id, sorted(fetched)))
+                        removed_incidents = cur.rowcount
+                    changes = getattr(self.conn, "changes", None)
+                    if removed_incidents and changes is not None:
+                        changes.note_deleted("event_incidents", {"event_id": event_id}, ["incident_key"],
+                                             removed_incidents)
+            bs.commit(self.conn)
+        except Exception as e:
+            self.conn.rollback()
+            self.errors += 1
+            logger.warning("Event %s live write failed: %s", event_id, e)
+            self._schedule(match, now + LIVE_INTERVAL)
+            return
+
+        # Only remember what actually reached the database
+        if scores != match.scores:
+            self.score_writes += 1
+            match.scores = scores
+        if status != match.status:
+            self.status_writes += 1
+            match.status = status
+        if incidents is not None:
+            match.incidents_at = now
+            match.incidents = {key: digest for key, digest in match.incidents.items() if key in fetched}
+            match.incidents.update(changed_incidents)
+            self.incident_writes += len(changed_incidents)
+            self.incident_deletes += removed_incidents
+
+        interval = poll_interval(event, now)
+        if interval is None:
+            del self._matches[event_id]
+            self.finished += 1
+            logger.info("Event %s: %s, no longer tracked", event_id, (event.get("status") or {}).get("description"))
+            return
+        self._schedule(match, now + interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tracked": len(self._matches),
+            "polls": self.polls,
+            "errors": self.errors,
+            "score_writes": self.score_writes,
+            "status_writes": self.status_writes,
+            "incident_writes": self.incident_writes,
+            "incident_deletes": self.incident_deletes,
+            "finished": self.finished,
+            "avg_lag": round(self.lag_total / self.polls, 2) if self.polls else 0.0,
+            "max_lag": round(self.lag_max, 2),
+        }
+
+    def log_report(self) -> None:
+        logger.info("Live: %s", self.stats())
+        writer = getattr(self.conn, "writer", None)
+        if writer is not None:
+            logger.info("DB writes: %s", writer.stats())
+            for label, counts in writer.labels.items():
+                logger.info("  %s: %d rows changed of %d touched", label, counts["changed"], counts["touched"])
+        if getattr(self.conn, "changes", None) is not None:
+            logger.info("Change notifications on %s: %s", bs.NOTIFY_CHANNEL, self.conn.changes.stats())
+        limiter = bs.RATE_LIMITER.stats()
+        logger.info("API requests: %d, throttled: %d, retries: %d",
+                    limiter["requests"], limiter["throttled"], bs.RETRY_POLICY.retries)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Poll live SofaScore matches into Postgres")
+    parser.add_argument("--workers", type=int, default=LIVE_WORKERS, help="concurrent API fetches")
+    args = parser.parse_args(argv)
+
+    bs.ensure_database_exists()
+    conn = bs._connect(bs.DB_NAME)
+    try:
+        conn.autocommit = False
+        bs.run_schema(conn)
+        updater = LiveUpdater(conn, workers=args.workers)
+        try:
+            updater.run()
+        finally:
+            updater.log_report()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.warning("Interrupted by user")
+        sys.exit(130)
+    except Exception as exc:
+        logger.exception("Fatal error: %s", exc)
+        sys.exit(1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Load-test the legacy FastAPI server (src/legacy_backup/api_server.py) with the
+sofascore calls run inline on the event loop vs in the upstream thread pool.
+
+The sofascore functions behind the benchmarked routes are replaced by a fake
+upstream that blocks like `requests` does (time.sleep), so no network access
+is needed; BENCH_SLOW_SHARE of the calls take BENCH_SLOW_MS instead of
+BENCH_UPSTREAM_MS. The response cache is disabled so every request reaches
+the upstream. The app is served by uvicorn in a background thread and
+BENCH_CLIENTS threads issue keep-alive requests over a route mix; p50/p99
+latency and requests/sec are reported for both modes.
+
+Needs fastapi and uvicorn.
+
+Configuration via environment variables
+- BENCH_REQUESTS (default: 1000) — requests per mode
+- BENCH_CLIENTS (default: 50) — concurrent clients
+- BENCH_UPSTREAM_MS (default: 50) — fake upstream latency
+- BENCH_SLOW_MS (default: 1000), BENCH_SLOW_SHARE (default: 0.02) — slow calls
+- API_UPSTREAM_WORKERS, API_ROUTE_CONCURRENCY — pool settings under test
+"""
+from __future__ import annotations
+
+import http.client
+import os
+import pathlib
+import random
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src" / "legacy_backup"))
+
+os.environ["API_CACHE"] = "0"
+
+import uvicorn  # noqa: E402
+
+import api_server  # noqa: E402
+import sofascore  # noqa: E402
+from upstream_executor import UpstreamExecutor  # noqa: E402
+
+BENCH_REQUESTS = int(os.environ.get("BENCH_REQUESTS", "1000"))
+BENCH_CLIENTS = int(os.environ.get("BENCH_CLIENTS", "50"))
+BENCH_UPSTREAM_MS = float(os.environ.get("BENCH_UPSTREAM_MS", "50"))
+BENCH_SLOW_MS = float(os.environ.get("BENCH_SLOW_MS", "1000"))
+BENCH_SLOW_SHARE = float(os.environ.get("BENCH_SLOW_SHARE", "0.02"))
+
+ROUTES = [
+    "/football/event/details?event_id={i}",
+    "/football/event/lineups?event_id={i}",
+    "/football/tournament/standings?tournament_id=17&season_id={i}",
+    "/football/categories",
+]
+
+
+def _fake_upstream(*args):
+    slow = random.random() < BENCH_SLOW_SHARE
+    time.sleep((BENCH_SLOW_MS if slow else BENCH_UPSTREAM_MS) / 1000)
+    return {"args": list(args), "slow": slow}
+
+
+def _patch_upstream() -> None:
+    for name in ("get_event_details", "get_lineups", "get_tournament_standing", "get_football_categories"):
+        fake = lambda *args: _fake_upstream(*args)  # noqa: E731
+        fake.__name__ = name
+        setattr(sofascore, name, fake)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _client(port: int, paths: List[str]) -> List[float]:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    latencies = []
+    try:
+        for path in paths:
+            started = time.perf_counter()
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"{path}: HTTP {response.status}")
+            latencies.append(time.perf_counter() - started)
+    finally:
+        conn.close()
+    return latencies
+
+
+def _load(port: int) -> Dict[str, float]:
+    paths = [random.choice(ROUTES).format(i=i) for i in range(BENCH_REQUESTS)]
+    shares = [paths[c::BENCH_CLIENTS] for c in range(BENCH_CLIENTS)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=BENCH_CLIENTS) as pool:
+        latencies = sorted(lat for result in pool.map(_client, [port] * BENCH_CLIENTS, shares) for lat in result)
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "rps": len(latencies) / elapsed,
+    }
+
+
+def main() -> None:
+    _patch_upstream()
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(api_server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    print(f"requests={BENCH_REQUESTS} clients={BENCH_CLIENTS} upstream={BENCH_UPSTREAM_MS:g}ms "
+          f"slow={BENCH_SLOW_SHARE:.0%}@{BENCH_SLOW_MS:g}ms")
+    print(f"{'mode':<8} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9}")
+    results = {}
+    try:
+        for mode, executor in (("inline", UpstreamExecutor(workers=0)), ("pool", UpstreamExecutor())):
+            api_server.upstream = executor
+            results[mode] = r = _load(port)
+            print(f"{mode:<8} {r['p50']:>9.1f} {r['p99']:>9.1f} {r['rps']:>9.0f}")
+            executor.shutdown()
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+    print(f"speedup: {results['pool']['rps'] / results['inline']['rps']:.1f}x req/s, "
+          f"p99 {results['inline']['p99'] / results['pool']['p99']:.1f}x lower")
+
+
+if __name__ == "__main__":
+    main()
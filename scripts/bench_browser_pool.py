@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Measure nodriver fetch latency with a cold browser per call vs the warm
+browser pool (src/legacy_backup/browser_pool.py).
+
+A local http.server serves a static JSON document, so no network access is
+needed. "cold" uses a pool that recycles its browser after every fetch, so
+each call pays the Chromium launch like the old fetch_json_via_nodriver did
+(minus its fixed 3 s sleep); "pooled" keeps BENCH_BROWSERS browsers warm and
+is measured after one warm-up fetch per browser. BENCH_CLIENTS threads call
+fetch() concurrently; p50/p95 latency, fetches/sec and browser launches are
+reported for both modes.
+
+Needs nodriver and a Chromium/Chrome binary (see BROWSER_PATH).
+
+Configuration via environment variables
+- BENCH_FETCHES (default: 40) — fetches per mode
+- BENCH_CLIENTS (default: 2) — concurrent callers
+- BENCH_BROWSERS (default: 2) — pool size for the pooled mode
+- BENCH_PAYLOAD_KB (default: 64) — size of the served JSON document
+"""
+from __future__ import annotations
+
+import http.server
+import json
+import os
+import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src" / "legacy_backup"))
+
+from browser_pool import BrowserPool  # noqa: E402
+
+BENCH_FETCHES = int(os.environ.get("BENCH_FETCHES", "40"))
+BENCH_CLIENTS = int(os.environ.get("BENCH_CLIENTS", "2"))
+BENCH_BROWSERS = int(os.environ.get("BENCH_BROWSERS", "2"))
+BENCH_PAYLOAD_KB = int(os.environ.get("BENCH_PAYLOAD_KB", "64"))
+
+
+def _payload() -> bytes:
+    rows = []
+    while len(json.dumps(rows)) < BENCH_PAYLOAD_KB * 1024:
+        rows.append({"id": len(rows), "name": f"Team {len(rows)}", "slug": f"team-{len(rows)}"})
+    return json.dumps({"teams": rows}).encode("utf-8")
+
+
+def _serve(body: bytes) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _timed(pool: BrowserPool, url: str, expected: dict) -> float:
+    started = time.perf_counter()
+    content = pool.fetch(url)
+    elapsed = time.perf_counter() - started
+    if json.loads(content) != expected:
+        raise RuntimeError("fetched document does not match the served one")
+    return elapsed
+
+
+def _run(pool: BrowserPool, url: str, expected: dict) -> Dict[str, float]:
+    urls = [f"{url}?i={i}" for i in range(BENCH_FETCHES)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=BENCH_CLIENTS) as callers:
+        latencies: List[float] = sorted(callers.map(lambda u: _timed(pool, u, expected), urls))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        "rate": len(latencies) / elapsed,
+    }
+
+
+def main() -> None:
+    body = _payload()
+    expected = json.loads(body)
+    server = _serve(body)
+    url = f"http://127.0.0.1:{server.server_address[1]}/data.json"
+
+    print(f"fetches={BENCH_FETCHES} clients={BENCH_CLIENTS} browsers={BENCH_BROWSERS} payload={len(body) // 1024}KB")
+    print(f"{'mode':<8} {'p50 ms':>9} {'p95 ms':>9} {'fetch/s':>9} {'launches':>9}")
+    results = {}
+    try:
+        for mode, pool in (("cold", BrowserPool(size=BENCH_CLIENTS, max_uses=1)),
+                           ("pooled", BrowserPool(size=BENCH_BROWSERS))):
+            if mode == "pooled":
+                with ThreadPoolExecutor(max_workers=BENCH_BROWSERS) as warmup:
+                    list(warmup.map(lambda i: pool.fetch(f"{url}?warmup={i}"), range(BENCH_BROWSERS)))
+            launches = pool.counts["launches"]
+            try:
+                results[mode] = r = _run(pool, url, expected)
+            finally:
+                pool.shutdown()
+            print(f"{mode:<8} {r['p50']:>9.1f} {r['p95']:>9.1f} {r['rate']:>9.1f} "
+                  f"{pool.counts['launches'] - launches:>9}")
+    finally:
+        server.shutdown()
+    print(f"speedup: {results['cold']['p50'] / results['pooled']['p50']:.1f}x lower p50, "
+          f"{results['pooled']['rate'] / results['cold']['rate']:.1f}x fetches/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark conditional requests (ETag / 304 revalidation) in SofaScoreAPI.
+
+Serves the recorded scheduled-events snapshot from a local stub server
+that emits ETags and answers matching If-None-Match requests with 304.
+Compares fetching with the cache disabled (full download + json.loads
+every time) against a cache whose TTL is 0, so every call revalidates
+and reuses the cached parsed object on 304.
+
+Configuration via environment variables
+- BENCH_REQUESTS (default: 200) — requests per scenario
+"""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sys
+import time
+from datetime import date
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from sofascore_api import SofaScoreAPI  # noqa: E402
+from sofascore_cache import ResponseCache, TTLPolicy  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+BENCH_REQUESTS = int(os.environ.get("BENCH_REQUESTS", "200"))
+
+
+def _payload():
+    for p in sorted((ROOT / "data" / "api_snapshots").glob("*/events/scheduled_*.json")):
+        return json.loads(p.read_text(encoding="utf-8"))
+    return {"events": [{"id": i, "slug": f"event-{i}"} for i in range(5000)]}
+
+
+def _run(server: StubServer, cache) -> dict:
+    api = SofaScoreAPI(cache=cache, rate_limiter=False)
+    api.BASE_URL = server.base_url
+    day = date(2025, 8, 20)
+    statuses: dict = {}
+    bytes_before = server.httpd.bytes_sent
+    started = time.perf_counter()
+    try:
+        for _ in range(BENCH_REQUESTS):
+            status = api.fetch(f"/sport/football/scheduled-events/{day.isoformat()}").cache_status
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        api.close()
+    elapsed = time.perf_counter() - started
+    return {
+        "req_s": BENCH_REQUESTS / elapsed,
+        "kb_per_req": (server.httpd.bytes_sent - bytes_before) / 1024 / BENCH_REQUESTS,
+        "statuses": statuses,
+    }
+
+
+def main() -> None:
+    payload = _payload()
+    with StubServer(payload, etag=True) as server:
+        print(f"stub={server.base_url} payload={len(server.httpd.body) / 1024:.0f} KiB requests={BENCH_REQUESTS}")
+        always_revalidate = ResponseCache(policy=TTLPolicy(rules=(), default_ttl=0))
+        for name, cache in (("no cache", False), ("revalidate", always_revalidate)):
+            r = _run(server, cache)
+            print(f"{name:>12}: {r['req_s']:8.1f} req/s  {r['kb_per_req']:8.1f} KiB/req (gzip)  {r['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark raw dicts vs sofascore_models on a recorded scheduled-events snapshot.
+
+Memory (tracemalloc, bytes still held once the JSON document is dropped):
+- dicts: the list of raw event dicts
+- models: Event objects (nested models included)
+
+Throughput: build the collection and read a typical set of fields
+(teams, scores, tournament, season) from every event.
+
+Configuration via environment variables
+- BENCH_SNAPSHOT (default: newest data/api_snapshots/*/events/scheduled_*.json)
+- BENCH_ROUNDS (default: 50) — repetitions for the throughput run
+- BENCH_COPIES (default: 10) — the day's events are replicated this many
+  times to simulate a busy match day
+"""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import pathlib
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sofascore_models import Event  # noqa: E402
+
+BENCH_ROUNDS = int(os.environ.get("BENCH_ROUNDS", "50"))
+BENCH_COPIES = int(os.environ.get("BENCH_COPIES", "10"))
+
+
+def _snapshot() -> pathlib.Path:
+    if os.environ.get("BENCH_SNAPSHOT"):
+        return pathlib.Path(os.environ["BENCH_SNAPSHOT"])
+    paths = sorted((ROOT / "data" / "api_snapshots").glob("*/events/scheduled_*.json"))
+    if not paths:
+        sys.exit("No scheduled-events snapshot found; set BENCH_SNAPSHOT")
+    return paths[-1]
+
+
+def _events(raw: bytes) -> List[Dict[str, Any]]:
+    doc = json.loads(raw)
+    if "events" not in doc:  # {"success": ..., "data": {"events": [...]}} from the proxy API
+        doc = doc.get("data") or {}
+    return doc.get("events") or []
+
+
+def _load_dicts(raw: bytes) -> List[Dict[str, Any]]:
+    return [e for _ in range(BENCH_COPIES) for e in _events(raw)]
+
+
+def _load_models(raw: bytes) -> List[Event]:
+    return [Event(e) for _ in range(BENCH_COPIES) for e in _events(raw)]
+
+
+def _touch_dicts(events: List[Dict[str, Any]]) -> int:
+    n = 0
+    for e in events:
+        home = e.get("homeTeam") or {}
+        away = e.get("awayTeam") or {}
+        ut = (e.get("tournament") or {}).get("uniqueTournament") or {}
+        if home.get("name") and away.get("name") and ut.get("id") is not None:
+            n += (e.get("homeScore") or {}).get("current") or 0
+            n += (e.get("awayScore") or {}).get("current") or 0
+            n += (e.get("season") or {}).get("id") or 0
+    return n
+
+
+def _touch_models(events: List[Event]) -> int:
+    n = 0
+    for e in events:
+        home, away = e.home_team, e.away_team
+        ut = e.tournament.unique_tournament if e.tournament else None
+        if home and away and home.name and away.name and ut and ut.id is not None:
+            n += (e.home_score.current if e.home_score else 0) or 0
+            n += (e.away_score.current if e.away_score else 0) or 0
+            n += (e.season.id if e.season else 0) or 0
+    return n
+
+
+def _retained(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def _throughput(load: Callable[[bytes], List[Any]], touch: Callable[[List[Any]], int], raw: bytes) -> float:
+    started = time.perf_counter()
+    count = 0
+    for _ in range(BENCH_ROUNDS):
+        events = load(raw)
+        touch(events)
+        count += len(events)
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    path = _snapshot()
+    raw = path.read_bytes()
+    n = len(_load_dicts(raw))
+    print(f"snapshot={path.relative_to(ROOT)} events={n} ({BENCH_COPIES} copies) rounds={BENCH_ROUNDS}")
+
+    memory = [
+        ("dicts", _retained(lambda: _load_dicts(raw))),
+        ("models", _retained(lambda: _load_models(raw))),
+    ]
+    base = memory[0][1]
+    print(f"{'memory':<24} {'KiB':>10} {'bytes/event':>12} {'vs dicts':>9}")
+    for name, size in memory:
+        print(f"{name:<24} {size / 1024:>10.0f} {size / n:>12.0f} {size / base:>8.2f}x")
+
+    dicts_rate = _throughput(_load_dicts, _touch_dicts, raw)
+    models_rate = _throughput(_load_models, _touch_models, raw)
+    print(f"{'throughput':<24} {'events/s':>10}")
+    print(f"{'dicts':<24} {dicts_rate:>10.0f}")
+    print(f"{'models':<24} {models_rate:>10.0f} ({models_rate / dicts_rate:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
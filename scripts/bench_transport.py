@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark SofaScoreAPI transports against a local stub server.
+
+Compares requests/sec of the original one-connection-per-call model
+(UrllibTransport) with the keep-alive PooledTransport, both sequentially
+and from a thread pool.
+
+Configuration via environment variables
+- BENCH_REQUESTS (default: 2000) — requests per scenario
+- BENCH_THREADS (default: 8) — worker threads for the concurrent scenario
+- BENCH_POOL_SIZE (default: 8) — PooledTransport max_per_host
+"""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from sofascore_api import SofaScoreAPI  # noqa: E402
+from sofascore_transport import PooledTransport, Transport, UrllibTransport  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+BENCH_REQUESTS = int(os.environ.get("BENCH_REQUESTS", "2000"))
+BENCH_THREADS = int(os.environ.get("BENCH_THREADS", "8"))
+BENCH_POOL_SIZE = int(os.environ.get("BENCH_POOL_SIZE", "8"))
+
+
+def _payload():
+    """Use a recorded event-details snapshot when available."""
+    for p in sorted((ROOT / "data" / "api_snapshots").glob("*/events/*/details.json")):
+        return json.loads(p.read_text(encoding="utf-8"))
+    return {"event": {"id": 1, "slug": "stub"}}
+
+
+def _run(base_url: str, transport: Transport, threads: int) -> float:
+    api = SofaScoreAPI(transport=transport, cache=False, rate_limiter=False)
+    api.BASE_URL = base_url
+    started = time.perf_counter()
+    try:
+        if threads <= 1:
+            for i in range(BENCH_REQUESTS):
+                api.get_event(i)
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(api.get_event, range(BENCH_REQUESTS)))
+    finally:
+        api.close()
+    return BENCH_REQUESTS / (time.perf_counter() - started)
+
+
+def main() -> None:
+    with StubServer(_payload()) as server:
+        print(f"stub={server.base_url} requests={BENCH_REQUESTS} threads={BENCH_THREADS}")
+        results = []
+        for threads in (1, BENCH_THREADS):
+            per_call = _run(server.base_url, UrllibTransport(), threads)
+            pooled = _run(server.base_url, PooledTransport(max_per_host=BENCH_POOL_SIZE), threads)
+            results.append((threads, per_call, pooled))
+        print(f"{'threads':>8} {'per-call req/s':>16} {'pooled req/s':>14} {'speedup':>8}")
+        for threads, per_call, pooled in results:
+            print(f"{threads:>8} {per_call:>16.0f} {pooled:>14.0f} {pooled / per_call:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
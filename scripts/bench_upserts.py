@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark bootstrap upserts on a local Postgres: one INSERT ... ON CONFLICT
+per row (plain connection) vs the batched write path (BatchingConnection).
+
+The workload replays a recorded scheduled-events snapshot through the
+bootstrap's own helpers: countries and teams (upsert_team_from_obj), events,
+event_teams and event_scores, plus BENCH_PLAYERS players per event with
+BENCH_POINTS heatmap points each. Tables are truncated before every run.
+
+Uses the bootstrap's connection settings (PGHOST, PGPORT, PGUSER,
+PGPASSWORD or DATABASE_URL). Needs psycopg2 and a database you can write to.
+
+Configuration via environment variables
+- BENCH_DB (default: sofascore_bench) — database to use (created if missing)
+- BENCH_SNAPSHOT (default: newest data/api_snapshots/*/events/scheduled_*.json)
+- BENCH_COPIES (default: 5) — replay the day this many times with shifted ids
+- BENCH_PLAYERS (default: 4) — players per event
+- BENCH_POINTS (default: 40) — heatmap points per player
+- BOOTSTRAP_BATCH_SIZE (default: 1000) — rows per multi-row INSERT
+"""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sys
+import time
+from typing import Any, Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ["DB_NAME"] = os.environ.get("BENCH_DB", "sofascore_bench")
+
+import psycopg2.extras  # noqa: E402
+
+import bootstrap_sofascore_db as bs  # noqa: E402
+
+BENCH_COPIES = int(os.environ.get("BENCH_COPIES", "5"))
+BENCH_PLAYERS = int(os.environ.get("BENCH_PLAYERS", "4"))
+BENCH_POINTS = int(os.environ.get("BENCH_POINTS", "40"))
+
+TABLES = ("player_heatmaps", "event_scores", "event_teams", "events", "players", "teams", "countries")
+
+
+def _events() -> List[Dict[str, Any]]:
+    if os.environ.get("BENCH_SNAPSHOT"):
+        path = pathlib.Path(os.environ["BENCH_SNAPSHOT"])
+    else:
+        paths = sorted((ROOT / "data" / "api_snapshots").glob("*/events/scheduled_*.json"))
+        if not paths:
+            sys.exit("No scheduled-events snapshot found; set BENCH_SNAPSHOT")
+        path = paths[-1]
+    doc = json.loads(path.read_text(encoding="utf-8"))
+    if "events" not in doc:
+        doc = doc.get("data") or {}
+    return doc.get("events") or []
+
+
+def _workload(conn: Any, events: List[Dict[str, Any]]) -> None:
+    for copy in range(BENCH_COPIES):
+        offset = copy * 100_000_000
+        for e in events:
+            event_id = e["id"] + offset
+            home = e.get("homeTeam") or {}
+            away = e.get("awayTeam") or {}
+            for team in (home, away):
+                if team:
+                    bs.upsert_team_from_obj(conn, team)
+            status = e.get("status") or {}
+            bs.upsert(conn, bs.UPSERT_EVENT, (
+                event_id, e.get("slug"), None, None, None, None, status.get("code"), status.get("description"),
+                status.get("type"), e.get("winnerCode"), e.get("startTimestamp"), e.get("finalResultOnly"),
+                None, None, e.get("hasEventPlayerStatistics"), e.get("hasEventPlayerHeatMap"),
+                psycopg2.extras.Json({"detailId": e.get("detailId")}),
+            ))
+            if home.get("id"):
+                bs.upsert(conn, bs.UPSERT_EVENT_TEAM, (event_id, home["id"], "home"))
+            if away.get("id"):
+                bs.upsert(conn, bs.UPSERT_EVENT_TEAM, (event_id, away["id"], "away"))
+            hs, as_ = e.get("homeScore") or {}, e.get("awayScore") or {}
+            bs.upsert(conn, bs.UPSERT_EVENT_SCORES, (
+                event_id, hs.get("current"), as_.get("current"), hs.get("display"), as_.get("display"),
+                hs.get("period1"), as_.get("period1"), hs.get("period2"), as_.get("period2"),
+                hs.get("normaltime"), as_.get("normaltime"), hs.get("penalties"), as_.get("penalties"),
+            ))
+            for p in range(BENCH_PLAYERS):
+                player_id = event_id * 10 + p
+                bs.upsert(conn, bs.UPSERT_PLAYER, (
+                    player_id, f"player-{player_id}", None, None, None, None, None, None, None, None,
+                    psycopg2.extras.Json({"source": "bench"}),
+                ))
+                for seq in range(BENCH_POINTS):
+                    bs.upsert(conn, bs.UPSERT_PLAYER_HEATMAP_POINT, (event_id, player_id, seq, seq % 100, (seq * 7) % 100))
+        bs.commit(conn)
+
+
+def _run(batched: bool, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    conn = bs._connect(bs.DB_NAME, batched=batched)
+    try:
+        bs.run_schema(conn)
+        with conn.cursor() as cur:
+            cur.execute(f"TRUNCATE {', '.join(TABLES)} CASCADE")
+        conn.commit()
+        started = time.perf_counter()
+        _workload(conn, events)
+        elapsed = time.perf_counter() - started
+        writer = getattr(conn, "writer", None)
+        return {"seconds": elapsed, "stats": writer.stats() if writer else None}
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    bs.ensure_database_exists()
+    events = _events()
+    print(f"db={bs.DB_NAME} events={len(events) * BENCH_COPIES} players/event={BENCH_PLAYERS} "
+          f"points/player={BENCH_POINTS} batch_size={bs.BATCH_SIZE}")
+    per_row = _run(False, events)
+    batched = _run(True, events)
+    rows = batched["stats"]["rows_in"]  # same workload: every upsert() call is one row
+    print(f"{'mode':<10} {'rows':>9} {'round trips':>12} {'seconds':>9} {'rows/s':>10}")
+    print(f"{'per-row':<10} {rows:>9} {rows:>12} {per_row['seconds']:>9.2f} {rows / per_row['seconds']:>10.0f}")
+    print(f"{'batched':<10} {rows:>9} {batched['stats']['round_trips']:>12} {batched['seconds']:>9.2f} "
+          f"{rows / batched['seconds']:>10.0f}")
+    print(f"speedup: {per_row['seconds'] / batched['seconds']:.1f}x "
+          f"({batched['stats']['deduped']} duplicate rows folded)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,9 @@ Configuration via environment variables
 - MAX_EVENTS (default: 6)
 - MAX_PLAYERS_PER_EVENT (default: 6)
 - QUERIES (default: football,basketball,tennis)
-- SLEEP_SECONDS (default: 0.2) — small delay between calls
+- SLEEP_SECONDS (default: 0.2) — minimum spacing between calls; sets the rate of the
+  shared adaptive rate limiter (backs off on 429/503 and honours Retry-After)
+- MAX_RETRIES (default: 4) — retries with jittered backoff for throttled/5xx/connection errors
 
 Safe to run repeatedly; each run creates a new timestamped snapshot folder.
 """
@@ -25,7 +27,6 @@ from __future__ import annotations
 
 import os
 import sys
-import time
 import json
 import pathlib
 import traceback
@@ -34,6 +35,11 @@ from typing import Any, Dict, List, Optional, Tuple, Set
 
 import requests
 
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sofascore_ratelimit import AdaptiveRateLimiter, RetryPolicy, send_with_retry  # noqa: E402
+
 # -----------------
 # Config
 # -----------------
@@ -42,12 +48,16 @@ REQUEST_TIMEOUT = int(os.environ.get("REQUEST_TIMEOUT", "20"))
 MAX_EVENTS = int(os.environ.get("MAX_EVENTS", "6"))
 MAX_PLAYERS_PER_EVENT = int(os.environ.get("MAX_PLAYERS_PER_EVENT", "6"))
 SLEEP_SECONDS = float(os.environ.get("SLEEP_SECONDS", "0.2"))
+MAX_RETRIES = int(os.environ.get("MAX_RETRIES", "4"))
 QUERIES = [q.strip() for q in os.environ.get("QUERIES", "football,basketball,tennis").split(",") if q.strip()]
 
 RUN_TS = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-OUT_ROOT = pathlib.Path(__file__).resolve().parents[1] / "data" / "api_snapshots" / RUN_TS
+OUT_ROOT = ROOT / "data" / "api_snapshots" / RUN_TS
 META_DIR = OUT_ROOT / "_meta"
 
+RATE_LIMITER = AdaptiveRateLimiter(rate=1.0 / SLEEP_SECONDS if SLEEP_SECONDS > 0 else 1000.0, burst=1)
+RETRY_POLICY = RetryPolicy(max_retries=MAX_RETRIES)
+
 # Track where we saved what
 INDEX: Dict[str, Any] = {
     "api_base": API_BASE,
@@ -85,7 +95,8 @@ def _record(endpoint: str, saved_file: str, note: Optional[str] = None) -> None:
 def _get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
     url = f"{API_BASE}{path}"
     try:
-        r = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        r = send_with_retry(lambda: requests.get(url, params=params, timeout=REQUEST_TIMEOUT), url,
+                            RATE_LIMITER, RETRY_POLICY, errors=(requests.ConnectionError, requests.Timeout))
         r.raise_for_status()
         try:
             return r.json()
@@ -93,9 +104,6 @@ def _get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
             return {"raw": r.text}
     except Exception as e:
         return {"error": str(e), "trace": traceback.format_exc(), "url": url, "params": params}
-    finally:
-        if SLEEP_SECONDS:
-            time.sleep(SLEEP_SECONDS)
 
 
 # -----------------
@@ -299,8 +307,11 @@ def main() -> None:
         INDEX["entities"][key] = uniq
 
     # Save index
+    INDEX["rate_limit"] = dict(RATE_LIMITER.stats(), retries=RETRY_POLICY.retries)
     idx_path = _save_json("_meta/index.json", INDEX)
     print(f"Snapshot complete. Root: {OUT_ROOT}\nIndex: {idx_path}")
+    print(f"Requests: {INDEX['rate_limit']['requests']}, throttled: {INDEX['rate_limit']['throttled']}, "
+          f"retries: {RETRY_POLICY.retries}")
 
 
 if __name__ == "__main__":
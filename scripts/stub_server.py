@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Local stub HTTP server used by the benchmark scripts in this folder.
+
+Serves a fixed JSON payload on every GET path over HTTP/1.1 keep-alive,
+gzip-encoded when the client asks for it. With etag=True responses carry
+an ETag and matching If-None-Match requests get 304 Not Modified. Runs in
+a background thread:
+
+    with StubServer(payload) as server:
+        print(server.base_url)
+
+Standalone: python scripts/stub_server.py [port]
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        server: "_Server" = self.server  # type: ignore[assignment]
+        if server.etag and self.headers.get("If-None-Match") == server.etag:
+            server.count(304, 0)
+            self.send_response(304)
+            self.send_header("ETag", server.etag)
+            self.end_headers()
+            return
+        body = server.body
+        headers = {"Content-Type": "application/json"}
+        if server.etag:
+            headers["ETag"] = server.etag
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = server.body_gzip
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(200)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        server.count(200, len(body))
+
+    def log_message(self, format: str, *args: Any) -> None:  # silence per-request logging
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    body: bytes = b"{}"
+    body_gzip: bytes = b""
+    etag: Optional[str] = None
+
+    def server_activate(self) -> None:
+        super().server_activate()
+        self._stats_lock = threading.Lock()
+        self.responses: Dict[int, int] = {}
+        self.bytes_sent = 0
+
+    def count(self, status: int, nbytes: int) -> None:
+        with self._stats_lock:
+            self.responses[status] = self.responses.get(status, 0) + 1
+            self.bytes_sent += nbytes
+
+
+class StubServer:
+    """Background stub server. `handler` may be a BaseHTTPRequestHandler subclass."""
+
+    def __init__(self, payload: Any = None, port: int = 0, handler: Optional[type] = None, etag: bool = False):
+        self.httpd = _Server(("127.0.0.1", port), handler or _Handler)
+        body = json.dumps(payload if payload is not None else {"ok": True}).encode()
+        self.httpd.body = body
+        self.httpd.body_gzip = gzip.compress(body)
+        if etag:
+            self.httpd.etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8099
+    server = StubServer(port=port)
+    print(f"Serving stub JSON on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -4,117 +4,252 @@ Unofficial API client for SofaScore sports data.
 No external dependencies - uses only built-in Python libraries.
 """
 
-import urllib.request
+import http.client
+import urllib.error
 import urllib.parse
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Union
 from datetime import date
 
+from sofascore_cache import (
+    CACHE_BYPASS, CACHE_HIT, CACHE_MISS, CACHE_REVALIDATED,
+    ApiResponse, CacheEntry, ResponseCache, SingleFlight, resolve_cache,
+)
+from sofascore_models import Event, Player, Team
+from sofascore_ratelimit import AdaptiveRateLimiter, RetryPolicy, resolve_rate_limiter, resolve_retry, send_with_retry
+from sofascore_stream import iter_json_array
+from sofascore_transport import PooledTransport, Response, StreamResponse, Transport
+
 
 class SofaScoreAPI:
     """Python wrapper for SofaScore API endpoints."""
     
     BASE_URL = "https://api.sofascore.com/api/v1"
     
-    def __init__(self):
+    def __init__(self, transport: Optional[Transport] = None, timeout: Optional[float] = 20.0,
+                 cache: Union[ResponseCache, bool, None] = True, single_flight: bool = True,
+                 rate_limiter: Union[AdaptiveRateLimiter, bool, None] = True,
+                 retry: Union[RetryPolicy, bool, None] = True):
+        """
+        transport: how requests are sent. Defaults to a PooledTransport
+            (persistent keep-alive connections); pass UrllibTransport() for
+            the old one-connection-per-call behaviour.
+        timeout: socket timeout in seconds for each request.
+        cache: ResponseCache to use, True for a default one, False/None to
+            disable caching. Every method also takes use_cache=False to
+            bypass the cache for a single call.
+        single_flight: collapse concurrent identical requests from several
+            threads into one upstream fetch (see self.inflight.stats()).
+        rate_limiter: AdaptiveRateLimiter pacing requests per host and
+            backing off on 429/503; True for a default one, False/None
+            to disable (see self.rate_limiter.stats()).
+        retry: RetryPolicy for throttled/5xx responses and connection
+            errors; True for the default, False/None for no retries.
+        """
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "application/json",
         }
-    
-    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request to API."""
+        self.transport = transport if transport is not None else PooledTransport()
+        self.timeout = timeout
+        self.cache = resolve_cache(cache)
+        self.inflight = SingleFlight() if single_flight else None
+        self.rate_limiter = resolve_rate_limiter(rate_limiter)
+        self.retry = resolve_retry(retry)
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.transport.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def fetch(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> ApiResponse:
+        """GET an endpoint; the result reports whether it was a cache hit,
+        a 304 revalidation of a stale entry, or a full download."""
         url = f"{self.BASE_URL}{endpoint}"
         if params:
             url += "?" + urllib.parse.urlencode(params)
         
-        req = urllib.request.Request(url, headers=self.headers)
-        with urllib.request.urlopen(req) as response:
-            return json.loads(response.read().decode())
+        cache = self.cache if use_cache else None
+        stale = None
+        if cache is not None:
+            entry, fresh = cache.lookup(url, endpoint)
+            if fresh:
+                return ApiResponse(url, entry.value, CACHE_HIT)
+            stale = entry
+        
+        if self.inflight is not None:
+            return self.inflight.do(url, lambda: self._fetch(url, endpoint, cache, stale))
+        return self._fetch(url, endpoint, cache, stale)
+    
+    def _get(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Make GET request to API, served from the response cache when fresh."""
+        return self.fetch(endpoint, params, use_cache).data
+    
+    def _fetch(self, url: str, endpoint: str, cache: Optional[ResponseCache], stale: Optional[CacheEntry]) -> ApiResponse:
+        headers = self.headers
+        if stale is not None:
+            headers = {**headers, **stale.conditional_headers()}
+        response = self._send(url, headers)
+        if response.status == 304 and stale is not None:
+            cache.revalidated(url, endpoint, stale, response.headers.get("etag"), response.headers.get("last-modified"))
+            return ApiResponse(url, stale.value, CACHE_REVALIDATED)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        data = json.loads(response.body.decode())
+        if cache is None:
+            return ApiResponse(url, data, CACHE_BYPASS)
+        cache.put(url, endpoint, data, len(response.body), etag=response.headers.get("etag"),
+                  last_modified=response.headers.get("last-modified"), body=response.body)
+        return ApiResponse(url, data, CACHE_MISS)
+    
+    def _send(self, url: str, headers: Dict[str, str], stream: bool = False) -> Union[Response, StreamResponse]:
+        """Send through the rate limiter, retrying throttled or failed attempts with backoff.
+        With stream=True the body is left unread (see transport.stream())."""
+        send = self.transport.stream if stream else self.transport.request
+        return send_with_retry(lambda: send(url, headers, timeout=self.timeout), url, self.rate_limiter, self.retry,
+                               errors=(OSError, http.client.HTTPException))
+    
+    def iter_array(self, endpoint: str, path: Sequence[str], params: Optional[Dict] = None,
+                   use_cache: bool = True) -> Iterator[Any]:
+        """Yield the items of the array at `path` (e.g. ("events",)) while the
+        response is still downloading, so callers can start on the first items
+        before the body has arrived and never hold the whole document.
+        A fresh cached copy is used when there is one; streamed responses are
+        not stored in the cache (that would mean buffering the whole body)."""
+        url = f"{self.BASE_URL}{endpoint}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        if use_cache and self.cache is not None:
+            entry, fresh = self.cache.lookup(url, endpoint)
+            if fresh:
+                value = entry.value
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                yield from value or ()
+                return
+        with self._send(url, self.headers, stream=True) as response:
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            yield from iter_json_array(response.iter_content(), path)
     
     # ==================== SEARCH ====================
     
-    def search(self, query: str) -> Dict[str, Any]:
+    def search(self, query: str, use_cache: bool = True) -> Dict[str, Any]:
         """Search for teams, players, tournaments."""
-        return self._get("/search/all", params={"q": query})
+        return self._get("/search/all", params={"q": query}, use_cache=use_cache)
     
     # ==================== EVENTS ====================
     
-    def get_scheduled_events(self, sport: str = "football", event_date: Optional[date] = None) -> Dict[str, Any]:
+    def get_scheduled_events(self, sport: str = "football", event_date: Optional[date] = None, use_cache: bool = True) -> Dict[str, Any]:
         """Get scheduled events for a date."""
         if event_date is None:
             event_date = date.today()
-        return self._get(f"/sport/{sport}/scheduled-events/{event_date.isoformat()}")
+        return self._get(f"/sport/{sport}/scheduled-events/{event_date.isoformat()}", use_cache=use_cache)
+    
+    def iter_scheduled_events(self, sport: str = "football", event_date: Optional[date] = None,
+                              use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """Scheduled events for a date, yielded one at a time as they are parsed
+        (see iter_array); peak memory stays flat on busy days."""
+        if event_date is None:
+            event_date = date.today()
+        yield from self.iter_array(f"/sport/{sport}/scheduled-events/{event_date.isoformat()}", ("events",), use_cache=use_cache)
     
-    def get_live_events(self, sport: str = "football") -> Dict[str, Any]:
+    def get_live_events(self, sport: str = "football", use_cache: bool = True) -> Dict[str, Any]:
         """Get all currently live events."""
-        return self._get(f"/sport/{sport}/events/live")
+        return self._get(f"/sport/{sport}/events/live", use_cache=use_cache)
     
-    def get_event(self, event_id: int) -> Dict[str, Any]:
+    def get_event(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get event details."""
-        return self._get(f"/event/{event_id}")
+        return self._get(f"/event/{event_id}", use_cache=use_cache)
     
-    def get_event_lineups(self, event_id: int) -> Dict[str, Any]:
+    def get_event_lineups(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get event lineups (starting XI, subs, formations)."""
-        return self._get(f"/event/{event_id}/lineups")
+        return self._get(f"/event/{event_id}/lineups", use_cache=use_cache)
     
-    def get_event_incidents(self, event_id: int) -> Dict[str, Any]:
+    def get_event_incidents(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get event incidents (goals, cards, subs)."""
-        return self._get(f"/event/{event_id}/incidents")
+        return self._get(f"/event/{event_id}/incidents", use_cache=use_cache)
     
-    def get_event_statistics(self, event_id: int) -> Dict[str, Any]:
+    def get_event_statistics(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get event statistics by period."""
-        return self._get(f"/event/{event_id}/statistics")
+        return self._get(f"/event/{event_id}/statistics", use_cache=use_cache)
     
-    def get_event_h2h(self, event_id: int) -> Dict[str, Any]:
+    def get_event_h2h(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get head-to-head record for an event."""
-        return self._get(f"/event/{event_id}/h2h")
+        return self._get(f"/event/{event_id}/h2h", use_cache=use_cache)
     
     # ==================== TEAMS ====================
     
-    def get_team(self, team_id: int) -> Dict[str, Any]:
+    def get_team(self, team_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get team details."""
-        return self._get(f"/team/{team_id}")
+        return self._get(f"/team/{team_id}", use_cache=use_cache)
     
-    def get_team_players(self, team_id: int) -> Dict[str, Any]:
+    def get_team_players(self, team_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get team squad/players."""
-        return self._get(f"/team/{team_id}/players")
+        return self._get(f"/team/{team_id}/players", use_cache=use_cache)
     
-    def get_team_events_last(self, team_id: int, page: int = 0) -> Dict[str, Any]:
+    def get_team_events_last(self, team_id: int, page: int = 0, use_cache: bool = True) -> Dict[str, Any]:
         """Get team's past events (paginated)."""
-        return self._get(f"/team/{team_id}/events/last/{page}")
+        return self._get(f"/team/{team_id}/events/last/{page}", use_cache=use_cache)
     
-    def get_team_events_next(self, team_id: int, page: int = 0) -> Dict[str, Any]:
+    def get_team_events_next(self, team_id: int, page: int = 0, use_cache: bool = True) -> Dict[str, Any]:
         """Get team's upcoming events (paginated)."""
-        return self._get(f"/team/{team_id}/events/next/{page}")
+        return self._get(f"/team/{team_id}/events/next/{page}", use_cache=use_cache)
     
-    def get_team_transfers(self, team_id: int) -> Dict[str, Any]:
+    def get_team_transfers(self, team_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get team transfers (in and out)."""
-        return self._get(f"/team/{team_id}/transfers")
+        return self._get(f"/team/{team_id}/transfers", use_cache=use_cache)
     
     # ==================== PLAYERS ====================
     
-    def get_player(self, player_id: int) -> Dict[str, Any]:
+    def get_player(self, player_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get player details."""
-        return self._get(f"/player/{player_id}")
+        return self._get(f"/player/{player_id}", use_cache=use_cache)
     
-    def get_player_seasons(self, player_id: int) -> Dict[str, Any]:
+    def get_player_seasons(self, player_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get player's statistics seasons."""
-        return self._get(f"/player/{player_id}/statistics/seasons")
+        return self._get(f"/player/{player_id}/statistics/seasons", use_cache=use_cache)
     
-    def get_player_transfers(self, player_id: int) -> Dict[str, Any]:
+    def get_player_transfers(self, player_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get player's transfer history."""
-        return self._get(f"/player/{player_id}/transfer-history")
+        return self._get(f"/player/{player_id}/transfer-history", use_cache=use_cache)
     
     # ==================== TOURNAMENTS ====================
     
-    def get_tournament_seasons(self, tournament_id: int) -> Dict[str, Any]:
+    def get_tournament_seasons(self, tournament_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get all seasons for a tournament."""
-        return self._get(f"/unique-tournament/{tournament_id}/seasons")
+        return self._get(f"/unique-tournament/{tournament_id}/seasons", use_cache=use_cache)
     
-    def get_standings(self, tournament_id: int, season_id: int) -> Dict[str, Any]:
+    def get_standings(self, tournament_id: int, season_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get league standings/table."""
-        return self._get(f"/unique-tournament/{tournament_id}/season/{season_id}/standings/total")
+        return self._get(f"/unique-tournament/{tournament_id}/season/{season_id}/standings/total", use_cache=use_cache)
+    
+    # ==================== MODELS (opt-in) ====================
+    
+    def get_scheduled_event_models(self, sport: str = "football", event_date: Optional[date] = None,
+                                   use_cache: bool = True) -> List[Event]:
+        """Scheduled events as compact Event models, built while the response streams in."""
+        return [Event(e) for e in self.iter_scheduled_events(sport, event_date, use_cache=use_cache)]
+    
+    def get_event_model(self, event_id: int, use_cache: bool = True) -> Optional[Event]:
+        """Event details as an Event model."""
+        data = self.get_event(event_id, use_cache=use_cache).get("event")
+        return Event(data) if data else None
+    
+    def get_team_model(self, team_id: int, use_cache: bool = True) -> Optional[Team]:
+        """Team details as a Team model."""
+        data = self.get_team(team_id, use_cache=use_cache).get("team")
+        return Team(data) if data else None
+    
+    def get_player_model(self, player_id: int, use_cache: bool = True) -> Optional[Player]:
+        """Player details as a Player model."""
+        data = self.get_player(player_id, use_cache=use_cache).get("player")
+        return Player(data) if data else None
 
 
 # ==================== COMMON IDs ====================
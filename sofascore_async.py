@@ -0,0 +1,604 @@
+"""
+Asyncio client for the SofaScore API.
+Mirrors SofaScoreAPI method-for-method with `async def` methods.
+No external dependencies - uses only built-in Python libraries.
+
+    async with AsyncSofaScoreAPI(max_concurrency=50) as api:
+        events = await api.gather_many(api.get_event(i) for i in event_ids)
+"""
+
+import asyncio
+import json
+import ssl
+import time
+import urllib.error
+import urllib.parse
+from collections import deque
+from datetime import date
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from sofascore_cache import (
+    CACHE_BYPASS, CACHE_HIT, CACHE_MISS, CACHE_REVALIDATED,
+    ApiResponse, AsyncSingleFlight, CacheEntry, ResponseCache, resolve_cache,
+)
+from sofascore_models import Event, Player, Team
+from sofascore_ratelimit import (
+    AdaptiveRateLimiter, RetryPolicy, resolve_rate_limiter, resolve_retry, send_with_retry_async,
+)
+from sofascore_stream import aiter_json_array
+from sofascore_transport import (
+    MAX_REDIRECTS, REDIRECT_CODES, STREAM_CHUNK_SIZE, Response, StreamDecoder, accept_encoding, decode_body,
+)
+
+
+_Conn = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+_Head = Tuple[int, str, Dict[str, str], bool]
+
+
+class AsyncStreamResponse:
+    """Response whose body is consumed incrementally via `async for chunk in iter_content()`.
+
+    The connection is returned to the pool once the body has been read to
+    the end, or closed by close(); `timeout` bounds the wait for each chunk.
+    """
+
+    __slots__ = ("url", "status", "reason", "headers", "timeout", "_raw", "_release")
+
+    def __init__(self, url: str, status: int, reason: str, headers: Dict[str, str], raw: AsyncIterator[bytes],
+                 release: Optional[Callable[[bool], None]] = None, timeout: Optional[float] = None):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.timeout = timeout
+        self._raw = raw
+        self._release = release
+
+    async def iter_content(self) -> AsyncIterator[bytes]:
+        """Decoded body chunks as they arrive from the socket."""
+        decoder = StreamDecoder(self.headers.get("content-encoding"))
+        complete = False
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(self._raw.__anext__(), self.timeout)
+                except StopAsyncIteration:
+                    break
+                data = decoder.decode(chunk)
+                if data:
+                    yield data
+            complete = True
+        finally:
+            self._finish(complete)
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.iter_content()])
+
+    def _finish(self, complete: bool) -> None:
+        release, self._release = self._release, None
+        if release is not None:
+            release(complete)
+
+    def close(self) -> None:
+        """Give up on the rest of the body (the connection is closed, not reused)."""
+        self._finish(False)
+
+    async def __aenter__(self) -> "AsyncStreamResponse":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+
+class AsyncPooledTransport:
+    """Shared pool of keep-alive HTTP/1.1 connections for asyncio.
+
+    - `max_concurrency` caps requests in flight across all hosts.
+    - `max_per_host` caps open connections (and so requests) per host.
+    - Idle connections older than `idle_timeout` seconds are closed.
+    """
+
+    def __init__(self, max_concurrency: int = 100, max_per_host: int = 20, idle_timeout: float = 30.0, timeout: Optional[float] = 20.0):
+        if max_concurrency < 1 or max_per_host < 1:
+            raise ValueError("max_concurrency and max_per_host must be >= 1")
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._per_host: Dict[Tuple[str, str, int], asyncio.Semaphore] = {}
+        self._idle: Dict[Tuple[str, str, int], Deque[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]]] = {}
+        self._ssl: Optional[ssl.SSLContext] = None
+
+    # ---------- pool bookkeeping ----------
+
+    def _host_slot(self, key: Tuple[str, str, int]) -> asyncio.Semaphore:
+        sem = self._per_host.get(key)
+        if sem is None:
+            sem = self._per_host[key] = asyncio.Semaphore(self.max_per_host)
+        return sem
+
+    async def _checkout(self, key: Tuple[str, str, int]) -> Tuple[_Conn, bool]:
+        now = time.monotonic()
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer, last_used = idle.pop()
+            if now - last_used <= self.idle_timeout and not writer.is_closing() and not reader.at_eof():
+                return (reader, writer), True
+            writer.close()
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            conn = await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        else:
+            conn = await asyncio.open_connection(host, port)
+        return conn, False
+
+    def _checkin(self, key: Tuple[str, str, int], conn: _Conn) -> None:
+        reader, writer = conn
+        self._idle.setdefault(key, deque()).append((reader, writer, time.monotonic()))
+
+    def idle_connections(self) -> int:
+        """Number of idle connections currently held by the pool."""
+        return sum(len(d) for d in self._idle.values())
+
+    async def close(self) -> None:
+        writers = [w for idle in self._idle.values() for _, w, _ in idle]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+    # ---------- requests ----------
+
+    async def request(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> Response:
+        if timeout is None:
+            timeout = self.timeout
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await asyncio.wait_for(self._request_once(url, headers), timeout)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response
+            url = urllib.parse.urljoin(url, location)
+        return response
+
+    async def stream(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> AsyncStreamResponse:
+        """Like request() but the body is read incrementally. The connection
+        stays checked out until the body is consumed or the response closed."""
+        if timeout is None:
+            timeout = self.timeout
+        for hop in range(MAX_REDIRECTS + 1):
+            key, conn, (status, reason, resp_headers, will_close) = await asyncio.wait_for(self._open(url, headers), timeout)
+            response = AsyncStreamResponse(
+                url, status, reason, resp_headers, _iter_body(conn[0], status, resp_headers),
+                release=lambda complete, key=key, conn=conn, will_close=will_close: self._release(key, conn, complete and not will_close),
+                timeout=timeout,
+            )
+            location = resp_headers.get("location")
+            if status not in REDIRECT_CODES or not location or hop == MAX_REDIRECTS:
+                return response
+            await response.read()
+            url = urllib.parse.urljoin(url, location)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _request_once(self, url: str, headers: Dict[str, str]) -> Response:
+        key, conn, (status, reason, resp_headers, will_close) = await self._open(url, headers)
+        complete = False
+        try:
+            raw = await _read_body(conn[0], status, resp_headers)
+            complete = True
+        finally:
+            self._release(key, conn, complete and not will_close)
+        body = decode_body(raw, resp_headers.get("content-encoding"))
+        return Response(url, status, reason, resp_headers, body)
+
+    async def _open(self, url: str, headers: Dict[str, str]) -> Tuple[Tuple[str, str, int], _Conn, _Head]:
+        """Send the request on a pooled connection and read the response head.
+        Holds a concurrency slot and a host slot until _release()."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        default_port = 443 if scheme == "https" else 80
+        lines = [f"GET {path} HTTP/1.1", f"Host: {host if port == default_port else f'{host}:{port}'}"]
+        has_encoding = False
+        for k, v in headers.items():
+            has_encoding = has_encoding or k.lower() == "accept-encoding"
+            lines.append(f"{k}: {v}")
+        if not has_encoding:
+            lines.append(f"Accept-Encoding: {accept_encoding()}")
+        request_bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        host_slot = self._host_slot(key)
+        await self._global.acquire()
+        try:
+            await host_slot.acquire()
+        except BaseException:
+            self._global.release()
+            raise
+        try:
+            for attempt in range(2):
+                conn, reused = await self._checkout(key)
+                reader, writer = conn
+                try:
+                    writer.write(request_bytes)
+                    await writer.drain()
+                    return key, conn, await _read_head(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    writer.close()
+                    if reused and attempt == 0:
+                        continue  # server dropped an idle keep-alive socket
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+            raise ConnectionError(f"Connection to {host}:{port} failed")  # pragma: no cover
+        except BaseException:
+            host_slot.release()
+            self._global.release()
+            raise
+
+    def _release(self, key: Tuple[str, str, int], conn: _Conn, reuse: bool) -> None:
+        """Return the connection to the pool (or close it) and free its slots."""
+        if reuse:
+            self._checkin(key, conn)
+        else:
+            conn[1].close()
+        self._host_slot(key).release()
+        self._global.release()
+
+
+async def _read_head(reader: asyncio.StreamReader) -> _Head:
+    """Read the status line and headers of one HTTP/1.x response.
+    Returns (status, reason, headers, will_close)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connection closed before response")
+    version, _, rest = status_line.decode("latin-1").rstrip("\r\n").partition(" ")
+    code, _, reason = rest.partition(" ")
+    status = int(code)
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        k, _, v = line.decode("latin-1").partition(":")
+        headers[k.strip().lower()] = v.strip()
+
+    connection = headers.get("connection", "").lower()
+    will_close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+    if (_has_body(status) and "content-length" not in headers
+            and "chunked" not in headers.get("transfer-encoding", "").lower()):
+        will_close = True  # body runs until the server closes the connection
+    return status, reason, headers, will_close
+
+
+def _has_body(status: int) -> bool:
+    return not (status in (204, 304) or 100 <= status < 200)
+
+
+async def _iter_body(reader: asyncio.StreamReader, status: int, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Yield the raw (still content-encoded) body as it arrives."""
+    if not _has_body(status):
+        return
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # trailers
+                return
+            yield await reader.readexactly(size)
+            await reader.readexactly(2)
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining > 0:
+            chunk = await reader.read(min(remaining, STREAM_CHUNK_SIZE))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        while True:
+            chunk = await reader.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+async def _read_body(reader: asyncio.StreamReader, status: int, headers: Dict[str, str]) -> bytes:
+    """Read the whole raw body of a response whose head has been read."""
+    if _has_body(status) and "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"]))
+    return b"".join([chunk async for chunk in _iter_body(reader, status, headers)])
+
+
+async def gather_many(aws: Iterable[Awaitable[Any]], limit: int, return_exceptions: bool = False) -> List[Any]:
+    """Await `aws` with at most `limit` running at once; results keep input order.
+
+    `aws` is consumed lazily, so a generator of thousands of coroutines only
+    ever has `limit` of them started.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    results: List[Any] = []
+    iterator = iter(enumerate(aws))
+
+    async def worker() -> None:
+        for index, aw in iterator:
+            while len(results) <= index:
+                results.append(None)
+            try:
+                results[index] = await aw
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(limit)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for w in workers:
+            w.cancel()
+        for _, aw in iterator:  # close never-started coroutines
+            if asyncio.iscoroutine(aw):
+                aw.close()
+        raise
+    return results
+
+
+class AsyncSofaScoreAPI:
+    """Asyncio version of SofaScoreAPI with bounded concurrency."""
+
+    BASE_URL = "https://api.sofascore.com/api/v1"
+
+    def __init__(self, transport: Optional[AsyncPooledTransport] = None, timeout: Optional[float] = 20.0,
+                 max_concurrency: int = 100, max_per_host: int = 20,
+                 cache: Union[ResponseCache, bool, None] = True, single_flight: bool = True,
+                 rate_limiter: Union[AdaptiveRateLimiter, bool, None] = True,
+                 retry: Union[RetryPolicy, bool, None] = True):
+        """
+        transport: shared AsyncPooledTransport; created from max_concurrency
+            and max_per_host when not given.
+        timeout: per-request timeout in seconds.
+        cache: ResponseCache to use (may be shared with a SofaScoreAPI),
+            True for a default one, False/None to disable caching. With a
+            DiskCache backend, cache calls run in a worker thread so sqlite
+            I/O and lock waits never block the event loop.
+        single_flight: concurrent identical requests share one upstream
+            fetch (see self.inflight.stats()).
+        rate_limiter: AdaptiveRateLimiter (may be shared with a
+            SofaScoreAPI); True for a default one, False/None to disable.
+        retry: RetryPolicy; True for the default, False/None for no retries.
+        """
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            "Accept": "application/json",
+        }
+        self.transport = transport if transport is not None else AsyncPooledTransport(max_concurrency=max_concurrency, max_per_host=max_per_host)
+        self.timeout = timeout
+        self.cache = resolve_cache(cache)
+        self.inflight = AsyncSingleFlight() if single_flight else None
+        self.rate_limiter = resolve_rate_limiter(rate_limiter)
+        self.retry = resolve_retry(retry)
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _cache_call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a ResponseCache method; off the event loop when it may touch its disk backend."""
+        if self.cache is None or self.cache.backend is None:
+            return fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def fetch(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> ApiResponse:
+        """GET an endpoint; the result reports whether it was a cache hit,
+        a 304 revalidation of a stale entry, or a full download."""
+        url = f"{self.BASE_URL}{endpoint}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+
+        cache = self.cache if use_cache else None
+        stale = None
+        if cache is not None:
+            entry, fresh = await self._cache_call(cache.lookup, url, endpoint)
+            if fresh:
+                return ApiResponse(url, entry.value, CACHE_HIT)
+            stale = entry
+
+        if self.inflight is not None:
+            return await self.inflight.do(url, lambda: self._fetch(url, endpoint, cache, stale))
+        return await self._fetch(url, endpoint, cache, stale)
+
+    async def _get(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Make GET request to API, served from the response cache when fresh."""
+        return (await self.fetch(endpoint, params, use_cache)).data
+
+    async def _fetch(self, url: str, endpoint: str, cache: Optional[ResponseCache], stale: Optional[CacheEntry]) -> ApiResponse:
+        headers = self.headers
+        if stale is not None:
+            headers = {**headers, **stale.conditional_headers()}
+        response = await self._send(url, headers)
+        if response.status == 304 and stale is not None:
+            await self._cache_call(cache.revalidated, url, endpoint, stale, response.headers.get("etag"),
+                                   response.headers.get("last-modified"))
+            return ApiResponse(url, stale.value, CACHE_REVALIDATED)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        data = json.loads(response.body.decode())
+        if cache is None:
+            return ApiResponse(url, data, CACHE_BYPASS)
+        await self._cache_call(cache.put, url, endpoint, data, len(response.body), etag=response.headers.get("etag"),
+                               last_modified=response.headers.get("last-modified"), body=response.body)
+        return ApiResponse(url, data, CACHE_MISS)
+
+    async def _send(self, url: str, headers: Dict[str, str], stream: bool = False) -> Union[Response, AsyncStreamResponse]:
+        """Send through the rate limiter, retrying throttled or failed attempts with backoff.
+        With stream=True the body is left unread (see transport.stream())."""
+        send = self.transport.stream if stream else self.transport.request
+        return await send_with_retry_async(lambda: send(url, headers, timeout=self.timeout), url,
+                                           self.rate_limiter, self.retry)
+
+    async def iter_array(self, endpoint: str, path: Sequence[str], params: Optional[Dict] = None,
+                         use_cache: bool = True) -> AsyncIterator[Any]:
+        """Async version of SofaScoreAPI.iter_array(): yields the items of the
+        array at `path` while the response is still downloading."""
+        url = f"{self.BASE_URL}{endpoint}"
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        if use_cache and self.cache is not None:
+            entry, fresh = await self._cache_call(self.cache.lookup, url, endpoint)
+            if fresh:
+                value = entry.value
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                for item in value or ():
+                    yield item
+                return
+        response = await self._send(url, self.headers, stream=True)
+        try:
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            async for item in aiter_json_array(response.iter_content(), path):
+                yield item
+        finally:
+            response.close()
+
+    async def gather_many(self, aws: Iterable[Awaitable[Any]], return_exceptions: bool = False) -> List[Any]:
+        """Run many calls, e.g. `api.get_event(i) for i in ids`, at the transport's in-flight cap."""
+        return await gather_many(aws, self.transport.max_concurrency, return_exceptions=return_exceptions)
+
+    # ==================== SEARCH ====================
+
+    async def search(self, query: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Search for teams, players, tournaments."""
+        return await self._get("/search/all", params={"q": query}, use_cache=use_cache)
+
+    # ==================== EVENTS ====================
+
+    async def get_scheduled_events(self, sport: str = "football", event_date: Optional[date] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Get scheduled events for a date."""
+        if event_date is None:
+            event_date = date.today()
+        return await self._get(f"/sport/{sport}/scheduled-events/{event_date.isoformat()}", use_cache=use_cache)
+
+    async def iter_scheduled_events(self, sport: str = "football", event_date: Optional[date] = None,
+                                    use_cache: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """Scheduled events for a date, yielded one at a time as they are parsed."""
+        if event_date is None:
+            event_date = date.today()
+        async for event in self.iter_array(f"/sport/{sport}/scheduled-events/{event_date.isoformat()}", ("events",), use_cache=use_cache):
+            yield event
+
+    async def get_live_events(self, sport: str = "football", use_cache: bool = True) -> Dict[str, Any]:
+        """Get all currently live events."""
+        return await self._get(f"/sport/{sport}/events/live", use_cache=use_cache)
+
+    async def get_event(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get event details."""
+        return await self._get(f"/event/{event_id}", use_cache=use_cache)
+
+    async def get_event_lineups(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get event lineups (starting XI, subs, formations)."""
+        return await self._get(f"/event/{event_id}/lineups", use_cache=use_cache)
+
+    async def get_event_incidents(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get event incidents (goals, cards, subs)."""
+        return await self._get(f"/event/{event_id}/incidents", use_cache=use_cache)
+
+    async def get_event_statistics(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get event statistics by period."""
+        return await self._get(f"/event/{event_id}/statistics", use_cache=use_cache)
+
+    async def get_event_h2h(self, event_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get head-to-head record for an event."""
+        return await self._get(f"/event/{event_id}/h2h", use_cache=use_cache)
+
+    # ==================== TEAMS ====================
+
+    async def get_team(self, team_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get team details."""
+        return await self._get(f"/team/{team_id}", use_cache=use_cache)
+
+    async def get_team_players(self, team_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get team squad/players."""
+        return await self._get(f"/team/{team_id}/players", use_cache=use_cache)
+
+    async def get_team_events_last(self, team_id: int, page: int = 0, use_cache: bool = True) -> Dict[str, Any]:
+        """Get team's past events (paginated)."""
+        return await self._get(f"/team/{team_id}/events/last/{page}", use_cache=use_cache)
+
+    async def get_team_events_next(self, team_id: int, page: int = 0, use_cache: bool = True) -> Dict[str, Any]:
+        """Get team's upcoming events (paginated)."""
+        return await self._get(f"/team/{team_id}/events/next/{page}", use_cache=use_cache)
+
+    async def get_team_transfers(self, team_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get team transfers (in and out)."""
+        return await self._get(f"/team/{team_id}/transfers", use_cache=use_cache)
+
+    # ==================== PLAYERS ====================
+
+    async def get_player(self, player_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get player details."""
+        return await self._get(f"/player/{player_id}", use_cache=use_cache)
+
+    async def get_player_seasons(self, player_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get player's statistics seasons."""
+        return await self._get(f"/player/{player_id}/statistics/seasons", use_cache=use_cache)
+
+    async def get_player_transfers(self, player_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get player's transfer history."""
+        return await self._get(f"/player/{player_id}/transfer-history", use_cache=use_cache)
+
+    # ==================== TOURNAMENTS ====================
+
+    async def get_tournament_seasons(self, tournament_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get all seasons for a tournament."""
+        return await self._get(f"/unique-tournament/{tournament_id}/seasons", use_cache=use_cache)
+
+    async def get_standings(self, tournament_id: int, season_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get league standings/table."""
+        return await self._get(f"/unique-tournament/{tournament_id}/season/{season_id}/standings/total", use_cache=use_cache)
+
+    # ==================== MODELS (opt-in) ====================
+
+    async def get_scheduled_event_models(self, sport: str = "football", event_date: Optional[date] = None,
+                                         use_cache: bool = True) -> List[Event]:
+        """Scheduled events as compact Event models, built while the response streams in."""
+        return [Event(e) async for e in self.iter_scheduled_events(sport, event_date, use_cache=use_cache)]
+
+    async def get_event_model(self, event_id: int, use_cache: bool = True) -> Optional[Event]:
+        """Event details as an Event model."""
+        data = (await self.get_event(event_id, use_cache=use_cache)).get("event")
+        return Event(data) if data else None
+
+    async def get_team_model(self, team_id: int, use_cache: bool = True) -> Optional[Team]:
+        """Team details as a Team model."""
+        data = (await self.get_team(team_id, use_cache=use_cache)).get("team")
+        return Team(data) if data else None
+
+    async def get_player_model(self, player_id: int, use_cache: bool = True) -> Optional[Player]:
+        """Player details as a Player model."""
+        data = (await self.get_player(player_id, use_cache=use_cache)).get("player")
+        return Player(data) if data else None
@@ -0,0 +1,506 @@
+"""
+In-process response cache for the SofaScore API wrappers.
+
+Entries are keyed by request URL and expire according to a TTL policy
+chosen from the endpoint path (live data for seconds, standings for
+minutes, team/player profiles for a day). The cache is LRU-evicted once
+it exceeds either an entry count or a memory cap, measured as the size of
+the JSON bodies. Expired entries that carry an ETag or Last-Modified
+validator are kept so the client can revalidate them with a conditional
+request and reuse the parsed object on 304 Not Modified. Cached values are
+the parsed JSON objects and are shared between callers, so treat them as
+read-only.
+
+SingleFlight / AsyncSingleFlight collapse concurrent identical requests so
+that only one upstream fetch is in flight per URL.
+No external dependencies - uses only built-in Python libraries.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+
+# (endpoint class, endpoint path pattern, TTL seconds); first match wins.
+DEFAULT_TTL_POLICIES: Sequence[Tuple[str, str, float]] = (
+    ("live", r"/events/live$", 5),
+    ("scheduled", r"/scheduled-events/", 60),
+    ("event", r"^/event/\d+", 30),
+    ("standings", r"/standings/", 600),
+    ("tournament", r"^/unique-tournament/", 3600),
+    ("team_events", r"^/team/\d+/events/", 600),
+    ("team", r"^/team/", 86400),
+    ("player", r"^/player/", 86400),
+    ("search", r"^/search/", 300),
+)
+DEFAULT_TTL = 60.0
+
+
+class TTLPolicy:
+    """Maps an endpoint path to (endpoint class, TTL seconds)."""
+
+    def __init__(self, rules: Sequence[Tuple[str, str, float]] = DEFAULT_TTL_POLICIES, default_ttl: float = DEFAULT_TTL):
+        self.rules = [(name, re.compile(pattern), float(ttl)) for name, pattern, ttl in rules]
+        self.default_ttl = default_ttl
+
+    def classify(self, endpoint: str) -> Tuple[str, float]:
+        for name, pattern, ttl in self.rules:
+            if pattern.search(endpoint):
+                return name, ttl
+        return "default", self.default_ttl
+
+
+class CacheEntry:
+    __slots__ = ("value", "size", "expires_at", "endpoint_class", "etag", "last_modified")
+
+    def __init__(self, value: Any, size: int, expires_at: float, endpoint_class: str,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.endpoint_class = endpoint_class
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# ApiResponse.cache_status values
+CACHE_HIT = "hit"                  # fresh entry, no upstream request
+CACHE_REVALIDATED = "revalidated"  # stale entry confirmed by a 304
+CACHE_MISS = "miss"                # full download
+CACHE_BYPASS = "bypass"            # caching disabled for the call
+
+
+class ApiResponse:
+    """Parsed API response plus how the cache produced it."""
+
+    __slots__ = ("url", "data", "cache_status")
+
+    def __init__(self, url: str, data: Any, cache_status: str):
+        self.url = url
+        self.data = data
+        self.cache_status = cache_status
+
+    @property
+    def from_cache(self) -> bool:
+        return self.cache_status in (CACHE_HIT, CACHE_REVALIDATED)
+
+    @property
+    def revalidated(self) -> bool:
+        return self.cache_status == CACHE_REVALIDATED
+
+    def __repr__(self) -> str:
+        return f"<ApiResponse {self.cache_status} {self.url}>"
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of parsed API responses.
+
+    max_bytes: memory cap, as the sum of cached JSON body sizes.
+    max_entries: cap on the number of cached responses.
+    policy: TTLPolicy deciding the TTL for each endpoint.
+    backend: optional DiskCache behind the in-memory LRU.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 10000, policy: Optional[TTLPolicy] = None,
+                 backend: Optional["DiskCache"] = None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.policy = policy or TTLPolicy()
+        self.backend = backend
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.disk_hits = 0
+        self._class_stats: Dict[str, List[int]] = {}
+
+    def lookup(self, key: str, endpoint: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Return (entry, fresh) for `key`; `endpoint` selects the stats bucket.
+
+        Memory is checked first, then the disk backend. Expired entries with
+        validators come back with fresh=False for revalidation; expired
+        entries without them are dropped.
+        """
+        endpoint_class, _ = self.policy.classify(endpoint)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.backend is not None:
+            entry = self._load(key, endpoint_class)
+        now = time.monotonic()
+        with self._lock:
+            counters = self._class_stats.setdefault(endpoint_class, [0, 0])
+            if entry is not None and entry.expires_at > now:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+                counters[0] += 1
+                return entry, True
+            self.misses += 1
+            counters[1] += 1
+            if entry is None:
+                return None, False
+            if entry.revalidatable:
+                return entry, False
+            if self._entries.get(key) is entry:
+                self._remove(key)
+            return None, False
+
+    def _load(self, key: str, endpoint_class: str) -> Optional[CacheEntry]:
+        """Promote a response from the disk backend into memory."""
+        row = self.backend.get(key)
+        if row is None:
+            return None
+        body, expires_at, etag, last_modified = row
+        try:
+            value = json.loads(body)
+        except ValueError:
+            return None
+        entry = CacheEntry(value, len(body), time.monotonic() + (expires_at - time.time()),
+                           endpoint_class, etag, last_modified)
+        with self._lock:
+            self.disk_hits += 1
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+        return entry
+
+    def get(self, key: str, endpoint: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for `key`, counting only fresh entries as hits."""
+        entry, fresh = self.lookup(key, endpoint)
+        return (True, entry.value) if fresh else (False, None)
+
+    def put(self, key: str, endpoint: str, value: Any, size: int,
+            etag: Optional[str] = None, last_modified: Optional[str] = None,
+            body: Optional[bytes] = None) -> None:
+        """Store a parsed response; `size` is its JSON body length in bytes.
+
+        `body` is the raw JSON, written to the disk backend when there is
+        one (re-serialized from `value` if omitted). With a TTL of 0 an
+        entry is only kept if it has a validator, so every use
+        revalidates it.
+        """
+        endpoint_class, ttl = self.policy.classify(endpoint)
+        if (ttl <= 0 and not (etag or last_modified)) or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(value, size, time.monotonic() + ttl, endpoint_class, etag, last_modified)
+            self._bytes += size
+            self._evict()
+        if self.backend is not None:
+            if body is None:
+                body = json.dumps(value).encode()
+            self.backend.put(key, body, time.time() + ttl, etag, last_modified)
+
+    def revalidated(self, key: str, endpoint: str, entry: CacheEntry,
+                    etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Mark `entry` fresh again after a 304, re-inserting it if it was evicted."""
+        _, ttl = self.policy.classify(endpoint)
+        with self._lock:
+            self.revalidations += 1
+            entry.expires_at = time.monotonic() + ttl
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+            if self._entries.get(key) is not entry:
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = entry
+                self._bytes += entry.size
+                self._evict()
+            else:
+                self._entries.move_to_end(key)
+        if self.backend is not None:
+            self.backend.touch(key, time.time() + ttl, entry.etag, entry.last_modified)
+
+    def _evict(self) -> None:
+        while self._entries and (self._bytes > self.max_bytes or len(self._entries) > self.max_entries):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.backend is not None:
+            self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/304 counters, overall and per endpoint class."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "revalidations": self.revalidations,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "by_class": {name: {"hits": h, "misses": m} for name, (h, m) in self._class_stats.items()},
+            }
+        if self.backend is not None:
+            stats["disk"] = self.backend.stats()
+        return stats
+
+
+DISK_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS responses (
+  key TEXT PRIMARY KEY,
+  body BLOB NOT NULL,
+  size INTEGER NOT NULL,
+  expires_at REAL NOT NULL,
+  etag TEXT,
+  last_modified TEXT,
+  accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+
+class DiskCache:
+    """Persistent response store in a single SQLite file.
+
+    Bodies are zlib-compressed. Expiry uses wall-clock time so entries
+    survive restarts. The file is opened in WAL mode with a busy timeout,
+    so several processes (and threads, each with its own connection) can
+    read and write it at once. Every `purge_every` writes, expired rows
+    without validators are deleted and the least recently used rows are
+    evicted until the compressed total is under `max_bytes`.
+    """
+
+    # Reads refresh accessed_at at most this often, to keep reads cheap.
+    ACCESS_GRANULARITY = 60.0
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, compress_level: int = 6,
+                 purge_every: int = 200, busy_timeout: float = 30.0):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.purge_every = purge_every
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns: List[sqlite3.Connection] = []
+        self._writes = 0
+        self.evictions = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(DISK_SCHEMA_SQL)
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float, Optional[str], Optional[str]]]:
+        """Return (json_body, expires_at, etag, last_modified) or None.
+
+        Expired rows are only returned when they can be revalidated.
+        """
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT body, expires_at, etag, last_modified, accessed_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, expires_at, etag, last_modified, accessed_at = row
+        if expires_at <= now and not (etag or last_modified):
+            return None
+        if now - accessed_at > self.ACCESS_GRANULARITY:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return zlib.decompress(body), expires_at, etag, last_modified
+        except zlib.error:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+    def put(self, key: str, body: bytes, expires_at: float, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        blob = zlib.compress(body, self.compress_level)
+        self._conn().execute(
+            "INSERT OR REPLACE INTO responses (key, body, size, expires_at, etag, last_modified, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, blob, len(blob), expires_at, etag, last_modified, time.time()),
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.purge_every == 0
+        if due:
+            self.purge()
+
+    def touch(self, key: str, expires_at: float, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> None:
+        """Extend a row's expiry after a 304 revalidation."""
+        self._conn().execute(
+            "UPDATE responses SET expires_at = ?, etag = ?, last_modified = ?, accessed_at = ? WHERE key = ?",
+            (expires_at, etag, last_modified, time.time(), key),
+        )
+
+    def purge(self) -> int:
+        """Drop dead rows, then LRU-evict down to max_bytes. Returns rows removed."""
+        conn = self._conn()
+        removed = conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL AND last_modified IS NULL", (time.time(),)
+        ).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        while total > self.max_bytes:
+            victims = []
+            for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at LIMIT 500"):
+                if total <= self.max_bytes:
+                    break
+                victims.append((key,))
+                total -= size
+            if not victims:
+                break
+            conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            removed += len(victims)
+            with self._lock:
+                self.evictions += len(victims)
+        return removed
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        entries, size = self._conn().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"entries": entries, "bytes": size, "evictions": self.evictions}
+
+    def close(self) -> None:
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
+
+def resolve_cache(cache: Union[ResponseCache, bool, None]) -> Optional[ResponseCache]:
+    """Client `cache=` argument: True -> new ResponseCache, False/None -> disabled."""
+    if isinstance(cache, ResponseCache):
+        return cache
+    return ResponseCache() if cache else None
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe request coalescing.
+
+    Concurrent `do(key, fn)` calls with the same key run `fn` once; the
+    other callers block until it finishes and get the same result (or
+    exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executions = 0
+        self.collapsed = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.collapsed += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Upstream executions vs calls that piggybacked on one in flight."""
+        with self._lock:
+            return {"executions": self.executions, "collapsed": self.collapsed, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Request coalescing for asyncio.
+
+    The first caller starts the coroutine as a task; later callers with the
+    same key await that task. Cancelling a waiter does not cancel the shared
+    fetch.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, "asyncio.Future[Any]"] = {}
+        self.executions = 0
+        self.collapsed = 0
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda _t, k=key: self._tasks.pop(k, None))
+        else:
+            self.collapsed += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Upstream executions vs calls that piggybacked on one in flight."""
+        return {"executions": self.executions, "collapsed": self.collapsed, "in_flight": len(self._tasks)}
@@ -0,0 +1,167 @@
+"""
+Compact typed models for SofaScore payloads.
+
+Event, Team, Player, Tournament, Season and Score are `__slots__` classes
+built from the raw API dicts. Scalar fields are copied into slots and
+nested objects (an event's teams, tournament, season and scores, a player's
+team, ...) are built into their own models up front, so no part of the raw
+dict is kept. Everything else in the payload (translations, colours,
+feature flags) is not retained.
+
+    events = [Event(e) for e in api.iter_scheduled_events()]
+    events[0].home_team.name
+
+No external dependencies - uses only built-in Python libraries.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def _nested(data: Dict[str, Any], key: str, cls: type) -> Any:
+    """Nested object built into `cls`, or None when missing/empty."""
+    value = data.get(key)
+    return cls(value) if value else None
+
+
+class _Model:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} id={getattr(self, 'id', None)} {getattr(self, 'name', '') or getattr(self, 'slug', '')}>"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and getattr(self, "id", None) == getattr(other, "id", None)
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, getattr(self, "id", None)))
+
+
+class Season(_Model):
+    __slots__ = ("id", "name", "year")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.id: Optional[int] = data.get("id")
+        self.name: Optional[str] = data.get("name")
+        self.year: Optional[str] = data.get("year")
+
+
+class Score(_Model):
+    __slots__ = ("current", "display", "period1", "period2", "normaltime", "extra1", "extra2", "overtime", "penalties")
+
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        self.current: Optional[int] = get("current")
+        self.display: Optional[int] = get("display")
+        self.period1: Optional[int] = get("period1")
+        self.period2: Optional[int] = get("period2")
+        self.normaltime: Optional[int] = get("normaltime")
+        self.extra1: Optional[int] = get("extra1")
+        self.extra2: Optional[int] = get("extra2")
+        self.overtime: Optional[int] = get("overtime")
+        self.penalties: Optional[int] = get("penalties")
+
+    def __repr__(self) -> str:
+        return f"<Score {self.current}>"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is Score and all(getattr(self, s) == getattr(other, s) for s in Score.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class Tournament(_Model):
+    """A tournament (competition stage); `unique_tournament` is the parent competition."""
+
+    __slots__ = ("id", "name", "slug", "priority", "user_count", "category_id", "category_name", "category_slug",
+                 "sport_slug", "unique_tournament")
+
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        category = get("category") or {}
+        self.id: Optional[int] = get("id")
+        self.name: Optional[str] = get("name")
+        self.slug: Optional[str] = get("slug")
+        self.priority: Optional[int] = get("priority")
+        self.user_count: Optional[int] = get("userCount")
+        self.category_id: Optional[int] = category.get("id")
+        self.category_name: Optional[str] = category.get("name")
+        self.category_slug: Optional[str] = category.get("slug")
+        self.sport_slug: Optional[str] = (category.get("sport") or {}).get("slug")
+        self.unique_tournament: Optional[Tournament] = _nested(data, "uniqueTournament", Tournament)
+
+
+class Team(_Model):
+    __slots__ = ("id", "name", "slug", "short_name", "name_code", "gender", "national", "user_count",
+                 "country_alpha2", "country_name", "sport_slug")
+
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        country = get("country") or {}
+        self.id: Optional[int] = get("id")
+        self.name: Optional[str] = get("name")
+        self.slug: Optional[str] = get("slug")
+        self.short_name: Optional[str] = get("shortName")
+        self.name_code: Optional[str] = get("nameCode")
+        self.gender: Optional[str] = get("gender")
+        self.national: Optional[bool] = get("national")
+        self.user_count: Optional[int] = get("userCount")
+        self.country_alpha2: Optional[str] = country.get("alpha2")
+        self.country_name: Optional[str] = country.get("name")
+        self.sport_slug: Optional[str] = (get("sport") or {}).get("slug")
+
+
+class Player(_Model):
+    __slots__ = ("id", "name", "slug", "short_name", "position", "jersey_number", "height",
+                 "date_of_birth_timestamp", "country_alpha2", "country_name", "team")
+
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        country = get("country") or {}
+        self.id: Optional[int] = get("id")
+        self.name: Optional[str] = get("name")
+        self.slug: Optional[str] = get("slug")
+        self.short_name: Optional[str] = get("shortName")
+        self.position: Optional[str] = get("position")
+        self.jersey_number: Optional[str] = get("jerseyNumber")
+        self.height: Optional[int] = get("height")
+        self.date_of_birth_timestamp: Optional[int] = get("dateOfBirthTimestamp")
+        self.country_alpha2: Optional[str] = country.get("alpha2")
+        self.country_name: Optional[str] = country.get("name")
+        self.team: Optional[Team] = _nested(data, "team", Team)
+
+
+class Event(_Model):
+    __slots__ = ("id", "slug", "custom_id", "start_timestamp", "winner_code", "status_code", "status_type",
+                 "status_description", "round", "round_name", "final_result_only", "has_player_statistics",
+                 "has_player_heatmap", "detail_id",
+                 "tournament", "season", "home_team", "away_team", "home_score", "away_score")
+
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        status = get("status") or {}
+        round_info = get("roundInfo") or {}
+        self.id: Optional[int] = get("id")
+        self.slug: Optional[str] = get("slug")
+        self.custom_id: Optional[str] = get("customId")
+        self.start_timestamp: Optional[int] = get("startTimestamp")
+        self.winner_code: Optional[int] = get("winnerCode")
+        self.status_code: Optional[int] = status.get("code")
+        self.status_type: Optional[str] = status.get("type")
+        self.status_description: Optional[str] = status.get("description")
+        self.round: Optional[int] = round_info.get("round")
+        self.round_name: Optional[str] = round_info.get("name")
+        self.final_result_only: Optional[bool] = get("finalResultOnly")
+        self.has_player_statistics: Optional[bool] = get("hasEventPlayerStatistics")
+        self.has_player_heatmap: Optional[bool] = get("hasEventPlayerHeatMap")
+        self.detail_id: Optional[int] = get("detailId")
+        self.tournament: Optional[Tournament] = _nested(data, "tournament", Tournament)
+        self.season: Optional[Season] = _nested(data, "season", Season)
+        self.home_team: Optional[Team] = _nested(data, "homeTeam", Team)
+        self.away_team: Optional[Team] = _nested(data, "awayTeam", Team)
+        self.home_score: Optional[Score] = _nested(data, "homeScore", Score)
+        self.away_score: Optional[Score] = _nested(data, "awayScore", Score)
+
+    @property
+    def name(self) -> str:
+        home, away = self.home_team, self.away_team
+        return f"{home.name if home else '?'} - {away.name if away else '?'}"
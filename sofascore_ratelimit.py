@@ -0,0 +1,312 @@
+"""
+Shared rate limiting and retry for the SofaScore fetchers.
+
+- TokenBucket: thread-safe token bucket; `reserve()` returns how long the
+  caller must wait, so it works for both threads and asyncio.
+- AdaptiveRateLimiter: one bucket per (host, endpoint class). 429/503
+  responses halve the bucket's rate and honour Retry-After; successes
+  slowly restore it (AIMD). Keeps throughput and throttle counters.
+- RetryPolicy: jittered exponential backoff for retryable statuses and
+  connection errors.
+- send_with_retry / send_with_retry_async: the request loop tying the two
+  together (acquire, send, feed the status back, back off and retry).
+
+Used by SofaScoreAPI / AsyncSofaScoreAPI, bootstrap_sofascore_db.api_get
+and scripts/snapshot_api_responses._get.
+No external dependencies - uses only built-in Python libraries.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import re
+import threading
+import time
+import urllib.parse
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (seconds or HTTP-date) -> seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens/second, holding up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.burst
+        self.paused_until = 0.0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` now (possibly going into debt); return seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+            self._last = now
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+            self._last = now
+            self.rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold all callers for `seconds` (e.g. Retry-After)."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class _Bucket:
+    __slots__ = ("bucket", "base_rate", "requests", "throttled", "waited", "first", "last")
+
+    def __init__(self, rate: float, burst: Optional[float]):
+        self.bucket = TokenBucket(rate, burst)
+        self.base_rate = rate
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self.first = 0.0
+        self.last = 0.0
+
+
+class AdaptiveRateLimiter:
+    """Token bucket per (host, endpoint class) that adapts to throttling.
+
+    rate/burst: default requests/second and burst for each bucket.
+    rules: (endpoint class, path regex, rate) overrides; first match wins,
+        unmatched paths use class "api" at `rate`.
+    min_rate: floor the rate never drops below after throttling.
+    recovery: fraction of the base rate regained per successful response.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: Optional[float] = None,
+                 rules: Sequence[Tuple[str, str, float]] = (), min_rate: float = 0.2, recovery: float = 0.05):
+        self.rate = rate
+        self.burst = burst
+        self.rules = [(name, re.compile(pattern), r) for name, pattern, r in rules]
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def key(self, url: str) -> Tuple[str, str]:
+        parts = urllib.parse.urlsplit(url)
+        for name, pattern, _ in self.rules:
+            if pattern.search(parts.path):
+                return parts.netloc, name
+        return parts.netloc, "api"
+
+    def _bucket(self, key: Tuple[str, str]) -> _Bucket:
+        with self._lock:
+            b = self._buckets.get(key)
+            if b is None:
+                rule_rate = next((r for name, _, r in self.rules if name == key[1]), None)
+                if rule_rate is None:
+                    b = _Bucket(self.rate, self.burst)
+                else:
+                    b = _Bucket(rule_rate, None)
+                self._buckets[key] = b
+            return b
+
+    def reserve(self, url: str) -> float:
+        """Count a request to `url` and return the seconds to wait before sending it."""
+        b = self._bucket(self.key(url))
+        wait = b.bucket.reserve()
+        with self._lock:
+            now = time.monotonic()
+            if not b.requests:
+                b.first = now + wait
+            b.requests += 1
+            b.waited += wait
+            b.last = now + wait
+        return wait
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to `url` may be sent; returns seconds waited."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """asyncio version of acquire()."""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_response(self, url: str, status: int, retry_after: Optional[str] = None) -> None:
+        """Feed back a response status: throttling slows the bucket down, success speeds it back up."""
+        b = self._bucket(self.key(url))
+        bucket = b.bucket
+        if status in THROTTLE_STATUSES:
+            with self._lock:
+                b.throttled += 1
+            bucket.set_rate(max(self.min_rate, bucket.rate / 2))
+            delay = parse_retry_after(retry_after)
+            if delay:
+                bucket.pause(delay)
+        elif status < 500 and bucket.rate < b.base_rate:
+            bucket.set_rate(min(b.base_rate, bucket.rate + b.base_rate * self.recovery))
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-bucket current rate, achieved throughput and throttle events."""
+        out: Dict[str, Any] = {}
+        with self._lock:
+            items = list(self._buckets.items())
+        total_requests = total_throttled = 0
+        for (host, name), b in items:
+            span = b.last - b.first
+            out[f"{host}/{name}"] = {
+                "rate": round(b.bucket.rate, 3),
+                "requests": b.requests,
+                "throttled": b.throttled,
+                "waited_s": round(b.waited, 3),
+                "achieved_rps": round(b.requests / span, 3) if span > 0 else None,
+            }
+            total_requests += b.requests
+            total_throttled += b.throttled
+        return {"requests": total_requests, "throttled": total_throttled, "buckets": out}
+
+
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter").
+
+    Attempt n (0-based) waits uniform(0, min(max_delay, base_delay * 2**n)),
+    but never less than the server's Retry-After.
+    """
+
+    def __init__(self, max_retries: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 retry_statuses: Sequence[int] = (429, 500, 502, 503, 504)):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retries = 0
+
+    def should_retry(self, attempt: int, status: Optional[int] = None) -> bool:
+        """`status` None means a connection error."""
+        return attempt < self.max_retries and (status is None or status in self.retry_statuses)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        self.retries += 1
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        server = parse_retry_after(retry_after)
+        return min(self.max_delay, max(backoff, server or 0.0))
+
+
+def _response_status(response: Any) -> Tuple[int, Optional[str]]:
+    """(status, Retry-After) of a sofascore_transport response or a requests.Response."""
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = response.status
+    return status, response.headers.get("retry-after")
+
+
+def _discard(response: Any, url: str, status: int, attempt: int) -> None:
+    logger.debug("HTTP %s for %s, retrying (attempt %d)", status, url, attempt + 1)
+    close = getattr(response, "close", None)
+    if close is not None:
+        close()
+
+
+def send_with_retry(send: Callable[[], R], url: str, limiter: Optional[AdaptiveRateLimiter],
+                    retry: Optional[RetryPolicy], errors: Tuple[Type[BaseException], ...] = (OSError,)) -> R:
+    """Call `send()` for `url` through `limiter`, retrying under `retry`.
+
+    `errors` are the connection errors worth retrying. A response with a
+    retryable status is closed and sent again; the last one is returned
+    whatever its status. Either policy may be None (disabled).
+    """
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire(url)
+        try:
+            response = send()
+        except errors:
+            if retry is None or not retry.should_retry(attempt):
+                raise
+            time.sleep(retry.delay(attempt))
+            attempt += 1
+            continue
+        status, retry_after = _response_status(response)
+        if limiter is not None:
+            limiter.on_response(url, status, retry_after)
+        if retry is None or not retry.should_retry(attempt, status):
+            return response
+        _discard(response, url, status, attempt)
+        time.sleep(retry.delay(attempt, retry_after))
+        attempt += 1
+
+
+async def send_with_retry_async(send: Callable[[], Awaitable[R]], url: str, limiter: Optional[AdaptiveRateLimiter],
+                                retry: Optional[RetryPolicy],
+                                errors: Tuple[Type[BaseException], ...] = (OSError, asyncio.TimeoutError)) -> R:
+    """asyncio version of send_with_retry()."""
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await limiter.acquire_async(url)
+        try:
+            response = await send()
+        except errors:
+            if retry is None or not retry.should_retry(attempt):
+                raise
+            await asyncio.sleep(retry.delay(attempt))
+            attempt += 1
+            continue
+        status, retry_after = _response_status(response)
+        if limiter is not None:
+            limiter.on_response(url, status, retry_after)
+        if retry is None or not retry.should_retry(attempt, status):
+            return response
+        _discard(response, url, status, attempt)
+        await asyncio.sleep(retry.delay(attempt, retry_after))
+        attempt += 1
+
+
+def resolve_rate_limiter(limiter: Union[AdaptiveRateLimiter, bool, None]) -> Optional[AdaptiveRateLimiter]:
+    """Client `rate_limiter=` argument: True -> default limiter, False/None -> disabled."""
+    if isinstance(limiter, AdaptiveRateLimiter):
+        return limiter
+    return AdaptiveRateLimiter() if limiter else None
+
+
+def resolve_retry(retry: Union[RetryPolicy, bool, None]) -> Optional[RetryPolicy]:
+    """Client `retry=` argument: True -> default policy, False/None -> no retries."""
+    if isinstance(retry, RetryPolicy):
+        return retry
+    return RetryPolicy() if retry else None
@@ -0,0 +1,172 @@
+"""
+Incremental JSON decoding for large SofaScore payloads.
+
+The scheduled-events response for a busy day holds thousands of event
+objects. ArrayItemParser is fed the body chunk by chunk while it downloads
+and hands back each element of one nested array (e.g. `events`) as soon as
+that element is complete, so callers can process events before the
+download finishes and only ever hold one chunk plus one event in memory.
+
+    for event in iter_json_array(response.iter_content(), ("events",)):
+        ...
+
+No external dependencies - uses only built-in Python libraries.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Sequence
+
+_WHITESPACE = " \t\n\r"
+_VALUE_END = _WHITESPACE + ",]}"  # what may follow a complete value
+_NEED_MORE = object()
+
+
+class ArrayItemParser:
+    """Push parser for the items of the array found at `path` in a JSON document.
+
+    `path` is the chain of object keys leading to the array; an empty path
+    means the document itself is the array. If a key is missing or its value
+    is not an array/object, the parser finishes without yielding anything.
+    Values next to the path (other keys) are decoded and discarded.
+    """
+
+    def __init__(self, path: Sequence[str] = ("events",)):
+        self.path = tuple(path)
+        self.items = 0
+        self.done = False
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._pending: List[str] = []
+        self._pending_len = 0
+        self._need = 0  # unparsed characters required before the next attempt
+        self._depth = 0  # number of path keys entered so far
+        self._key = None
+        self._state = "open"
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add a chunk of the body; return the array items completed by it."""
+        return self._feed(self._utf8.decode(data), final=False)
+
+    def close(self) -> List[Any]:
+        """Signal end of body; return any last items. Raises ValueError if the document was cut short."""
+        items = self._feed(self._utf8.decode(b"", final=True), final=True)
+        if not self.done:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _feed(self, text: str, final: bool) -> List[Any]:
+        if self.done:
+            return []
+        self._pending.append(text)
+        self._pending_len += len(text)
+        if not final and len(self._buf) - self._pos + self._pending_len < self._need:
+            return []  # an incomplete value is waiting; don't re-decode it for every small chunk
+        self._buf = self._buf[self._pos:] + "".join(self._pending)
+        self._pos = 0
+        self._pending.clear()
+        self._pending_len = 0
+        self._need = 0
+        items: List[Any] = []
+        while not self.done:
+            if not self._step(items, final):
+                break
+        if self.done:
+            self._buf = ""
+            self._pos = 0
+        return items
+
+    def _peek(self):
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buf[pos] if pos < len(buf) else None
+
+    def _value(self, final: bool) -> Any:
+        """Decode the next complete value, or return _NEED_MORE."""
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            end = len(self._buf)
+        if not final and (end == len(self._buf) or self._buf[end] not in _VALUE_END):
+            # Incomplete, or a number cut at a chunk boundary ("1." / "1e"
+            # decode as 1): wait until the unparsed text has doubled so
+            # large values decode in O(n).
+            self._need = 2 * (len(self._buf) - self._pos)
+            return _NEED_MORE
+        self._pos = end
+        return value
+
+    def _step(self, items: List[Any], final: bool) -> bool:
+        """Advance the state machine by one token; False means more input is needed."""
+        ch = self._peek()
+        if ch is None:
+            return False
+        state = self._state
+        if state == "open":
+            self._pos += 1
+            if ch == "[" and self._depth == len(self.path):
+                self._state = "item"
+            elif ch == "{" and self._depth < len(self.path):
+                self._state = "key"
+            else:
+                self.done = True  # path leads to a scalar/null
+        elif state in ("key", "item"):
+            if ch in "}]":
+                self.done = True  # key not present / end of array
+                return True
+            value = self._value(final)
+            if value is _NEED_MORE:
+                return False
+            if state == "item":
+                items.append(value)
+                self.items += 1
+                self._state = "item_sep"
+            else:
+                self._key = value
+                self._state = "colon"
+        elif state == "colon":
+            if ch != ":":
+                raise ValueError(f"Expected ':' at offset {self._pos}")
+            self._pos += 1
+            if self._key == self.path[self._depth]:
+                self._depth += 1
+                self._state = "open"
+            else:
+                self._state = "skip"
+        elif state == "skip":
+            if self._value(final) is _NEED_MORE:
+                return False
+            self._state = "key_sep"
+        else:  # key_sep / item_sep
+            self._pos += 1
+            if ch == ",":
+                self._state = "key" if state == "key_sep" else "item"
+            elif ch in "}]":
+                self.done = True
+            else:
+                raise ValueError(f"Expected ',' at offset {self._pos - 1}")
+        return True
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Sequence[str] = ("events",)) -> Iterator[Any]:
+    """Yield the items of the array at `path` while `chunks` are still arriving."""
+    parser = ArrayItemParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], path: Sequence[str] = ("events",)) -> AsyncIterator[Any]:
+    """asyncio version of iter_json_array()."""
+    parser = ArrayItemParser(path)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -0,0 +1,382 @@
+"""
+HTTP transports for the SofaScore API wrapper.
+
+A transport turns (url, headers) into a Response, or with `stream()` into a
+StreamResponse whose body is read chunk by chunk. Two are provided:
+- UrllibTransport: one urllib.request.urlopen connection per call (the
+  original behaviour, kept for comparison and as a fallback).
+- PooledTransport: bounded, thread-safe pool of persistent per-host
+  keep-alive connections built on http.client.
+
+No external dependencies. Brotli ("br") responses are decoded only when the
+optional `brotli` package is installed; otherwise "br" is not advertised.
+"""
+
+import gzip
+import http.client
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+try:  # optional
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class Response:
+    """Minimal HTTP response: status, lower-cased headers and decoded body."""
+
+    __slots__ = ("url", "status", "reason", "headers", "body")
+
+    def __init__(self, url: str, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self) -> str:
+        return f"<Response {self.status} {self.url} ({len(self.body)} bytes)>"
+
+
+def accept_encoding() -> str:
+    """Value for the Accept-Encoding header based on available decoders."""
+    return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+def decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Undo gzip/deflate/br content encoding."""
+    encoding = (content_encoding or "").strip().lower()
+    if not body or encoding in ("", "identity"):
+        return body
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("Received brotli-encoded body but the 'brotli' package is not installed")
+        return brotli.decompress(body)
+    raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+class StreamDecoder:
+    """Incremental decode_body(): feed raw chunks, get decoded bytes back."""
+
+    def __init__(self, content_encoding: Optional[str]):
+        encoding = (content_encoding or "").strip().lower()
+        self._identity = encoding in ("", "identity")
+        self._decompress: Optional[Callable[[bytes], bytes]] = None  # deflate: chosen on the first chunk
+        if encoding in ("gzip", "x-gzip"):
+            self._decompress = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+        elif encoding == "br":
+            if brotli is None:
+                raise ValueError("Received brotli-encoded body but the 'brotli' package is not installed")
+            self._decompress = brotli.Decompressor().process
+        elif not self._identity and encoding != "deflate":
+            raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+
+    def decode(self, chunk: bytes) -> bytes:
+        if self._identity:
+            return chunk
+        if self._decompress is None:
+            # Some servers send raw deflate without the zlib header
+            d = zlib.decompressobj()
+            try:
+                data = d.decompress(chunk)
+            except zlib.error:
+                d = zlib.decompressobj(-zlib.MAX_WBITS)
+                data = d.decompress(chunk)
+            self._decompress = d.decompress
+            return data
+        return self._decompress(chunk)
+
+
+def iter_decoded(chunks: Iterable[bytes], content_encoding: Optional[str]) -> Iterator[bytes]:
+    """Streaming counterpart of decode_body()."""
+    decoder = StreamDecoder(content_encoding)
+    for chunk in chunks:
+        data = decoder.decode(chunk)
+        if data:
+            yield data
+
+
+class StreamResponse:
+    """Response whose body is consumed incrementally via iter_content().
+
+    The underlying connection is released once the body has been read to
+    the end or close() is called; use it as a context manager.
+    """
+
+    __slots__ = ("url", "status", "reason", "headers", "_raw", "_close")
+
+    def __init__(self, url: str, status: int, reason: str, headers: Dict[str, str],
+                 raw: Iterable[bytes], close: Optional[Callable[[], None]] = None):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._raw = raw
+        self._close = close
+
+    def _iter_raw(self) -> Iterator[bytes]:
+        try:
+            yield from self._raw
+        finally:
+            self.close()
+
+    def iter_content(self) -> Iterator[bytes]:
+        """Decoded body chunks as they arrive from the socket."""
+        return iter_decoded(self._iter_raw(), self.headers.get("content-encoding"))
+
+    def read(self) -> bytes:
+        return b"".join(self.iter_content())
+
+    def close(self) -> None:
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "StreamResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<StreamResponse {self.status} {self.url}>"
+
+
+def _iter_read(resp, size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Chunks of an http.client / urllib response as soon as they are available."""
+    while True:
+        chunk = resp.read1(size)
+        if not chunk:
+            resp.read()  # marks a fully read Content-Length body as closed so the connection can be reused
+            return
+        yield chunk
+
+
+def _lower_headers(items) -> Dict[str, str]:
+    return {k.lower(): v for k, v in items}
+
+
+class Transport:
+    """Base transport. Subclasses implement `request` and may override `stream`."""
+
+    def request(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> Response:
+        raise NotImplementedError
+
+    def stream(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> StreamResponse:
+        """Like request() but the body is read incrementally. The default buffers it."""
+        response = self.request(url, headers, timeout)
+        resp_headers = {k: v for k, v in response.headers.items() if k != "content-encoding"}
+        return StreamResponse(response.url, response.status, response.reason, resp_headers, (response.body,))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class UrllibTransport(Transport):
+    """New TCP (and TLS) connection for every request via urllib."""
+
+    def request(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> Response:
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                resp_headers = _lower_headers(resp.headers.items())
+                body = decode_body(resp.read(), resp_headers.get("content-encoding"))
+                return Response(resp.geturl(), resp.status, resp.reason, resp_headers, body)
+        except urllib.error.HTTPError as e:
+            resp_headers = _lower_headers(e.headers.items()) if e.headers else {}
+            body = decode_body(e.read() or b"", resp_headers.get("content-encoding"))
+            return Response(url, e.code, str(e.reason), resp_headers, body)
+
+    def stream(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> StreamResponse:
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            resp = urllib.request.urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            resp = e
+        resp_headers = _lower_headers(resp.headers.items()) if resp.headers else {}
+        return StreamResponse(resp.geturl(), resp.status, str(resp.reason), resp_headers, _iter_read(resp), resp.close)
+
+
+class PooledTransport(Transport):
+    """Persistent keep-alive connections, pooled per (scheme, host, port).
+
+    - `max_per_host` bounds the number of open connections per host; callers
+      beyond that wait for a connection to be returned.
+    - Idle connections older than `idle_timeout` seconds are closed instead
+      of reused.
+    - A request on a reused connection that the server already closed is
+      retried once on a fresh connection.
+    """
+
+    def __init__(self, max_per_host: int = 8, idle_timeout: float = 30.0, timeout: Optional[float] = 20.0):
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be >= 1")
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str, int], Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._slots: Dict[Tuple[str, str, int], threading.BoundedSemaphore] = {}
+        self._closed = False
+
+    # ---------- pool bookkeeping ----------
+
+    def _slot(self, key: Tuple[str, str, int]) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._slots.get(key)
+            if sem is None:
+                sem = self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return sem
+
+    def _checkout(self, key: Tuple[str, str, int], timeout: Optional[float]) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _checkin(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if self._closed:
+                conn.close()
+                return
+            self._idle.setdefault(key, deque()).append((conn, time.monotonic()))
+
+    def idle_connections(self) -> int:
+        """Number of idle connections currently held by the pool."""
+        with self._lock:
+            return sum(len(d) for d in self._idle.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for idle in self._idle.values():
+                while idle:
+                    idle.pop()[0].close()
+            self._idle.clear()
+
+    # ---------- requests ----------
+
+    def request(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> Response:
+        if timeout is None:
+            timeout = self.timeout
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request_once(url, headers, timeout)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response
+            url = urllib.parse.urljoin(url, location)
+        return response
+
+    def stream(self, url: str, headers: Dict[str, str], timeout: Optional[float] = None) -> StreamResponse:
+        """The connection stays checked out (and counts against max_per_host)
+        until the body is fully read or the StreamResponse is closed."""
+        if timeout is None:
+            timeout = self.timeout
+        for hop in range(MAX_REDIRECTS + 1):
+            key, conn, resp = self._open(url, headers, timeout)
+            resp_headers = _lower_headers(resp.getheaders())
+            location = resp_headers.get("location")
+            if resp.status in REDIRECT_CODES and location and hop < MAX_REDIRECTS:
+                try:
+                    resp.read()
+                finally:
+                    self._release(key, conn, resp)
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return StreamResponse(url, resp.status, resp.reason, resp_headers, _iter_read(resp),
+                                  lambda: self._release(key, conn, resp))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _request_once(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> Response:
+        key, conn, resp = self._open(url, headers, timeout)
+        try:
+            raw = resp.read()
+        finally:
+            self._release(key, conn, resp)
+        resp_headers = _lower_headers(resp.getheaders())
+        body = decode_body(raw, resp_headers.get("content-encoding"))
+        return Response(url, resp.status, resp.reason, resp_headers, body)
+
+    def _open(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> Tuple[Tuple[str, str, int], http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send the request on a pooled connection and read the response head.
+        Holds a host slot until _release()."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        req_headers = dict(headers)
+        if not any(k.lower() == "accept-encoding" for k in req_headers):
+            req_headers["Accept-Encoding"] = accept_encoding()
+
+        slot = self._slot(key)
+        slot.acquire()
+        try:
+            for attempt in range(2):
+                conn, reused = self._checkout(key, timeout)
+                try:
+                    conn.request("GET", path, headers=req_headers)
+                    return key, conn, conn.getresponse()
+                except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError):
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue  # server dropped an idle keep-alive socket
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+            raise ConnectionError(f"Connection to {key[1]}:{key[2]} failed")  # pragma: no cover
+        except BaseException:
+            slot.release()
+            raise
+
+    def _release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+        """Return the connection to the pool if its response was read to the end, else close it."""
+        try:
+            if resp.isclosed() and not resp.will_close:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+        finally:
+            self._slot(key).release()
@@ -3,11 +3,16 @@
 FastAPI server for SofaScore API functions
 """
 
-from fastapi import FastAPI, HTTPException, Query, Path
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Query, Path, Request
+from fastapi.responses import JSONResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, Dict, Any
 import sofascore
+import browser_pool
+import image_cache
+import session_manager
+from response_cache import ResponseCache
+from upstream_executor import UpstreamExecutor, UpstreamTimeout
 import uvicorn
 import os
 from datetime import datetime
@@ -43,6 +48,29 @@ def handle_api_call(func, *args, **kwargs):
     except Exception as e:
         return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
 
+# Blocking sofascore calls run in a thread pool, never on the event loop
+upstream = UpstreamExecutor()
+
+# Upstream responses are cached per sofascore function (TTLs in response_cache.ROUTE_TTLS)
+response_cache = ResponseCache()
+
+async def run_api_call(func, *args):
+    """handle_api_call in the upstream thread pool, within func's concurrency limit and timeout"""
+    try:
+        return await upstream.run(func.__name__, handle_api_call, func, *args)
+    except UpstreamTimeout as e:
+        return {"success": False, "error": str(e)}
+
+async def cached_api_call(func, *args):
+    """run_api_call behind the stale-while-revalidate response cache"""
+    return await response_cache.respond(func.__name__, args, lambda: run_api_call(func, *args))
+
+@app.on_event("shutdown")
+async def shutdown_upstream():
+    upstream.shutdown()
+    browser_pool.default_pool().shutdown()
+    image_cache.default_cache().close()
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -69,11 +97,22 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Response cache counters"""
+    return response_cache.stats()
+
+@app.get("/upstream/stats")
+async def upstream_stats():
+    """Upstream call counters per sofascore function, SofaScore session/browser pool and image cache usage"""
+    return dict(upstream.stats(), sessions=session_manager.default_pool().stats(),
+                browsers=browser_pool.default_pool().stats(), images=image_cache.default_cache().stats())
+
 # Football data endpoints
 @app.get("/football/categories")
 async def get_football_categories():
     """Get football categories"""
-    return handle_api_call(sofascore.get_football_categories)
+    return await cached_api_call(sofascore.get_football_categories)
 
 @app.get("/football/events/scheduled")
 async def get_scheduled_events(
@@ -83,14 +122,14 @@ async def get_scheduled_events(
     try:
         # Validate date format
         datetime.strptime(date, "%Y-%m-%d")
-        return handle_api_call(sofascore.get_scheduled_events, date)
+        return await cached_api_call(sofascore.get_scheduled_events, date)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
 @app.get("/football/events/new")
 async def get_newly_added_events():
     """Get newly added football events"""
-    return handle_api_call(sofascore.get_newly_added_events)
+    return await cached_api_call(sofascore.get_newly_added_events)
 
 @app.get("/football/player/heatmap")
 async def get_player_heatmap(
@@ -98,26 +137,26 @@ async def get_player_heatmap(
     player_id: int = Query(..., description="Player ID")
 ):
     """Get player heatmap data for a specific event"""
-    return handle_api_call(sofascore.get_player_heatmap, event_id, player_id)
+    return await cached_api_call(sofascore.get_player_heatmap, event_id, player_id)
 
 @app.get("/football/event/details")
 async def get_event_details(
     event_id: int = Query(..., description="Event ID")
 ):
     """Get detailed information about a specific event"""
-    return handle_api_call(sofascore.get_event_details, event_id)
+    return await cached_api_call(sofascore.get_event_details, event_id)
 
 @app.get("/football/event/lineups")
 async def get_lineups(
     event_id: int = Query(..., description="Event ID")
 ):
     """Get lineups for a specific event"""
-    return handle_api_call(sofascore.get_lineups, event_id)
+    return await cached_api_call(sofascore.get_lineups, event_id)
 
 @app.get("/football/tournaments")
 async def get_football_tournaments():
     """Get football tournaments"""
-    return handle_api_call(sofascore.get_football_tournaments)
+    return await cached_api_call(sofascore.get_football_tournaments)
 
 @app.get("/football/tournament/standings")
 async def get_tournament_standing(
@@ -125,7 +164,7 @@ async def get_tournament_standing(
     season_id: int = Query(..., description="Season ID")
 ):
     """Get tournament standings"""
-    return handle_api_call(sofascore.get_tournament_standing, tournament_id, season_id)
+    return await cached_api_call(sofascore.get_tournament_standing, tournament_id, season_id)
 
 @app.get("/football/tournament/schedule")
 async def get_tournament_schedule(
@@ -133,29 +172,29 @@ async def get_tournament_schedule(
     season_id: int = Query(..., description="Season ID")
 ):
     """Get tournament schedule"""
-    return handle_api_call(sofascore.get_tournament_schedule, tournament_id, season_id)
+    return await cached_api_call(sofascore.get_tournament_schedule, tournament_id, season_id)
 
 @app.get("/football/tournament/featured")
 async def get_tournament_featured_events(
     tournament_id: int = Query(..., description="Tournament ID")
 ):
     """Get featured events for a tournament"""
-    return handle_api_call(sofascore.get_tournament_featured_events, tournament_id)
+    return await cached_api_call(sofascore.get_tournament_featured_events, tournament_id)
 
 @app.get("/football/trending/players")
 async def get_football_trending_players():
     """Get trending football players"""
-    return handle_api_call(sofascore.get_football_trending_players)
+    return await cached_api_call(sofascore.get_football_trending_players)
 
 @app.get("/football/suggestions")
 async def get_football_suggestions():
     """Get football suggestions"""
-    return handle_api_call(sofascore.get_football_suggestions)
+    return await cached_api_call(sofascore.get_football_suggestions)
 
 @app.get("/football/live/categories")
 async def get_football_live_categories():
     """Get live football categories"""
-    return handle_api_call(sofascore.get_football_live_categories)
+    return await cached_api_call(sofascore.get_football_live_categories)
 
 # Player and team data endpoints
 @app.get("/football/player/statistics")
@@ -165,14 +204,14 @@ async def get_player_statistics(
     season_id: int = Query(..., description="Season ID")
 ):
     """Get player statistics"""
-    return handle_api_call(sofascore.get_player_statistics, player_id, tournament_id, season_id)
+    return await cached_api_call(sofascore.get_player_statistics, player_id, tournament_id, season_id)
 
 @app.get("/football/player/transfer-history")
 async def get_player_transfer_history(
     player_id: int = Query(..., description="Player ID")
 ):
     """Get player transfer history"""
-    return handle_api_call(sofascore.get_player_transfer_history, player_id)
+    return await cached_api_call(sofascore.get_player_transfer_history, player_id)
 
 @app.get("/football/team/statistics")
 async def get_team_statistics(
@@ -181,7 +220,7 @@ async def get_team_statistics(
     season_id: int = Query(..., description="Season ID")
 ):
     """Get team statistics"""
-    return handle_api_call(sofascore.get_team_statistics, team_id, tournament_id, season_id)
+    return await cached_api_call(sofascore.get_team_statistics, team_id, tournament_id, season_id)
 
 @app.get("/football/team/events")
 async def get_team_events(
@@ -189,37 +228,51 @@ async def get_team_events(
     last: int = Query(5, description="Number of last events to fetch")
 ):
     """Get team events"""
-    return handle_api_call(sofascore.get_team_events, team_id, last)
+    return await cached_api_call(sofascore.get_team_events, team_id, last)
 
 @app.get("/football/team-of-the-week")
 async def get_team_of_the_week():
     """Get team of the week"""
-    return handle_api_call(sofascore.get_team_of_the_week)
+    return await cached_api_call(sofascore.get_team_of_the_week)
 
 @app.get("/football/fan-ranking")
 async def get_fan_ranking():
     """Get fan ranking"""
-    return handle_api_call(sofascore.get_fan_ranking)
+    return await cached_api_call(sofascore.get_fan_ranking)
 
 @app.get("/football/event-count")
 async def get_event_count():
     """Get event count"""
-    return handle_api_call(sofascore.get_event_count)
+    return await cached_api_call(sofascore.get_event_count)
+
+async def cached_image(func, item_id):
+    """Image path from the cache; only misses and expired images take an upstream slot"""
+    # a fresh hit is a dict lookup and a stat, cheap enough for the event loop
+    return func(item_id, cached_only=True) or await upstream.run(func.__name__, func, item_id)
+
+def image_response(request: Request, image_path: str, filename: str):
+    """Serve a cached image with its content-hash ETag; 304 when the client already has it"""
+    headers = {"ETag": image_cache.etag_for(image_path), "Cache-Control": image_cache.CACHE_CONTROL}
+    if headers["ETag"] in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        path=image_path,
+        media_type=image_cache.media_type_for(image_path),
+        filename=filename + os.path.splitext(image_path)[1],
+        headers=headers
+    )
 
 # Image download endpoints
 @app.get("/images/player/download")
 async def download_player_image(
+    request: Request,
     player_id: int = Query(..., description="Player ID")
 ):
     """Download player image"""
     try:
-        image_path = sofascore.download_player_image(player_id)
+        image_path = await cached_image(sofascore.download_player_image, player_id)
         if image_path and os.path.exists(image_path):
-            return FileResponse(
-                path=image_path,
-                media_type="image/png",
-                filename=f"player_{player_id}.png"
-            )
+            return image_response(request, image_path, f"player_{player_id}")
         else:
             raise HTTPException(status_code=404, detail="Player image not found or download failed")
     except Exception as e:
@@ -227,17 +280,14 @@ async def download_player_image(
 
 @app.get("/images/team/download/full")
 async def download_team_image_full(
+    request: Request,
     team_id: int = Query(..., description="Team ID")
 ):
     """Download full team image"""
     try:
-        image_path = sofascore.download_team_image_full(team_id)
+        image_path = await cached_image(sofascore.download_team_image_full, team_id)
         if image_path and os.path.exists(image_path):
-            return FileResponse(
-                path=image_path,
-                media_type="image/png",
-                filename=f"team_full_{team_id}.png"
-            )
+            return image_response(request, image_path, f"team_full_{team_id}")
         else:
             raise HTTPException(status_code=404, detail="Team image not found or download failed")
     except Exception as e:
@@ -245,17 +295,14 @@ async def download_team_image_full(
 
 @app.get("/images/team/download/small")
 async def download_team_image_small(
+    request: Request,
     team_id: int = Query(..., description="Team ID")
 ):
     """Download small team image"""
     try:
-        image_path = sofascore.download_team_image_small(team_id)
+        image_path = await cached_image(sofascore.download_team_image_small, team_id)
         if image_path and os.path.exists(image_path):
-            return FileResponse(
-                path=image_path,
-                media_type="image/png",
-                filename=f"team_small_{team_id}.png"
-            )
+            return image_response(request, image_path, f"team_small_{team_id}")
         else:
             raise HTTPException(status_code=404, detail="Team image not found or download failed")
     except Exception as e:
@@ -263,17 +310,14 @@ async def download_team_image_small(
 
 @app.get("/images/tournament/download")
 async def download_tournament_image(
+    request: Request,
     tournament_id: int = Query(..., description="Tournament ID")
 ):
     """Download tournament image"""
     try:
-        image_path = sofascore.download_tournament_image(tournament_id)
+        image_path = await cached_image(sofascore.download_tournament_image, tournament_id)
         if image_path and os.path.exists(image_path):
-            return FileResponse(
-                path=image_path,
-                media_type="image/png",
-                filename=f"tournament_{tournament_id}.png"
-            )
+            return image_response(request, image_path, f"tournament_{tournament_id}")
         else:
             raise HTTPException(status_code=404, detail="Tournament image not found or download failed")
     except Exception as e:
@@ -282,17 +326,14 @@ async def download_tournament_image(
 
 @app.get("/images/manager/download")
 async def download_manager_image(
+    request: Request,
     manager_id: int = Query(..., description="Manager ID")
 ):
     """Download manager image"""
     try:
-        image_path = sofascore.download_manager_image(manager_id)
+        image_path = await cached_image(sofascore.download_manager_image, manager_id)
         if image_path and os.path.exists(image_path):
-            return FileResponse(
-                path=image_path,
-                media_type="image/png",
-                filename=f"manager_{manager_id}.png"
-            )
+            return image_response(request, image_path, f"manager_{manager_id}")
         else:
             raise HTTPException(status_code=404, detail="Manager image not found or download failed")
     except Exception as e:
@@ -305,7 +346,7 @@ async def get_tournament_videos(
     season_id: int = Query(..., description="Season ID")
 ):
     """Get tournament videos"""
-    return handle_api_call(sofascore.get_tournament_videos, tournament_id, season_id)
+    return await cached_api_call(sofascore.get_tournament_videos, tournament_id, season_id)
 
 @app.get("/test")
 async def test_endpoint():
@@ -321,7 +362,7 @@ async def test_endpoint():
         
         # Try a simple API call (today's events)
         today = datetime.now().strftime("%Y-%m-%d")
-        events_result = sofascore.get_scheduled_events(today)
+        events_result = await upstream.run("get_scheduled_events", sofascore.get_scheduled_events, today)
         test_results["sample_api_call"] = "success" if events_result else "failed"
         
         return {"success": True, "test_results": test_results}
@@ -335,56 +376,56 @@ async def get_player_profile(
     player_id: int = Path(..., description="Player ID")
 ):
     """Get player profile (Official Path)"""
-    return handle_api_call(sofascore.get_player, player_id)
+    return await cached_api_call(sofascore.get_player, player_id)
 
 @app.get("/team/{team_id}")
 async def get_team_profile(
     team_id: int = Path(..., description="Team ID")
 ):
     """Get team profile (Official Path)"""
-    return handle_api_call(sofascore.get_team, team_id)
+    return await cached_api_call(sofascore.get_team, team_id)
 
 @app.get("/team/{team_id}/players")
 async def get_team_squad(
     team_id: int = Path(..., description="Team ID")
 ):
     """Get team players (Official Path)"""
-    return handle_api_call(sofascore.get_team_players, team_id)
+    return await cached_api_call(sofascore.get_team_players, team_id)
 
 @app.get("/event/{event_id}/h2h")
 async def get_event_h2h(
     event_id: int = Path(..., description="Event ID")
 ):
     """Get H2H (Official Path)"""
-    return handle_api_call(sofascore.get_event_h2h, event_id)
+    return await cached_api_call(sofascore.get_event_h2h, event_id)
 
 @app.get("/event/{event_id}/incidents")
 async def get_event_incidents(
     event_id: int = Path(..., description="Event ID")
 ):
     """Get Incidents (Official Path)"""
-    return handle_api_call(sofascore.get_event_incidents, event_id)
+    return await cached_api_call(sofascore.get_event_incidents, event_id)
 
 @app.get("/search/all")
 async def search_all(
     q: str = Query(..., description="Search query")
 ):
     """Search (Official Path)"""
-    return handle_api_call(sofascore.search, q)
+    return await cached_api_call(sofascore.search, q)
 
 @app.get("/football/tournament/details")
 async def get_tournament_details(
     tournament_id: int = Query(..., description="Tournament ID")
 ):
     """Get tournament details"""
-    return handle_api_call(sofascore.get_tournament_details, tournament_id)
+    return await cached_api_call(sofascore.get_tournament_details, tournament_id)
 
 @app.get("/football/tournament/seasons")
 async def get_tournament_seasons(
     tournament_id: int = Query(..., description="Tournament ID")
 ):
     """Get tournament seasons"""
-    return handle_api_call(sofascore.get_tournament_seasons, tournament_id)
+    return await cached_api_call(sofascore.get_tournament_seasons, tournament_id)
 
 if __name__ == "__main__":
     print("🚀 Starting SofaScore API Server...")
@@ -0,0 +1,298 @@
+"""
+Persistent headless browser pool for the nodriver-backed sofascore.py fetches.
+
+fetch_json_via_nodriver used to launch a Chromium, navigate, sleep a fixed
+3 seconds and stop the browser again for every call, which costs several
+seconds and a few hundred MB of RAM per request. BrowserPool keeps up to
+BROWSER_POOL_SIZE browsers running instead, each with one reusable tab:
+
+- acquire() checks a warm browser out (launching one lazily while the pool
+  is below its size, waiting for a free one otherwise) and release() returns
+  it; `async with pool.browser() as pooled:` does both
+- a browser is health-checked on checkout (a trivial evaluate within
+  BROWSER_HEALTH_TIMEOUT) and replaced if it does not answer
+- a browser is recycled (stopped and relaunched on demand) after
+  BROWSER_MAX_USES navigations, or right away when a fetch fails, so leaks
+  in long-lived renderers stay bounded
+- instead of the fixed sleep, fetch_text() polls the new document until it
+  has finished loading and has a body, up to BROWSER_READY_TIMEOUT
+
+nodriver is asyncio-based while the sofascore functions are called from
+worker threads, so the pool runs its own event loop in a daemon thread and
+fetch() is the blocking entry point for them.
+
+Configuration via environment variables
+- BROWSER_POOL_SIZE (default: 2) — browsers kept warm
+- BROWSER_MAX_USES (default: 50) — navigations before a browser is recycled
+- BROWSER_READY_TIMEOUT (default: 15) — seconds to wait for a page
+- BROWSER_HEALTH_TIMEOUT (default: 5) — seconds for the checkout health check
+- BROWSER_PATH — Chromium/Chrome binary (default: first one found in BROWSER_PATHS)
+"""
+
+import asyncio
+import atexit
+import contextlib
+import os
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import nodriver as uc
+
+BROWSER_POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_USES = int(os.environ.get("BROWSER_MAX_USES", "50"))
+BROWSER_READY_TIMEOUT = float(os.environ.get("BROWSER_READY_TIMEOUT", "15"))
+BROWSER_HEALTH_TIMEOUT = float(os.environ.get("BROWSER_HEALTH_TIMEOUT", "5"))
+BROWSER_PATH = os.environ.get("BROWSER_PATH")
+READY_POLL_SECONDS = 0.05
+
+# Options for headless operation on a server
+BROWSER_ARGS: List[str] = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--headless=new",
+    "--no-first-run",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+]
+
+BROWSER_PATHS: List[str] = [
+    "/snap/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/usr/bin/chromium",
+    "/usr/bin/google-chrome",
+    "/usr/bin/google-chrome-stable",
+]
+
+# Set on the old document before navigating, so readiness is never read off the previous page
+_MARK_STALE = "window.__browserPoolStale = true"
+_READY = ("!window.__browserPoolStale && document.readyState === 'complete'"
+          " && !!document.body && document.body.innerText.length > 0")
+_PRE_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL)
+
+
+def _browser_path() -> Optional[str]:
+    if BROWSER_PATH:
+        return BROWSER_PATH
+    for path in BROWSER_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def extract_json(content: str) -> str:
+    """Unwrap the <pre> Chromium puts around a JSON response."""
+    if content and content.strip().startswith("<html"):
+        match = _PRE_RE.search(content)
+        if match:
+            return match.group(1).strip()
+        print("Warning: HTML response but no JSON found in <pre> tags")
+    return content
+
+
+class BrowserUnavailable(Exception):
+    pass
+
+
+class PooledBrowser:
+    __slots__ = ("browser", "tab", "uses", "started_at")
+
+    def __init__(self, browser: Any):
+        self.browser = browser
+        self.tab: Any = None
+        self.uses = 0
+        self.started_at = time.monotonic()
+
+
+class BrowserPool:
+    """Warm nodriver browsers with checkout/return, health checks and recycling.
+
+    The coroutine methods must run on one event loop; fetch() submits them
+    to the pool's own loop thread and may be called from any thread.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_uses: int = BROWSER_MAX_USES,
+                 ready_timeout: float = BROWSER_READY_TIMEOUT, health_timeout: float = BROWSER_HEALTH_TIMEOUT):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.ready_timeout = ready_timeout
+        self.health_timeout = health_timeout
+        self._idle: List[PooledBrowser] = []
+        self._live = 0
+        self._available: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self.counts = {"fetches": 0, "launches": 0, "recycled": 0, "unhealthy": 0, "errors": 0,
+                       "ready_timeouts": 0}
+
+    # -- checkout / return ---------------------------------------------------
+
+    async def _launch(self) -> PooledBrowser:
+        path = _browser_path()
+        kwargs: Dict[str, Any] = {"browser_args": BROWSER_ARGS, "no_sandbox": True, "headless": True}
+        if path:
+            kwargs["browser_executable_path"] = path
+        self.counts["launches"] += 1
+        return PooledBrowser(await uc.start(**kwargs))
+
+    async def _healthy(self, pooled: PooledBrowser) -> bool:
+        if pooled.tab is None:
+            return True
+        try:
+            return await asyncio.wait_for(pooled.tab.evaluate("1 + 1"), self.health_timeout) == 2
+        except Exception:
+            return False
+
+    async def acquire(self) -> PooledBrowser:
+        """Check out a healthy browser, launching one if the pool has room."""
+        if self._available is None:
+            self._available = asyncio.Condition()
+        while True:
+            async with self._available:
+                while not self._idle and self._live >= self.size:
+                    await self._available.wait()
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    self._live += 1
+            if pooled is None:
+                try:
+                    return await self._launch()
+                except Exception as e:
+                    await self._discard(None)
+                    raise BrowserUnavailable(f"Could not start a browser: {e}") from e
+            if await self._healthy(pooled):
+                return pooled
+            self.counts["unhealthy"] += 1
+            print("Browser failed its health check; replacing it")
+            await self._discard(pooled)
+
+    async def release(self, pooled: PooledBrowser, broken: bool = False) -> None:
+        """Return a browser; broken or worn-out ones are stopped instead."""
+        if broken or pooled.uses >= self.max_uses:
+            self.counts["recycled"] += 1
+            await self._discard(pooled)
+            return
+        async with self._available:
+            self._idle.append(pooled)
+            self._available.notify()
+
+    async def _discard(self, pooled: Optional[PooledBrowser]) -> None:
+        if pooled is not None:
+            await _stop(pooled.browser)
+        async with self._available:
+            self._live -= 1
+            self._available.notify()
+
+    @contextlib.asynccontextmanager
+    async def browser(self) -> AsyncIterator[PooledBrowser]:
+        pooled = await self.acquire()
+        broken = True
+        try:
+            yield pooled
+            broken = False
+        finally:
+            await self.release(pooled, broken=broken)
+
+    # -- fetching --------------------------------------------------------------
+
+    async def _wait_ready(self, tab: Any) -> None:
+        deadline = time.monotonic() + self.ready_timeout
+        while True:
+            try:
+                if await tab.evaluate(_READY):
+                    return
+            except Exception:
+                pass  # the document is being replaced; ask again
+            if time.monotonic() >= deadline:
+                self.counts["ready_timeouts"] += 1
+                print(f"Page not ready after {self.ready_timeout:g}s; reading it anyway")
+                return
+            await asyncio.sleep(READY_POLL_SECONDS)
+
+    async def fetch_text(self, url: str) -> str:
+        """Navigate a pooled tab to url and return the page body (JSON unwrapped)."""
+        self.counts["fetches"] += 1
+        try:
+            async with self.browser() as pooled:
+                pooled.uses += 1
+                if pooled.tab is None:
+                    pooled.tab = await pooled.browser.get(url)
+                else:
+                    await pooled.tab.evaluate(_MARK_STALE)
+                    await pooled.tab.get(url)
+                await self._wait_ready(pooled.tab)
+                return extract_json(await pooled.tab.get_content())
+        except Exception as e:
+            self.counts["errors"] += 1
+            print(f"Error in browser automation: {e}")
+            raise
+
+    # -- blocking entry point --------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def fetch(self, url: str) -> str:
+        """Blocking fetch_text() for the sofascore functions; safe from any thread."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self.fetch_text(url), loop).result()
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.counts, live=self._live, idle=len(self._idle))
+
+    async def close(self) -> None:
+        while self._idle:
+            await _stop(self._idle.pop().browser)
+            self._live -= 1
+
+    def shutdown(self) -> None:
+        """Stop every idle browser and the loop thread."""
+        with self._thread_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result(timeout=10)
+        except Exception as e:
+            print(f"Warning: Error stopping browsers: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+
+
+async def _stop(browser: Any) -> None:
+    # stop() is synchronous in current nodriver releases, a coroutine in some older ones
+    try:
+        result = browser.stop()
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as e:
+        print(f"Warning: Error stopping browser: {e}")
+
+
+_default_pool: Optional[BrowserPool] = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> BrowserPool:
+    global _default_pool
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = BrowserPool()
+                atexit.register(_default_pool.shutdown)
+    return _default_pool
+
+
+def fetch(url: str) -> str:
+    """BrowserPool.fetch() on the process-wide pool."""
+    return default_pool().fetch(url)
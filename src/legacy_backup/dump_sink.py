@@ -0,0 +1,176 @@
+"""
+Pluggable sink for the JSON copies sofascore.py fetchers keep of their responses.
+
+The fetchers used to pretty-print every response into a file in the working
+directory on the request path (scheduled_events.json, team_events_*.json,
+...), with concurrent requests racing on the same filename. They now hand the
+already-parsed body to dump(), and the configured sink decides what happens:
+
+- "off" (the default, and what the API server wants): nothing is written
+- "sync": the file is written before dump() returns
+- "async": a background thread writes it; if the same file is dumped again
+  before it is written, only the newest body is kept
+
+Files are written to a temporary file in the same directory and moved into
+place with os.replace(), so a reader never sees a half-written file and
+concurrent writers cannot interleave. set_sink() installs any object with a
+dump(filename, data) method instead.
+
+Configuration via environment variables
+- SOFASCORE_DUMP (default: off) — off | sync | async
+- SOFASCORE_DUMP_DIR (default: .) — directory the files are written to
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DUMP_MODE = os.environ.get("SOFASCORE_DUMP", "off").lower()
+DUMP_DIR = os.environ.get("SOFASCORE_DUMP_DIR", ".")
+
+
+class NullSink:
+    """Discards every dump."""
+
+    def dump(self, filename: str, data: Any) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": "off"}
+
+
+class FileSink:
+    """Writes each dump as indented JSON, atomically, before returning."""
+
+    mode = "sync"
+
+    def __init__(self, directory: str = DUMP_DIR, indent: Optional[int] = 4):
+        self.directory = directory
+        self.indent = indent
+        self.counts = {"dumps": 0, "written": 0, "errors": 0}
+        self._counts_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._counts_lock:
+            self.counts[key] += 1
+
+    def dump(self, filename: str, data: Any) -> None:
+        self._count("dumps")
+        self._write(filename, data)
+
+    def _write(self, filename: str, data: Any) -> None:
+        path = os.path.join(self.directory, filename)
+        tmp_path = None
+        try:
+            body = json.dumps(data, indent=self.indent, ensure_ascii=False)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{filename}.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+            self._count("written")
+        except Exception as e:
+            self._count("errors")
+            print(f"Could not write {path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counts_lock:
+            return dict(self.counts, mode=self.mode, directory=self.directory)
+
+
+class AsyncFileSink(FileSink):
+    """FileSink whose writes happen on a background thread, coalesced per filename."""
+
+    mode = "async"
+
+    def __init__(self, directory: str = DUMP_DIR, indent: Optional[int] = 4):
+        super().__init__(directory, indent)
+        self.counts["coalesced"] = 0
+        self._pending: "OrderedDict[str, Any]" = OrderedDict()
+        self._writing = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="dump-sink", daemon=True)
+        self._thread.start()
+
+    def dump(self, filename: str, data: Any) -> None:
+        self._count("dumps")
+        with self._cond:
+            if filename in self._pending:
+                self._count("coalesced")
+            self._pending[filename] = data
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                filename, data = self._pending.popitem(last=False)
+                self._writing += 1
+            try:
+                self._write(filename, data)
+            finally:
+                with self._cond:
+                    self._writing -= 1
+                    self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every pending dump is written; False if the timeout ran out first."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self, timeout: Optional[float] = 10) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._pending)
+        return dict(super().stats(), pending=pending)
+
+
+def _default_sink() -> Any:
+    if DUMP_MODE == "sync":
+        return FileSink()
+    if DUMP_MODE == "async":
+        sink = AsyncFileSink()
+        atexit.register(sink.close)
+        return sink
+    if DUMP_MODE not in ("off", "0", "false", "no", ""):
+        print(f"Unknown SOFASCORE_DUMP={DUMP_MODE!r}; response dumps are off")
+    return NullSink()
+
+
+_sink: Any = None
+_sink_lock = threading.Lock()
+
+
+def get_sink() -> Any:
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = _default_sink()
+    return _sink
+
+
+def set_sink(sink: Any) -> None:
+    """Install the sink every later dump() goes to (NullSink() turns dumps off)."""
+    global _sink
+    with _sink_lock:
+        _sink = sink
+
+
+def dump(filename: str, data: Any) -> None:
+    """Hand a parsed response body to the configured sink."""
+    get_sink().dump(filename, data)
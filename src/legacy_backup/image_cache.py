@@ -0,0 +1,346 @@
+"""
+On-disk image cache for the img.sofascore.com downloads in sofascore.py.
+
+The download_* functions used to fetch the image on every call and write it
+to a fixed file in the working directory (player_{id}.png, which the full
+team image shared with player images), where concurrent requests clobbered
+each other. ImageCache.get() stores images instead as
+
+- content-addressed blobs: blobs/<sha[:2]>/<sha256>.<ext>, written to a
+  temporary file and moved into place, so a blob never changes once it is
+  visible and identical images (placeholders) are stored once
+- an index from image key ("player/187753/image") to blob, fetch time and
+  the upstream ETag/Last-Modified, persisted as index.json
+
+An entry younger than IMAGE_CACHE_TTL is served without touching the
+network. An older one is revalidated with a conditional request (a 304 only
+bumps its fetch time), and kept being served if the refresh fails. A cold
+or expired key is fetched by one thread only; concurrent callers for the
+same key wait for that fetch. Blobs are evicted least recently used first
+once the cache grows beyond IMAGE_CACHE_MAX_MB. A dropped blob is unlinked
+only BLOB_UNLINK_GRACE seconds later, so a response that was just handed its
+path can still send it; an entry whose blob is gone anyway is refetched.
+
+cached() is the network-free lookup for fresh entries, cheap enough for
+api_server.py to call on its event loop before it spends an upstream slot.
+
+The blob's hash doubles as the ETag api_server.py sends, see etag_for().
+
+Configuration via environment variables
+- IMAGE_CACHE_DIR (default: image_cache) — cache directory
+- IMAGE_CACHE_TTL (default: 86400) — seconds before an image is revalidated
+- IMAGE_CACHE_MAX_MB (default: 512) — disk cap for the blobs
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import session_manager
+
+IMAGE_CACHE_DIR = os.environ.get("IMAGE_CACHE_DIR", "image_cache")
+IMAGE_CACHE_TTL = int(os.environ.get("IMAGE_CACHE_TTL", "86400"))
+IMAGE_CACHE_MAX_BYTES = int(float(os.environ.get("IMAGE_CACHE_MAX_MB", "512")) * 1024 * 1024)
+INDEX_SAVE_INTERVAL = 5
+BLOB_UNLINK_GRACE = 60  # seconds a dropped blob stays on disk for responses still sending it
+
+# Cache-Control for served images: browsers revalidate with the ETag once it runs out
+CACHE_CONTROL = f"public, max-age={IMAGE_CACHE_TTL}"
+
+# upstream Content-Type -> blob extension
+EXTENSIONS: Dict[str, str] = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/avif": "avif",
+    "image/gif": "gif",
+    "image/svg+xml": "svg",
+}
+MEDIA_TYPES: Dict[str, str] = {ext: media_type for media_type, ext in EXTENSIONS.items()}
+
+
+def etag_for(path: str) -> str:
+    """Strong ETag of a cached blob: its content hash, taken from the file name."""
+    return '"%s"' % os.path.splitext(os.path.basename(path))[0]
+
+
+def media_type_for(path: str) -> str:
+    return MEDIA_TYPES.get(os.path.splitext(path)[1].lstrip("."), "image/png")
+
+
+def _fetch(url: str, headers: Dict[str, str]) -> Any:
+    return session_manager.get_image(url, headers=headers)
+
+
+class ImageCache:
+    """Content-addressed, LRU-capped image store with single-flight fetching; thread-safe."""
+
+    def __init__(self, directory: str = IMAGE_CACHE_DIR, ttl: int = IMAGE_CACHE_TTL,
+                 max_bytes: int = IMAGE_CACHE_MAX_BYTES, fetch: Optional[Callable[[str, Dict[str, str]], Any]] = None):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.fetch = fetch or _fetch
+        self.index_path = os.path.join(directory, "index.json")
+        self._index: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # key -> entry, LRU order
+        self._blobs: "OrderedDict[str, int]" = OrderedDict()  # blob name -> size, LRU order
+        self._refs: Dict[str, set] = {}  # blob name -> keys pointing at it
+        self._bytes = 0
+        self._doomed: Deque[Tuple[float, str]] = deque()  # (unlink after, blob), see _drop_blob
+        self._inflight: Dict[str, "Future[Optional[str]]"] = {}
+        self._mutex = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = 0.0
+        self.counts = {"hit": 0, "miss": 0, "revalidated": 0, "refreshed": 0, "stale_served": 0,
+                       "coalesced": 0, "errors": 0, "evicted": 0}
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self._load()
+
+    # -- index -----------------------------------------------------------------
+
+    def _blob_path(self, blob: str) -> str:
+        return os.path.join(self.directory, "blobs", blob[:2], blob)
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Image cache index {self.index_path} unreadable, starting empty: {e}")
+            return
+        for key, entry in entries.items():  # saved in LRU order
+            blob = entry["blob"]
+            if blob not in self._blobs:
+                try:
+                    size = os.path.getsize(self._blob_path(blob))
+                except OSError:
+                    continue
+                self._blobs[blob] = size
+                self._bytes += size
+            self._blobs.move_to_end(blob)
+            self._refs.setdefault(blob, set()).add(key)
+            self._index[key] = entry
+
+    def save(self, force: bool = True) -> None:
+        """Write index.json atomically; without force only if dirty and not saved recently."""
+        with self._save_lock:
+            with self._mutex:
+                if not self._dirty or (not force and time.monotonic() - self._saved_at < INDEX_SAVE_INTERVAL):
+                    return
+                body = json.dumps(self._index, separators=(",", ":"))
+                self._dirty = False
+                self._saved_at = time.monotonic()
+            try:
+                self._write_atomic(self.index_path, body.encode("utf-8"))
+            except OSError as e:
+                self._dirty = True
+                print(f"Could not save image cache index: {e}")
+
+    @staticmethod
+    def _write_atomic(path: str, content: bytes) -> None:
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # -- lookups -----------------------------------------------------------------
+
+    def _touch(self, key: str, entry: Dict[str, Any]) -> None:
+        self._index.move_to_end(key)
+        if entry["blob"] in self._blobs:
+            self._blobs.move_to_end(entry["blob"])
+
+    def _usable(self, entry: Optional[Dict[str, Any]]) -> bool:
+        # a blob removed behind the cache's back is treated as a miss and refetched
+        return (entry is not None and entry["blob"] in self._blobs
+                and os.path.exists(self._blob_path(entry["blob"])))
+
+    def cached(self, key: str) -> Optional[str]:
+        """Path of a fresh cached image for key, or None; never touches the network."""
+        with self._mutex:
+            entry = self._index.get(key)
+            if not self._usable(entry) or time.time() - entry["fetched_at"] >= self.ttl:
+                return None
+            self._touch(key, entry)
+            self.counts["hit"] += 1
+            return self._blob_path(entry["blob"])
+
+    def get(self, key: str, url: str) -> Optional[str]:
+        """Path of the cached image for key, fetching url when it is missing or expired.
+
+        Returns None when the image is neither cached nor downloadable.
+        """
+        path = self.cached(key)
+        if path is not None:
+            return path
+        with self._mutex:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[key] = Future()
+            else:
+                self.counts["coalesced"] += 1
+        if not leader:
+            return pending.result()
+        try:
+            path = self._refresh(key, url)
+            pending.set_result(path)
+            return path
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._mutex:
+                del self._inflight[key]
+            self.save(force=False)
+
+    def _refresh(self, key: str, url: str) -> Optional[str]:
+        with self._mutex:
+            entry = self._index.get(key)
+            if not self._usable(entry):
+                entry = None
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            response = self.fetch(url, headers)
+        except Exception as e:
+            print(f"Error downloading image {url}: {e}")
+            response = None
+
+        if response is not None and response.status_code == 304 and entry is not None:
+            with self._mutex:
+                entry["fetched_at"] = time.time()
+                self._touch(key, entry)
+                self._dirty = True
+                self.counts["revalidated"] += 1
+            return self._blob_path(entry["blob"])
+        if response is not None and response.status_code == 200 and response.content:
+            return self._store(key, response, refreshed=entry is not None)
+
+        with self._mutex:
+            self.counts["errors"] += 1
+            if entry is None:
+                if response is not None:
+                    print(f"Error: {response.status_code}")
+                return None
+            self.counts["stale_served"] += 1
+            return self._blob_path(entry["blob"])
+
+    def _store(self, key: str, response: Any, refreshed: bool) -> str:
+        content = response.content
+        media_type = response.headers.get("Content-Type", "image/png").split(";")[0].strip().lower()
+        blob = f"{hashlib.sha256(content).hexdigest()}.{EXTENSIONS.get(media_type, 'png')}"
+        path = self._blob_path(blob)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write_atomic(path, content)
+        entry = {
+            "blob": blob,
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with self._mutex:
+            old = self._index.get(key)
+            if old is not None and old["blob"] != blob:
+                self._unref(key, old["blob"])
+            self._index[key] = entry
+            self._index.move_to_end(key)
+            if blob not in self._blobs:
+                self._blobs[blob] = len(content)
+                self._bytes += len(content)
+            self._blobs.move_to_end(blob)
+            self._refs.setdefault(blob, set()).add(key)
+            self._dirty = True
+            self.counts["refreshed" if refreshed else "miss"] += 1
+            self._evict()
+            self._reap()
+        return path
+
+    def _unref(self, key: str, blob: str) -> None:
+        keys = self._refs.get(blob)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self._drop_blob(blob)
+
+    def _drop_blob(self, blob: str) -> None:
+        self._bytes -= self._blobs.pop(blob, 0)
+        self._refs.pop(blob, None)
+        self._doomed.append((time.monotonic() + BLOB_UNLINK_GRACE, blob))
+
+    def _reap(self, everything: bool = False) -> None:
+        """Unlink dropped blobs whose grace period is over, unless they were stored again since."""
+        now = time.monotonic()
+        while self._doomed and (everything or self._doomed[0][0] <= now):
+            _, blob = self._doomed.popleft()
+            if blob in self._blobs:
+                continue
+            try:
+                os.unlink(self._blob_path(blob))
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        # the newest blob is never evicted, even if it alone exceeds the cap
+        while self._bytes > self.max_bytes and len(self._blobs) > 1:
+            blob = next(iter(self._blobs))
+            for key in self._refs.get(blob, ()):
+                self._index.pop(key, None)
+            self._drop_blob(blob)
+            self.counts["evicted"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._mutex:
+            return dict(self.counts, keys=len(self._index), blobs=len(self._blobs), bytes=self._bytes,
+                        max_bytes=self.max_bytes, pending_unlinks=len(self._doomed))
+
+    def close(self) -> None:
+        """Save the index and unlink every dropped blob; call once nothing is serving from the cache."""
+        self.save()
+        with self._mutex:
+            self._reap(everything=True)
+
+
+_default_cache: Optional[ImageCache] = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> ImageCache:
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = ImageCache()
+                atexit.register(_default_cache.close)
+    return _default_cache
+
+
+def get(key: str, url: str) -> Optional[str]:
+    """ImageCache.get() on the process-wide cache."""
+    return default_cache().get(key, url)
+
+
+def cached(key: str) -> Optional[str]:
+    """ImageCache.cached() on the process-wide cache."""
+    return default_cache().cached(key)
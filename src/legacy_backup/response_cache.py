@@ -0,0 +1,296 @@
+"""
+Response cache for api_server.py: per-route TTLs with stale-while-revalidate.
+
+Every route's upstream call goes through ResponseCache.respond(), keyed by the
+sofascore function name and its arguments. ROUTE_TTLS gives each function a
+(fresh, stale) pair in seconds:
+
+- younger than `fresh`: served from the cache (X-Cache: HIT)
+- older, but within `fresh + stale`: served from the cache right away and
+  refreshed by a background task (X-Cache: STALE)
+- missing or older: fetched and stored; concurrent requests for the same
+  key wait for that one fetch (X-Cache: MISS)
+
+Only successful results are stored, so an upstream error never replaces a
+good entry; while a refresh keeps failing the stale entry keeps being served
+until its stale window ends. Functions without a TTL are not cached
+(X-Cache: BYPASS). Bodies are stored already JSON-encoded, so a hit is a
+dict lookup and a memory copy.
+
+The cache lives in process memory (LRU, API_CACHE_MAX_ENTRIES entries), or,
+with API_CACHE_REDIS=1, in Redis so that every uvicorn worker shares it; a
+Redis lock makes sure only one worker refreshes a given entry at a time.
+Backends are async (Redis through redis.asyncio), so a slow or unreachable
+Redis delays only the requests that wait on it, never the event loop.
+
+Configuration via environment variables
+- API_CACHE (default: 1) — set to 0 to disable caching
+- API_CACHE_MAX_ENTRIES (default: 5000) — in-memory entries
+- API_CACHE_REDIS (default: 0), REDIS_HOST, REDIS_PORT — shared Redis backend
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi.responses import Response
+
+try:  # optional: only needed with API_CACHE_REDIS=1
+    import redis.asyncio as aioredis  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    aioredis = None
+
+CACHE_ENABLED = os.environ.get("API_CACHE", "1").lower() in ("1", "true", "yes", "y")
+CACHE_MAX_ENTRIES = int(os.environ.get("API_CACHE_MAX_ENTRIES", "5000"))
+CACHE_REDIS = os.environ.get("API_CACHE_REDIS", "0").lower() in ("1", "true", "yes", "y")
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
+REDIS_PREFIX = "api_cache:"
+REFRESH_LOCK_SECONDS = 30
+
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+
+# sofascore function -> (fresh, stale) seconds
+ROUTE_TTLS: Dict[str, Tuple[int, int]] = {
+    # live data
+    "get_football_live_categories": (15, MINUTE),
+    "get_event_count": (15, MINUTE),
+    "get_event_incidents": (15, 2 * MINUTE),
+    "get_event_details": (30, 5 * MINUTE),
+    "get_scheduled_events": (MINUTE, 10 * MINUTE),
+    "get_newly_added_events": (MINUTE, 5 * MINUTE),
+    # match-day data
+    "get_lineups": (2 * MINUTE, HOUR),
+    "get_player_heatmap": (5 * MINUTE, HOUR),
+    "get_tournament_standing": (5 * MINUTE, HOUR),
+    "get_team_events": (5 * MINUTE, HOUR),
+    "search": (5 * MINUTE, HOUR),
+    "get_tournament_schedule": (10 * MINUTE, HOUR),
+    "get_tournament_featured_events": (10 * MINUTE, HOUR),
+    "get_football_trending_players": (10 * MINUTE, HOUR),
+    # reference data
+    "get_football_categories": (HOUR, DAY),
+    "get_football_tournaments": (HOUR, DAY),
+    "get_football_suggestions": (HOUR, DAY),
+    "get_tournament_details": (HOUR, DAY),
+    "get_tournament_seasons": (HOUR, DAY),
+    "get_tournament_videos": (HOUR, DAY),
+    "get_player": (HOUR, DAY),
+    "get_team": (HOUR, DAY),
+    "get_team_players": (HOUR, DAY),
+    "get_event_h2h": (HOUR, DAY),
+    "get_player_statistics": (HOUR, DAY),
+    "get_team_statistics": (HOUR, DAY),
+    "get_team_of_the_week": (HOUR, DAY),
+    "get_fan_ranking": (HOUR, DAY),
+    "get_player_transfer_history": (DAY, 7 * DAY),
+}
+
+
+class MemoryBackend:
+    """In-process LRU of (stored_at, body); thread-safe. The coroutines never suspend."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._locks: set = set()
+        self._mutex = threading.Lock()
+
+    async def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        with self._mutex:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    async def set(self, key: str, stored_at: float, body: bytes, ttl: int) -> None:
+        with self._mutex:
+            self._entries[key] = (stored_at, body)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def lock(self, key: str) -> bool:
+        with self._mutex:
+            if key in self._locks:
+                return False
+            self._locks.add(key)
+            return True
+
+    async def unlock(self, key: str) -> None:
+        with self._mutex:
+            self._locks.discard(key)
+
+
+class RedisBackend:
+    """Entries shared by all workers: "<stored_at>\\n<body>" with a Redis expiry of fresh + stale.
+
+    `client` is a redis.asyncio client, so a slow Redis never blocks the event loop.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        raw = await self.client.get(REDIS_PREFIX + key)
+        if raw is None:
+            return None
+        stored_at, _, body = raw.partition(b"\n")
+        return float(stored_at), body
+
+    async def set(self, key: str, stored_at: float, body: bytes, ttl: int) -> None:
+        await self.client.set(REDIS_PREFIX + key, b"%.3f\n%s" % (stored_at, body), ex=max(1, ttl))
+
+    async def lock(self, key: str) -> bool:
+        return bool(await self.client.set(REDIS_PREFIX + "lock:" + key, b"1", nx=True, ex=REFRESH_LOCK_SECONDS))
+
+    async def unlock(self, key: str) -> None:
+        await self.client.delete(REDIS_PREFIX + "lock:" + key)
+
+
+def _default_backend() -> Any:
+    if CACHE_REDIS:
+        if aioredis is None:
+            print("API_CACHE_REDIS is set but the redis package is not installed; using the in-memory cache")
+        else:
+            return RedisBackend(aioredis.Redis(host=REDIS_HOST, port=REDIS_PORT))
+    return MemoryBackend()
+
+
+def encode(result: Any) -> bytes:
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class ResponseCache:
+    """Stale-while-revalidate cache of JSON bodies in front of handle_api_call.
+
+    `compute` is a coroutine function producing the handle_api_call result;
+    hits never await it. Concurrent misses for one key share a single
+    upstream call, and stale entries are refreshed by a background task.
+    """
+
+    def __init__(self, backend: Any = None, ttls: Optional[Dict[str, Tuple[int, int]]] = None,
+                 enabled: bool = CACHE_ENABLED):
+        self.backend = backend if backend is not None else _default_backend()
+        self.ttls = ROUTE_TTLS if ttls is None else ttls
+        self.enabled = enabled
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._tasks: set = set()  # keeps background refreshes referenced until they finish
+        self._refreshing: set = set()  # keys with a refresh task in this process
+        self.counts = {"hit": 0, "stale": 0, "miss": 0, "coalesced": 0, "bypass": 0, "refreshes": 0,
+                       "refresh_errors": 0}
+
+    async def lookup(self, name: str, args: Tuple[Any, ...],
+                     compute: Callable[[], Awaitable[Any]]) -> Tuple[str, bytes, int, int, int]:
+        """Return (cache status, JSON body, age, fresh, stale) for one call."""
+        ttl = self.ttls.get(name) if self.enabled else None
+        if ttl is None:
+            self.counts["bypass"] += 1
+            return "BYPASS", encode(await compute()), 0, 0, 0
+        fresh, stale = ttl
+        key = f"{name}:{json.dumps(args, default=str)}"
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:  # a cache outage must not take the API down
+            print(f"Response cache read failed for {key}: {e}")
+            entry = None
+        if entry is not None:
+            stored_at, body = entry
+            age = max(0, int(time.time() - stored_at))
+            if age < fresh:
+                self.counts["hit"] += 1
+                return "HIT", body, age, fresh, stale
+            if age < fresh + stale:
+                self.counts["stale"] += 1
+                self._refresh_later(key, fresh, stale, compute)
+                return "STALE", body, age, fresh, stale
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.counts["coalesced"] += 1
+            body, cacheable = await asyncio.shield(pending)
+        else:
+            self.counts["miss"] += 1
+            pending = self._inflight[key] = asyncio.get_running_loop().create_future()
+            try:
+                started = time.time()
+                result = await compute()
+                body, cacheable = encode(result), self._cacheable(result)
+                if cacheable:
+                    await self._store(key, started, body, fresh + stale)
+                pending.set_result((body, cacheable))
+            except asyncio.CancelledError:
+                pending.cancel()
+                raise
+            except Exception as e:
+                pending.set_exception(e)
+                pending.exception()  # retrieved: waiters re-raise it, nobody else has to
+                raise
+            finally:
+                del self._inflight[key]
+        if cacheable:
+            return "MISS", body, 0, fresh, stale
+        return "MISS", body, 0, 0, 0
+
+    async def respond(self, name: str, args: Tuple[Any, ...], compute: Callable[[], Awaitable[Any]]) -> Any:
+        """lookup() as a FastAPI response carrying X-Cache, Age and Cache-Control headers."""
+        status, body, age, fresh, stale = await self.lookup(name, args, compute)
+        if fresh:
+            cache_control = f"public, max-age={max(0, fresh - age)}, stale-while-revalidate={stale}"
+        else:
+            cache_control = "no-store"
+        headers = {"X-Cache": status, "Age": str(age), "Cache-Control": cache_control}
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.counts, backend=type(self.backend).__name__)
+
+    @staticmethod
+    def _cacheable(result: Any) -> bool:
+        return isinstance(result, dict) and result.get("success") is True
+
+    async def _store(self, key: str, stored_at: float, body: bytes, ttl: int) -> None:
+        try:
+            await self.backend.set(key, stored_at, body, ttl)
+        except Exception as e:
+            print(f"Response cache write failed for {key}: {e}")
+
+    def _refresh_later(self, key: str, fresh: int, stale: int, compute: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return  # this process is already refreshing it
+        self._refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(self._refresh(key, fresh, stale, compute))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: str, fresh: int, stale: int, compute: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            # the shared lock is taken here, off the request path
+            if not await self.backend.lock(key):
+                return  # another worker is already refreshing it
+        except Exception as e:
+            print(f"Response cache lock failed for {key}: {e}")
+            self._refreshing.discard(key)
+            return
+        try:
+            started = time.time()
+            result = await compute()
+            if self._cacheable(result):
+                await self._store(key, started, encode(result), fresh + stale)
+                self.counts["refreshes"] += 1
+            else:
+                self.counts["refresh_errors"] += 1
+        except Exception as e:
+            self.counts["refresh_errors"] += 1
+            print(f"Response cache refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+            try:
+                await self.backend.unlock(key)
+            except Exception:
+                pass
@@ -0,0 +1,173 @@
+"""
+Shared HTTP sessions for the sofascore.py fetchers.
+
+The fetchers used to build a fresh `requests.Session()` per call, reapply a
+large copy-pasted header dict and, for about half of them, GET the SofaScore
+homepage first to pick up cookies. That is two requests and two TLS
+handshakes per fetch. SessionPool keeps a small pool of long-lived sessions
+instead:
+
+- every session carries the browser headers once and reuses its keep-alive
+  connections (one HTTPAdapter per session)
+- a session is primed (GET of PRIME_URL for the cookies) when it is created
+  and again once it is older than SOFASCORE_SESSION_REFRESH seconds, so the
+  priming request is off the hot path
+- a 403 re-primes the session that got it and retries the request once
+- sessions are created lazily, up to SOFASCORE_SESSIONS; each one is used by
+  a single thread at a time (requests.Session is not thread-safe) and the
+  most recently returned, warmest session is handed out first
+
+Configuration via environment variables
+- SOFASCORE_SESSIONS (default: 16) — pool size; calls beyond it wait for a
+  free session
+- SOFASCORE_SESSION_REFRESH (default: 1800) — seconds between re-primings
+- SOFASCORE_TIMEOUT (default: 20) — per-request timeout in seconds
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION_POOL_SIZE = int(os.environ.get("SOFASCORE_SESSIONS", "16"))
+SESSION_REFRESH = float(os.environ.get("SOFASCORE_SESSION_REFRESH", "1800"))
+REQUEST_TIMEOUT = float(os.environ.get("SOFASCORE_TIMEOUT", "20"))
+PRIME_URL = "https://www.sofascore.com/"
+
+# Browser headers shared by every request; Host, Connection and
+# Accept-Encoding are left to requests/urllib3
+BROWSER_HEADERS: Dict[str, str] = {
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
+    "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": "\"Windows\"",
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "sec-fetch-site": "same-origin",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-dest": "empty",
+    "referer": "https://www.sofascore.com/",
+}
+
+# Overrides for img.sofascore.com downloads
+IMAGE_HEADERS: Dict[str, str] = {
+    "accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+    "sec-fetch-site": "same-site",
+    "sec-fetch-mode": "no-cors",
+    "sec-fetch-dest": "image",
+}
+
+
+class _Session:
+    __slots__ = ("http", "primed_at")
+
+    def __init__(self, http: requests.Session):
+        self.http = http
+        self.primed_at: Optional[float] = None
+
+
+class SessionPool:
+    """Pool of warmed, cookie-primed requests sessions; thread-safe."""
+
+    def __init__(self, size: int = SESSION_POOL_SIZE, refresh: float = SESSION_REFRESH,
+                 timeout: float = REQUEST_TIMEOUT, headers: Optional[Dict[str, str]] = None,
+                 prime_url: str = PRIME_URL):
+        self.size = max(1, size)
+        self.refresh = refresh
+        self.timeout = timeout
+        self.headers = BROWSER_HEADERS if headers is None else headers
+        self.prime_url = prime_url
+        self._idle: "queue.LifoQueue[_Session]" = queue.LifoQueue()
+        self._created = 0
+        self._mutex = threading.Lock()
+        self.counts = {"requests": 0, "primes": 0, "prime_errors": 0, "retries_403": 0}
+
+    def _count(self, key: str) -> None:
+        with self._mutex:
+            self.counts[key] += 1
+
+    def _new_session(self) -> _Session:
+        http = requests.Session()
+        http.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        http.mount("https://", adapter)
+        http.mount("http://", adapter)
+        return _Session(http)
+
+    def _checkout(self) -> _Session:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._mutex:
+            grow = self._created < self.size
+            if grow:
+                self._created += 1
+        if grow:
+            return self._new_session()
+        return self._idle.get()
+
+    def _prime(self, session: _Session) -> None:
+        self._count("primes")
+        session.primed_at = time.monotonic()
+        try:
+            session.http.get(self.prime_url, timeout=self.timeout)
+        except requests.RequestException as e:
+            self._count("prime_errors")
+            print(f"Priming SofaScore session failed: {e}")
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET url with a warm session; a 403 re-primes the session and retries once."""
+        session = self._checkout()
+        try:
+            if session.primed_at is None or time.monotonic() - session.primed_at >= self.refresh:
+                self._prime(session)
+            self._count("requests")
+            response = session.http.get(url, params=params, headers=headers, timeout=self.timeout)
+            if response.status_code == 403:
+                self._count("retries_403")
+                self._prime(session)
+                response = session.http.get(url, params=params, headers=headers, timeout=self.timeout)
+            return response
+        finally:
+            self._idle.put(session)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._mutex:
+            return dict(self.counts, sessions=self._created, idle=self._idle.qsize())
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().http.close()
+            except queue.Empty:
+                return
+
+
+_default_pool: Optional[SessionPool] = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> SessionPool:
+    global _default_pool
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = SessionPool()
+    return _default_pool
+
+
+def get(url: str, params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """SessionPool.get() on the process-wide pool."""
+    return default_pool().get(url, params=params, headers=headers)
+
+
+def get_image(url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """get() with image request headers, for img.sofascore.com; `headers` adds to them."""
+    return default_pool().get(url, headers=dict(IMAGE_HEADERS, **headers) if headers else IMAGE_HEADERS)
@@ -1,109 +1,16 @@
-import requests
 import json
 import datetime
-import os
-import asyncio
-import nodriver as uc
 
-# helper to fetch JSON via nodriver browser
+import browser_pool
+import dump_sink
+import image_cache
+import session_manager
+
+# helper to fetch JSON via a pooled nodriver browser
 def fetch_json_via_nodriver(url):
-    async def _fetch():
-        browser = None
-        try:
-            # Configure browser options for headless operation on server
-            browser_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--headless=new',
-                '--no-first-run',
-                '--disable-extensions',
-                '--disable-default-apps',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor'
-            ]
-            
-            # Try to find chromium binary
-            possible_paths = [
-                '/snap/bin/chromium',
-                '/usr/bin/chromium-browser',
-                '/usr/bin/chromium',
-                '/usr/bin/google-chrome',
-                '/usr/bin/google-chrome-stable'
-            ]
-            
-            browser_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    browser_path = path
-                    break
-            
-            if browser_path:
-                browser = await uc.start(
-                    browser_executable_path=browser_path, 
-                    browser_args=browser_args, 
-                    no_sandbox=True,
-                    headless=True
-                )
-            else:
-                browser = await uc.start(
-                    browser_args=browser_args, 
-                    no_sandbox=True,
-                    headless=True
-                )
-                
-            page = await browser.get(url)
-            # Wait for page to load
-            await page.sleep(3)
-            
-            # Get page content
-            content = await page.get_content()
-            
-            # Extract JSON from HTML if wrapped
-            if content and content.strip().startswith('<html>'):
-                # Look for JSON content within <pre> tags
-                import re
-                json_match = re.search(r'<pre[^>]*>(.*?)</pre>', content, re.DOTALL)
-                if json_match:
-                    content = json_match.group(1).strip()
-                    print(f"Extracted JSON from HTML wrapper, length: {len(content)}")
-                else:
-                    print("Warning: HTML response but no JSON found in <pre> tags")
-            
-            print(f"Final content length: {len(content) if content else 0}")
-            return content
-            
-        except Exception as e:
-            print(f"Error in browser automation: {e}")
-            raise
-        finally:
-            # Proper cleanup - stop() is synchronous, not async
-            if browser:
-                try:
-                    browser.stop()
-                    print("Browser stopped successfully")
-                except Exception as e:
-                    print(f"Warning: Error stopping browser: {e}")
-    
-    try:
-        # Try to get the current event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running, use asyncio.run_coroutine_threadsafe
-            import concurrent.futures
-            import threading
-            
-            def run_in_thread():
-                return asyncio.run(_fetch())
-            
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                return future.result()
-        else:
-            return loop.run_until_complete(_fetch())
-    except RuntimeError:
-        # No event loop, create a new one
-        return asyncio.run(_fetch())
+    content = browser_pool.fetch(url)
+    print(f"Final content length: {len(content) if content else 0}")
+    return content
 
 def get_football_categories():
 
@@ -112,9 +19,7 @@ def get_football_categories():
     # fetch JSON via browser automation
     raw = fetch_json_via_nodriver(url)
     data = json.loads(raw)
-    with open('football_categories.json', 'w', encoding='utf-8') as f:
-        f.write(json.dumps(data, indent=4, ensure_ascii=False))
-    print("Football categories saved to football_categories.json")
+    dump_sink.dump('football_categories.json', data)
     return data
 
 def get_football_live_categories():
@@ -135,9 +40,7 @@ def get_football_live_categories():
     # fetch JSON via browser automation
     raw = fetch_json_via_nodriver(url)
     data = json.loads(raw)
-    with open('football_live_categories.json', 'w', encoding='utf-8') as f:
-        f.write(json.dumps(data, indent=4, ensure_ascii=False))
-    print("Football live categories saved to football_live_categories.json")
+    dump_sink.dump('football_live_categories.json', data)
     return data
 
 def get_football_tournaments():
@@ -153,9 +56,7 @@ def get_football_tournaments():
     full_url = url + "?sport=football"
     raw = fetch_json_via_nodriver(full_url)
     data = json.loads(raw)
-    with open('football_tournaments.json', 'w', encoding='utf-8') as f:
-        f.write(json.dumps(data, indent=4, ensure_ascii=False))
-    print("Football tournements saved to football_tournaments.json")
+    dump_sink.dump('football_tournaments.json', data)
     return data
 
 def get_tournament_featured_events(tournament_id):
@@ -163,33 +64,11 @@ def get_tournament_featured_events(tournament_id):
 
 
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _gid=GA1.2.848260054.1746704814; _sharedID=33e6ba26-af4c-49fb-b08c-edb85ac456c6; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=z160Z182NHREYVVsZ3Y1SiUyRnIwdlBOZnRYTVhiaG4xcHAwM3BBTDNPJTJGbUVGR21tMEdTSGpxYWdqV0dVWEhwcXRaU1hHSkV2a0xwRXZzamZiRXZTU2dPbmpxYnFRZkZHb3pFTlBpMnVZTjYzZVpnOUUlM0Q; _ga=GA1.1.2057756329.1746703005; exco-uid=s1doc7gv5zl2c54s; pbjs-unifiedid=%7B%22TDID%22%3A%2259f6c2fa-6291-4757-a5b4-7090ca0fe0aa%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-08T12%3A47%3A18%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; FCNEC=%5B%5B%22AKsRol9OezXa5Fpj_hJpooacIrsbDv24Eh8GRPhOZzpz_TroahIYyeLnck_ZcA1nrnQuaTHPKK_HJ0jROYlfeVAOb0pGlsEgPAVThFAZdPDwWUWSytNam1vm_KsKdSZDdgpoLRejFcoOA5Gg-saZ07wopunuAqDX5Q%3D%3D%22%5D%5D; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746710719:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746710719:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746710719:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; cto_bundle=NpZd4V9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpSUFZYenlTRmw1JTJCekUyTEEyWGJxZ0VJdUhtd0dkVHk1dlFVRDJyUmhra1RkOEdzQnBPb3FVQzRPd1ZHaENkMzMlMkZtWkNpNTUzd25pU2Z5dkp6d1UyVG5PaUFzanB4M3N1aXdBRFlUdUYlMkJoeU1yeXNoRTEweCUyRjd1SVBiSmNneDBnJTNEJTNE; _awl=2.1746710722.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; _ga_FVWZ0RM4DH=GS2.1.s1746710828$o2$g0$t1746710828$j60$l0$h0; _ga_HNQ9P9MGZR=GS2.1.s1746703005$o1$g1$t1746710828$j14$l0$h0"
-    }
-
     # fetch JSON via browser automation
     raw = fetch_json_via_nodriver(url)
     data = json.loads(raw)
     filename = f"tournament_featured_events_{tournament_id}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(json.dumps(data, indent=4, ensure_ascii=False))
-    print(filename)
+    dump_sink.dump(filename, data)
 
 def get_football_suggestions():
     """
@@ -205,9 +84,7 @@ def get_football_suggestions():
     full_url = url + "?sport=football"
     raw = fetch_json_via_nodriver(full_url)
     data = json.loads(raw)
-    with open('football_suggestions.json', 'w', encoding='utf-8') as f:
-        f.write(json.dumps(data, indent=4, ensure_ascii=False))
-    print("Football suggestions saved to football_suggestions.json")
+    dump_sink.dump('football_suggestions.json', data)
     return data
 
 def get_football_trending_players():
@@ -218,35 +95,12 @@ def get_football_trending_players():
 
     url = "https://www.sofascore.com/api/v1/sport/football/trending-top-players"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "a2af6a116f89edcb171407b4e037f131-999239e22726feb2",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "67227c",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=a2af6a116f89edcb171407b4e037f131",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
-        with open('trending_players.json', 'w', encoding='utf-8') as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        print("trending_players saved to football_categories.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump('trending_players.json', data)
+        return data
     else:
         print(f"Error: {response.status_code}")
         return None
@@ -261,34 +115,11 @@ def get_scheduled_events(date):
 
     url = f"https://www.sofascore.com/api/v1/sport/football/scheduled-events/{date}"    #2025-05-08
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "a2af6a116f89edcb171407b4e037f131-999239e22726feb2",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "67227c",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=a2af6a116f89edcb171407b4e037f131",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
     if response.status_code == 200:
-        with open('scheduled_events.json', 'w', encoding='utf-8') as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        print("scheduled_events saved to football_categories.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump('scheduled_events.json', data)
+        return data
     else:
         print(f"Error: {response.status_code}")
         return None
@@ -305,35 +136,12 @@ def get_player_heatmap(event_id,player_id):
 
     url = f"https://www.sofascore.com/api/v1/event/{event_id}/player/{player_id}/heatmap"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "a2af6a116f89edcb171407b4e037f131-999239e22726feb2",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "67227c",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=a2af6a116f89edcb171407b4e037f131",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
-        with open('get_player_heatmap.json', 'w', encoding='utf-8') as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        print("get_player_heatmap saved to football_categories.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump('get_player_heatmap.json', data)
+        return data
     else:
         print(f"Error: {response.status_code}")
         return None
@@ -348,42 +156,17 @@ def get_newly_added_events():
 
     url = "https://www.sofascore.com/api/v1/event/newly-added-events"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "a2af6a116f89edcb171407b4e037f131-999239e22726feb2",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "67227c",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=a2af6a116f89edcb171407b4e037f131",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "lotame_domain_check=sofascore.com; _cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice"
-    }
-
-    #download the image
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
-        with open('newly_added_events.json', 'w', encoding='utf-8') as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        print("newly_added_events saved to football_categories.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump('newly_added_events.json', data)
+        return data
     else:
         print(f"Error: {response.status_code}")
         return None
     
-def download_player_image(player_id):
+def download_player_image(player_id, cached_only=False):
     """
     This function fetches player image from the SofaScore API and saves it to a JSON file.
     """
@@ -398,39 +181,13 @@ def download_player_image(player_id):
 
     url = f"https://img.sofascore.com/api/v1/player/{player_id}/image"
 
-    headers = {
-        "host": "img.sofascore.com",
-        "connection": "keep-alive",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-        "sec-fetch-site": "same-site",
-        "sec-fetch-mode": "no-cors",
-        "sec-fetch-dest": "image",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "lotame_domain_check=sofascore.com; _cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice"
-    }
-
-    #download the image
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
-    if response.status_code == 200:
-        with open(f'player_{player_id}.png', 'wb') as f:
-            f.write(response.content)
-        print(f"Player image saved to player_{player_id}.png")
-        #image path
-        image_path = f'player_{player_id}.png'  
-        return image_path        
-    else:
-        print(f"Error: {response.status_code}")
-        return None
+    # cached on disk, see image_cache.py; None if it cannot be downloaded
+    # (with cached_only: None unless a fresh copy is cached, nothing is fetched)
+    if cached_only:
+        return image_cache.cached(f"player/{player_id}/image")
+    return image_cache.get(f"player/{player_id}/image", url)
 
-def download_manager_image(manager_id):
+def download_manager_image(manager_id, cached_only=False):
     """
     This function fetches manager image from the SofaScore API and saves it to a PNG file.
     """
@@ -439,39 +196,13 @@ def download_manager_image(manager_id):
 
     url = f"https://img.sofascore.com/api/v1/manager/{manager_id}/image"
 
-    headers = {
-        "host": "img.sofascore.com",
-        "connection": "keep-alive",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-        "sec-fetch-site": "same-site",
-        "sec-fetch-mode": "no-cors",
-        "sec-fetch-dest": "image",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "lotame_domain_check=sofascore.com; _cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice"
-    }
-
-    # download the image
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
-    if response.status_code == 200:
-        with open(f'manager_{manager_id}.png', 'wb') as f:
-            f.write(response.content)
-        print(f"Manager image saved to manager_{manager_id}.png")
-        # image path
-        image_path = f'manager_{manager_id}.png'
-        return image_path
-    else:
-        print(f"Error: {response.status_code}")
-        return None
+    # cached on disk, see image_cache.py; None if it cannot be downloaded
+    # (with cached_only: None unless a fresh copy is cached, nothing is fetched)
+    if cached_only:
+        return image_cache.cached(f"manager/{manager_id}/image")
+    return image_cache.get(f"manager/{manager_id}/image", url)
     
-def download_team_image_full(team_id):  
+def download_team_image_full(team_id, cached_only=False):  
     """
     This function fetches team image from the SofaScore API and saves it to a JSON file.
     """
@@ -486,39 +217,13 @@ def download_team_image_full(team_id):
 
     url = f"https://img.sofascore.com/api/v1/team/{team_id}/image"
 
-    headers = {
-        "host": "img.sofascore.com",
-        "connection": "keep-alive",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-        "sec-fetch-site": "same-site",
-        "sec-fetch-mode": "no-cors",
-        "sec-fetch-dest": "image",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "lotame_domain_check=sofascore.com; _cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice"
-    }
-
-    #download the image
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
-    if response.status_code == 200:
-        with open(f'player_{team_id}.png', 'wb') as f:
-            f.write(response.content)
-        print(f"Player image saved to player_{team_id}.png")
-        #image path
-        image_path = f'player_{team_id}.png'  
-        return image_path        
-    else:
-        print(f"Error: {response.status_code}")
-        return None
+    # cached on disk, see image_cache.py; None if it cannot be downloaded
+    # (with cached_only: None unless a fresh copy is cached, nothing is fetched)
+    if cached_only:
+        return image_cache.cached(f"team/{team_id}/image")
+    return image_cache.get(f"team/{team_id}/image", url)
 
-def download_team_image_small(team_id):  
+def download_team_image_small(team_id, cached_only=False):  
     """
     This function fetches team image from the SofaScore API and saves it to a JSON file.
     """
@@ -533,36 +238,13 @@ def download_team_image_small(team_id):
 
     url = f"https://img.sofascore.com/api/v1/team/{team_id}/image/small"
 
-    headers = {
-        "host": "img.sofascore.com",
-        "connection": "keep-alive",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-        "sec-fetch-site": "same-site",
-        "sec-fetch-mode": "no-cors",
-        "sec-fetch-dest": "image",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "lotame_domain_check=sofascore.com; _cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice"
-    }
-
-    #download the image
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
-    if response.status_code == 200:
-        with open(f'player_{team_id}_small.png', 'wb') as f:
-            f.write(response.content)
-        print(f"Player image saved to player_{team_id}_small.png")
-        #image path
-        image_path = f'player_{team_id}_small.png'  
-        return image_path
-
-def download_tournament_image(tournament_id):
+    # cached on disk, see image_cache.py; None if it cannot be downloaded
+    # (with cached_only: None unless a fresh copy is cached, nothing is fetched)
+    if cached_only:
+        return image_cache.cached(f"team/{team_id}/image/small")
+    return image_cache.get(f"team/{team_id}/image/small", url)
+
+def download_tournament_image(tournament_id, cached_only=False):
     """
     This function fetches tournament image from the SofaScore API and saves it to a JSON file.
     """
@@ -579,38 +261,11 @@ def download_tournament_image(tournament_id):
 
     url = f"https://img.sofascore.com/api/v1/unique-tournament/{tournament_id}/image"
 
-    headers = {
-        "host": "img.sofascore.com",
-        "connection": "keep-alive",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-        "sec-fetch-site": "same-site",
-        "sec-fetch-mode": "no-cors",
-        "sec-fetch-dest": "image",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "lotame_domain_check=sofascore.com; _cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice"
-    }
-
-    #download the image
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
-    if response.status_code == 200:
-        with open(f'tournament_{tournament_id}.png', 'wb') as f:
-            f.write(response.content)
-        print(f"Tournament image saved to tournament_{tournament_id}.png")
-        #image path
-        image_path = f'tournament_{tournament_id}.png'  
-        return image_path        
-    
-    else:
-        print(f"Error: {response.status_code}")
-        return None
+    # cached on disk, see image_cache.py; None if it cannot be downloaded
+    # (with cached_only: None unless a fresh copy is cached, nothing is fetched)
+    if cached_only:
+        return image_cache.cached(f"unique-tournament/{tournament_id}/image")
+    return image_cache.get(f"unique-tournament/{tournament_id}/image", url)
 
 def get_event_count():
     """
@@ -627,36 +282,13 @@ def get_event_count():
 
     url = "https://www.sofascore.com/api/v1/sport/-18000/event-count"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "a2af6a116f89edcb171407b4e037f131-999239e22726feb2",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "67227c",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=a2af6a116f89edcb171407b4e037f131",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_retry_request=true; _lr_env_src_ats=false; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746703003:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746703003:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746703003:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _ga=GA1.1.2057756329.1746703005; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _awl=2.1746703011.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; FCNEC=%5B%5B%22AKsRol8eDdBx-NbJc7j-eSjFRWou6O3tyaW44G5Js11tNgt4KbE7pmKnoTWrxAPDYDgHc0lg38L16q-1mPLigvKrlh4skSYnshWbw2CrHfQpbGD9ytMAsm0FdrIeZjGPq0PAN4E1rzA06oJGX6UW3vFGE8Bmd5B0Pw%3D%3D%22%5D%5D; cto_bundle=tEB5ll9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpxOHB4c3V0ayUyQlhEWjhCME8lMkJJV3V5WUlEdmJKS0ZpSzZJZGx1d09tMWdPMk94SExOTkc0RkRBdDltcmtEcnlXWHBQUlBiVDJPaEY3WUFLa2dOQjNYd3doMTlSZDJXemV5aVZhYmM1dElIUUxIalJBdDFFZTBIczN6aGhBcGU0VHclM0QlM0Q"
-    }
-
     # fetch JSON via browser automation
-    response = requests.get(url, headers=headers)
+    response = session_manager.get(url)
 
-    print(response.text)
     if response.status_code == 200:
-        with open('event_count.json', 'w', encoding='utf-8') as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        print("event_count saved to football_categories.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump('event_count.json', data)
+        return data
     
     else:
         print(f"Error: {response.status_code}")
@@ -675,15 +307,12 @@ def get_tournament_schedule(tournament_id, season_id):
 
 
     url = f"https://www.sofascore.com/api/v1/unique-tournament/{tournament_id}/season/{season_id}/team-of-the-week/rounds"
-    session = requests.Session()
-    session.get("https://www.sofascore.com")
-    response = session.get(url)
+    response = session_manager.get(url)
     
     if response.status_code == 200:
-        with open("tournament_data.json", "w") as file:
-            file.write(json.dumps(response.json(), indent=4))
-        print("Data saved to tournament_data.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump("tournament_data.json", data)
+        return data
     else:
         print("Request failed with status code:", response.status_code)
         return None
@@ -700,15 +329,12 @@ def get_tournament_videos(tournement_id) :
 
 
     url = f"https://www.sofascore.com/api/v1/unique-tournament/{tournement_id}/media"
-    session = requests.Session()
-    session.get("https://www.sofascore.com")
-    response = session.get(url)
+    response = session_manager.get(url)
     
     if response.status_code == 200:
-        with open("tournament_videos.json", "w") as file:
-            file.write(json.dumps(response.json(), indent=4))
-        print("Data saved to tournament_videos.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump("tournament_videos.json", data)
+        return data
     else:
         print("Request failed with status code:", response.status_code)
         return None
@@ -717,33 +343,9 @@ def get_team_events(tournament_id, season_id):
     url = f"https://www.sofascore.com/api/v1/unique-tournament/{tournament_id}/season/{season_id}/team-events/total"
 
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _gid=GA1.2.848260054.1746704814; _sharedID=33e6ba26-af4c-49fb-b08c-edb85ac456c6; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=z160Z182NHREYVVsZ3Y1SiUyRnIwdlBOZnRYTVhiaG4xcHAwM3BBTDNPJTJGbUVGR21tMEdTSGpxYWdqV0dVWEhwcXRaU1hHSkV2a0xwRXZzamZiRXZTU2dPbmpxYnFRZkZHb3pFTlBpMnVZTjYzZVpnOUUlM0Q; _ga=GA1.1.2057756329.1746703005; exco-uid=s1doc7gv5zl2c54s; pbjs-unifiedid=%7B%22TDID%22%3A%2259f6c2fa-6291-4757-a5b4-7090ca0fe0aa%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-08T12%3A47%3A18%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; FCNEC=%5B%5B%22AKsRol9OezXa5Fpj_hJpooacIrsbDv24Eh8GRPhOZzpz_TroahIYyeLnck_ZcA1nrnQuaTHPKK_HJ0jROYlfeVAOb0pGlsEgPAVThFAZdPDwWUWSytNam1vm_KsKdSZDdgpoLRejFcoOA5Gg-saZ07wopunuAqDX5Q%3D%3D%22%5D%5D; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746710719:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746710719:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746710719:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; cto_bundle=NpZd4V9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpSUFZYenlTRmw1JTJCekUyTEEyWGJxZ0VJdUhtd0dkVHk1dlFVRDJyUmhra1RkOEdzQnBPb3FVQzRPd1ZHaENkMzMlMkZtWkNpNTUzd25pU2Z5dkp6d1UyVG5PaUFzanB4M3N1aXdBRFlUdUYlMkJoeU1yeXNoRTEweCUyRjd1SVBiSmNneDBnJTNEJTNE; _awl=2.1746710722.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; _ga_FVWZ0RM4DH=GS2.1.s1746710828$o2$g0$t1746710828$j60$l0$h0; _ga_HNQ9P9MGZR=GS2.1.s1746703005$o1$g1$t1746710828$j14$l0$h0"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
-    with open(f"team_events_{tournament_id}_{season_id}.json", "w", encoding="utf-8") as f:
-        f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-    print(f"team_events_{tournament_id}_{season_id}.json")
+    response = session_manager.get(url)
+    data = response.json()
+    dump_sink.dump(f"team_events_{tournament_id}_{season_id}.json", data)
 
 def get_tournament_standing(tournament_id, season_id):
     """
@@ -778,35 +380,10 @@ def get_team_of_the_week(tournament_id, season_id):
 
     url = f"https://www.sofascore.com/api/v1/unique-tournament/{tournament_id}/season/{season_id}/team-of-the-week/rounds"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _gid=GA1.2.848260054.1746704814; _sharedID=33e6ba26-af4c-49fb-b08c-edb85ac456c6; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=z160Z182NHREYVVsZ3Y1SiUyRnIwdlBOZnRYTVhiaG4xcHAwM3BBTDNPJTJGbUVGR21tMEdTSGpxYWdqV0dVWEhwcXRaU1hHSkV2a0xwRXZzamZiRXZTU2dPbmpxYnFRZkZHb3pFTlBpMnVZTjYzZVpnOUUlM0Q; _ga=GA1.1.2057756329.1746703005; exco-uid=s1doc7gv5zl2c54s; pbjs-unifiedid=%7B%22TDID%22%3A%2259f6c2fa-6291-4757-a5b4-7090ca0fe0aa%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-08T12%3A47%3A18%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; FCNEC=%5B%5B%22AKsRol9OezXa5Fpj_hJpooacIrsbDv24Eh8GRPhOZzpz_TroahIYyeLnck_ZcA1nrnQuaTHPKK_HJ0jROYlfeVAOb0pGlsEgPAVThFAZdPDwWUWSytNam1vm_KsKdSZDdgpoLRejFcoOA5Gg-saZ07wopunuAqDX5Q%3D%3D%22%5D%5D; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746710719:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746710719:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746710719:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; cto_bundle=NpZd4V9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpSUFZYenlTRmw1JTJCekUyTEEyWGJxZ0VJdUhtd0dkVHk1dlFVRDJyUmhra1RkOEdzQnBPb3FVQzRPd1ZHaENkMzMlMkZtWkNpNTUzd25pU2Z5dkp6d1UyVG5PaUFzanB4M3N1aXdBRFlUdUYlMkJoeU1yeXNoRTEweCUyRjd1SVBiSmNneDBnJTNEJTNE; _awl=2.1746710722.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; _ga_FVWZ0RM4DH=GS2.1.s1746710828$o2$g0$t1746710828$j60$l0$h0; _ga_HNQ9P9MGZR=GS2.1.s1746703005$o1$g1$t1746710828$j14$l0$h0"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
-    with open(f"team_of_the_week_{tournament_id}_{season_id}.json", "w", encoding="utf-8") as f:
-        f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-    print("Data saved to team_of_the_week.json")
-    return response.json()
+    response = session_manager.get(url)
+    data = response.json()
+    dump_sink.dump(f"team_of_the_week_{tournament_id}_{season_id}.json", data)
+    return data
 
 def get_fan_ranking(season_id):
     """
@@ -821,35 +398,10 @@ def get_fan_ranking(season_id):
     # Example tournament id: 679    
     url = f"https://www.sofascore.com/api/v1/event/fan-rating/ranking/season/{season_id}"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _awl=2.1746703011.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; FCNEC=%5B%5B%22AKsRol8eDdBx-NbJc7j-eSjFRWou6O3tyaW44G5Js11tNgt4KbE7pmKnoTWrxAPDYDgHc0lg38L16q-1mPLigvKrlh4skSYnshWbw2CrHfQpbGD9ytMAsm0FdrIeZjGPq0PAN4E1rzA06oJGX6UW3vFGE8Bmd5B0Pw%3D%3D%22%5D%5D; cto_bundle=tEB5ll9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpxOHB4c3V0ayUyQlhEWjhCME8lMkJJV3V5WUlEdmJKS0ZpSzZJZGx1d09tMWdPMk94SExOTkc0RkRBdDltcmtEcnlXWHBQUlBiVDJPaEY3WUFLa2dOQjNYd3doMTlSZDJXemV5aVZhYmM1dElIUUxIalJBdDFFZTBIczN6aGhBcGU0VHclM0QlM0Q"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
-    with open(f"fan_ranking_{season_id}.json", "w", encoding="utf-8") as f:
-        f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-    print("Data saved to fan_ranking.json")
-    return response.json()
+    response = session_manager.get(url)
+    data = response.json()
+    dump_sink.dump(f"fan_ranking_{season_id}.json", data)
+    return data
 
 def get_player_statistics(tournament_id, season_id):
     """
@@ -869,35 +421,10 @@ def get_player_statistics(tournament_id, season_id):
 
     url = f"https://www.sofascore.com/api/v1/unique-tournament/{tournament_id}/season/{season_id}/player-statistics/types"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _awl=2.1746703011.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; FCNEC=%5B%5B%22AKsRol8eDdBx-NbJc7j-eSjFRWou6O3tyaW44G5Js11tNgt4KbE7pmKnoTWrxAPDYDgHc0lg38L16q-1mPLigvKrlh4skSYnshWbw2CrHfQpbGD9ytMAsm0FdrIeZjGPq0PAN4E1rzA06oJGX6UW3vFGE8Bmd5B0Pw%3D%3D%22%5D%5D; cto_bundle=tEB5ll9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpxOHB4c3V0ayUyQlhEWjhCME8lMkJJV3V5WUlEdmJKS0ZpSzZJZGx1d09tMWdPMk94SExOTkc0RkRBdDltcmtEcnlXWHBQUlBiVDJPaEY3WUFLa2dOQjNYd3doMTlSZDJXemV5aVZhYmM1dElIUUxIalJBdDFFZTBIczN6aGhBcGU0VHclM0QlM0Q"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
-    with open(f"team_statistics_{tournament_id}_{season_id}.json", "w", encoding="utf-8") as f:
-        f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-    print(f"Data saved to team_statistics.json")
-    return response.json()
+    response = session_manager.get(url)
+    data = response.json()
+    dump_sink.dump(f"team_statistics_{tournament_id}_{season_id}.json", data)
+    return data
     
 def get_event_details(event_id):
     """
@@ -911,38 +438,12 @@ def get_event_details(event_id):
 
     url = f"https://www.sofascore.com/api/v1/event/{event_id}"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _gid=GA1.2.848260054.1746704814; _sharedID=33e6ba26-af4c-49fb-b08c-edb85ac456c6; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=z160Z182NHREYVVsZ3Y1SiUyRnIwdlBOZnRYTVhiaG4xcHAwM3BBTDNPJTJGbUVGR21tMEdTSGpxYWdqV0dVWEhwcXRaU1hHSkV2a0xwRXZzamZiRXZTU2dPbmpxYnFRZkZHb3pFTlBpMnVZTjYzZVpnOUUlM0Q; _ga=GA1.1.2057756329.1746703005; exco-uid=s1doc7gv5zl2c54s; pbjs-unifiedid=%7B%22TDID%22%3A%2259f6c2fa-6291-4757-a5b4-7090ca0fe0aa%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-08T12%3A47%3A18%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; FCNEC=%5B%5B%22AKsRol9OezXa5Fpj_hJpooacIrsbDv24Eh8GRPhOZzpz_TroahIYyeLnck_ZcA1nrnQuaTHPKK_HJ0jROYlfeVAOb0pGlsEgPAVThFAZdPDwWUWSytNam1vm_KsKdSZDdgpoLRejFcoOA5Gg-saZ07wopunuAqDX5Q%3D%3D%22%5D%5D; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746710719:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746710719:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746710719:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; cto_bundle=NpZd4V9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpSUFZYenlTRmw1JTJCekUyTEEyWGJxZ0VJdUhtd0dkVHk1dlFVRDJyUmhra1RkOEdzQnBPb3FVQzRPd1ZHaENkMzMlMkZtWkNpNTUzd25pU2Z5dkp6d1UyVG5PaUFzanB4M3N1aXdBRFlUdUYlMkJoeU1yeXNoRTEweCUyRjd1SVBiSmNneDBnJTNEJTNE; _awl=2.1746710722.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; _ga_FVWZ0RM4DH=GS2.1.s1746710828$o2$g0$t1746710828$j60$l0$h0; _ga_HNQ9P9MGZR=GS2.1.s1746703005$o1$g1$t1746710828$j14$l0$h0"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
+    response = session_manager.get(url)
     
     if response.status_code == 200:
         match_info = response.json()
         out_path = f"match_info_{event_id}.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(match_info, indent=4, ensure_ascii=False))
-        print(f"Match information saved to {out_path}")
+        dump_sink.dump(out_path, match_info)
         return match_info
     else:
         print(f"Error: {response.status_code}")
@@ -956,22 +457,11 @@ def get_lineups(event_id):
     Returns:
         dict: A dictionary containing the important match information for blog posts.
     """
-    import requests
     import json
 
     url = f"https://www.sofascore.com/api/v1/event/{event_id}/lineups"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "referer": "https://www.sofascore.com/"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
+    response = session_manager.get(url)
     
     if response.status_code == 200:
         data = response.json()
@@ -1033,31 +523,7 @@ def get_player_transfer_history(player_id):
 
     url = f"https://www.sofascore.com/api/v1/player/{player_id}/transfer-history"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "5942b3223cf3442b85e349d5219dbd02-a95c0fa5bd504435",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "3bc656",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=unyCLV-APips1pu4To7z7,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=5942b3223cf3442b85e349d5219dbd02",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=32c9742ec4e3b0e8b118dd503f59e87; panoramaId_expiry=1747653288114; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=41f8zps11ypivbwwqsgn5c; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001747048495-R307DM9D-43DX; _gid=GA1.2.325317686.1747048502; _sharedID=42265568-a310-4c55-9a66-5fecda216214; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=i8UMYV9ZNjJQTHB6alAyY3BLb2tvNmlObElPSHpMNkloZjZOY1lCR1N0NHhYbTFHbFFET3FEU3hyaGdESExJSFBta2IlMkZSS05pdSUyQnk5VjduN3h0d2JRTW10aEhDJTJCQktFRGplRDBXTnROd2EzaUFLcyUzRA; logglytrackingsession=d57aec08-aad5-4d64-853d-b6166957b77c; _pbjs_userid_consent_data=3524755945110770; _li_dcdm_c=.sofascore.com; _lc2_fpi=a78faec1e09d--01jv23ernn2rwjcm2y1megrqmz; _lc2_fpi_js=a78faec1e09d--01jv23ernn2rwjcm2y1megrqmz; _li_ss=CgA; _ga_FVWZ0RM4DH=GS2.1.s1747050298$o1$g0$t1747050298$j60$l0$h0; _ga=GA1.1.90902502.1747048492; pbjs-unifiedid=%7B%22TDID%22%3A%22fb8d29c9-61ab-41a2-aae7-c1c15e585fea%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-12T12%3A49%3A09%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; _awl=2.1747058346.5-fb10ebcb950baa64af071846ac56fc8d-6763652d75732d63656e7472616c31-0; FCNEC=%5B%5B%22AKsRol94UWR8PRcs54SaW9IwouUUxoKC0rfvwKZDz92S1pIvnp2IGXV_YngZXOhiqDqojLPHQ16b7e4yCCqOe9_Oja9CHUKcLqM3E4pDxxF-N66Zw7LIT_PYHpTBUS0FEWDSsw87Nhbm92XUnBLA4sO__lRriEVfeA%3D%3D%22%5D%5D; cto_bundle=vCqvOV96Y0NjZHlDaUdNYjd2ZVVJWDRITnJROWpQTHF1cDV5OGl6cGhCY1l5YyUyRk5qYW8lMkJEMW8walRFTFQzSnd1SVZGUE12M0MlMkJTNlBVSlR5RGFxTDc0Y1plWTZmYWwwMnJheTNtU2pvYUNQQjR6ME1mc0daejQlMkZHOGxQVk1iUW9FJTJCWk1jRUpnTlJSTFg2NnN5YnRyZ280Wjl3JTNEJTNE; __gads=ID=eb618f494fb952a3:T=1747048491:RT=1747058675:S=ALNI_MbMzHhb7UjbFrbdo3EaCI0zPNow5g; __gpi=UID=000010b1c84ba88c:T=1747048491:RT=1747058675:S=ALNI_MbYa4l2QyuO7y9n4pKJeC2DPcPGmQ; __eoi=ID=1ced9e9b25863431:T=1747048491:RT=1747058675:S=AA-AfjbfdlKYCK5x23e09usynoCH; _ga_HNQ9P9MGZR=GS2.1.s1747058344$o5$g1$t1747058685$j34$l0$h0"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
+    response = session_manager.get(url)
     if response.status_code == 200:
         #with open(f"player_statistics_{tournament_id}_{season_id}.json", "w", encoding="utf-8") as f:
             #f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
@@ -1085,36 +551,11 @@ def get_team_statistics(tournament_id, season_id):
 
     url = f"https://www.sofascore.com/api/v1/unique-tournament/{tournament_id}/season/{season_id}/team-statistics/types"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _gid=GA1.2.848260054.1746704814; _sharedID=33e6ba26-af4c-49fb-b08c-edb85ac456c6; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=z160Z182NHREYVVsZ3Y1SiUyRnIwdlBOZnRYTVhiaG4xcHAwM3BBTDNPJTJGbUVGR21tMEdTSGpxYWdqV0dVWEhwcXRaU1hHSkV2a0xwRXZzamZiRXZTU2dPbmpxYnFRZkZHb3pFTlBpMnVZTjYzZVpnOUUlM0Q; _ga=GA1.1.2057756329.1746703005; exco-uid=s1doc7gv5zl2c54s; pbjs-unifiedid=%7B%22TDID%22%3A%2259f6c2fa-6291-4757-a5b4-7090ca0fe0aa%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-08T12%3A47%3A18%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; FCNEC=%5B%5B%22AKsRol9OezXa5Fpj_hJpooacIrsbDv24Eh8GRPhOZzpz_TroahIYyeLnck_ZcA1nrnQuaTHPKK_HJ0jROYlfeVAOb0pGlsEgPAVThFAZdPDwWUWSytNam1vm_KsKdSZDdgpoLRejFcoOA5Gg-saZ07wopunuAqDX5Q%3D%3D%22%5D%5D; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746710719:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746710719:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746710719:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; cto_bundle=NpZd4V9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpSUFZYenlTRmw1JTJCekUyTEEyWGJxZ0VJdUhtd0dkVHk1dlFVRDJyUmhra1RkOEdzQnBPb3FVQzRPd1ZHaENkMzMlMkZtWkNpNTUzd25pU2Z5dkp6d1UyVG5PaUFzanB4M3N1aXdBRFlUdUYlMkJoeU1yeXNoRTEweCUyRjd1SVBiSmNneDBnJTNEJTNE; _awl=2.1746710722.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; _ga_FVWZ0RM4DH=GS2.1.s1746710828$o2$g0$t1746710828$j60$l0$h0; _ga_HNQ9P9MGZR=GS2.1.s1746703005$o1$g1$t1746710828$j14$l0$h0"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
+    response = session_manager.get(url)
     if response.status_code == 200:
-        with open(f"player_statistics_{tournament_id}_{season_id}.json", "w", encoding="utf-8") as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        print("Data saved to player_statistics.json")
-        return response.json()
+        data = response.json()
+        dump_sink.dump(f"player_statistics_{tournament_id}_{season_id}.json", data)
+        return data
     else:
         print("Request failed with status code:", response.status_code)
         return None
@@ -1131,38 +572,12 @@ def get_event_details(event_id):
 
     url = f"https://www.sofascore.com/api/v1/event/{event_id}"
 
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "sentry-trace": "9181252d283577d20c7e536b6cff5e91-b36600782f2dabeb",
-        "sec-ch-ua-platform": "\"Windows\"",
-        "x-requested-with": "5e7360",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "sec-ch-ua": "\"Chromium\";v=\"136\", \"Google Chrome\";v=\"136\", \"Not.A/Brand\";v=\"99\"",
-        "sec-ch-ua-mobile": "?0",
-        "baggage": "sentry-environment=production,sentry-release=JY4zlZh5uBuMgSvTjP4_o,sentry-public_key=d693747a6bb242d9bb9cf7069fb57988,sentry-trace_id=9181252d283577d20c7e536b6cff5e91",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/tournament/football/europe/uefa-europa-league/679",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9",
-        "cookie": "_cc_id=76e58d2880df6169efbc512088779985; panoramaId_expiry=1747307800798; panoramaId=627304ab36ea29f217b435f67da9185ca02c8a98be6bae5222c29a333750b99c; panoramaIdType=panoDevice; _lr_env_src_ats=false; gc_session_id=u9zxdyv4cc0cwew46w5gi; gcid_first=85a32389-b6d0-4029-8f66-d935194e0dc6; _au_1d=AU1D-0100-001746703007-WR8GT9UD-U340; _pbjs_userid_consent_data=3524755945110770; _gid=GA1.2.848260054.1746704814; _sharedID=33e6ba26-af4c-49fb-b08c-edb85ac456c6; _lr_geo_location=US; _lr_geo_location_state=KS; _sharedID_cst=VyxHLMwsHQ%3D%3D; cto_bidid=z160Z182NHREYVVsZ3Y1SiUyRnIwdlBOZnRYTVhiaG4xcHAwM3BBTDNPJTJGbUVGR21tMEdTSGpxYWdqV0dVWEhwcXRaU1hHSkV2a0xwRXZzamZiRXZTU2dPbmpxYnFRZkZHb3pFTlBpMnVZTjYzZVpnOUUlM0Q; _ga=GA1.1.2057756329.1746703005; exco-uid=s1doc7gv5zl2c54s; pbjs-unifiedid=%7B%22TDID%22%3A%2259f6c2fa-6291-4757-a5b4-7090ca0fe0aa%22%2C%22TDID_LOOKUP%22%3A%22TRUE%22%2C%22TDID_CREATED_AT%22%3A%222025-04-08T12%3A47%3A18%22%7D; pbjs-unifiedid_cst=yyzLLLEsNg%3D%3D; _lr_retry_request=true; FCNEC=%5B%5B%22AKsRol9OezXa5Fpj_hJpooacIrsbDv24Eh8GRPhOZzpz_TroahIYyeLnck_ZcA1nrnQuaTHPKK_HJ0jROYlfeVAOb0pGlsEgPAVThFAZdPDwWUWSytNam1vm_KsKdSZDdgpoLRejFcoOA5Gg-saZ07wopunuAqDX5Q%3D%3D%22%5D%5D; __gads=ID=c547b4a13f2f753f:T=1746703003:RT=1746710719:S=ALNI_MbNUkKXtNi606HB7_aO4e-fi1-TXA; __gpi=UID=000010af9ed8a6df:T=1746703003:RT=1746710719:S=ALNI_Mb5rpDAojxqVcqko0EGRwwTgDjNJw; __eoi=ID=b326749d02c657b5:T=1746703003:RT=1746710719:S=AA-AfjaFDydqBMCctGgCnzv_LZ8S; cto_bundle=NpZd4V9PZ1MlMkZmRTVHQTN3cGlVQUYyZmdWYmpSUFZYenlTRmw1JTJCekUyTEEyWGJxZ0VJdUhtd0dkVHk1dlFVRDJyUmhra1RkOEdzQnBPb3FVQzRPd1ZHaENkMzMlMkZtWkNpNTUzd25pU2Z5dkp6d1UyVG5PaUFzanB4M3N1aXdBRFlUdUYlMkJoeU1yeXNoRTEweCUyRjd1SVBiSmNneDBnJTNEJTNE; _awl=2.1746710722.5-8c7a02360a1c07ad76e2e89d22217448-6763652d75732d63656e7472616c31-0; _ga_FVWZ0RM4DH=GS2.1.s1746710828$o2$g0$t1746710828$j60$l0$h0; _ga_HNQ9P9MGZR=GS2.1.s1746703005$o1$g1$t1746710828$j14$l0$h0"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    session.get("https://www.sofascore.com/")
-    response = session.get(url)
+    response = session_manager.get(url)
     
     if response.status_code == 200:
         match_info = response.json()
         out_path = f"match_info_{event_id}.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(match_info, indent=4, ensure_ascii=False))
-        print(f"Match information saved to {out_path}")
+        dump_sink.dump(out_path, match_info)
         return match_info
     else:
         print(f"Error: {response.status_code}")
@@ -1175,28 +590,12 @@ def get_player(player_id):
     """
     url = f"https://www.sofascore.com/api/v1/player/{player_id}"
     
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "cache-control": "max-age=0",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "sec-fetch-site": "same-origin",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-dest": "empty",
-        "referer": "https://www.sofascore.com/",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en-US,en;q=0.9"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
-        with open(f"player_{player_id}.json", "w", encoding="utf-8") as f:
-            f.write(json.dumps(response.json(), indent=4, ensure_ascii=False))
-        return response.json()
+        data = response.json()
+        dump_sink.dump(f"player_{player_id}.json", data)
+        return data
     else:
         print(f"Error fetching player {player_id}: {response.status_code}")
         return None
@@ -1207,17 +606,7 @@ def get_team(team_id):
     """
     url = f"https://www.sofascore.com/api/v1/team/{team_id}"
     
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "referer": "https://www.sofascore.com/"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
         return response.json()
@@ -1231,17 +620,7 @@ def get_team_players(team_id):
     """
     url = f"https://www.sofascore.com/api/v1/team/{team_id}/players"
     
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "referer": "https://www.sofascore.com/"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
         return response.json()
@@ -1255,17 +634,7 @@ def get_event_h2h(event_id):
     """
     url = f"https://www.sofascore.com/api/v1/event/{event_id}/h2h"
     
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "referer": "https://www.sofascore.com/"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
         return response.json()
@@ -1279,17 +648,7 @@ def get_event_incidents(event_id):
     """
     url = f"https://www.sofascore.com/api/v1/event/{event_id}/incidents"
     
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "referer": "https://www.sofascore.com/"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url)
+    response = session_manager.get(url)
 
     if response.status_code == 200:
         return response.json()
@@ -1304,17 +663,7 @@ def search(query):
     url = "https://www.sofascore.com/api/v1/search/all"
     params = {"q": query}
     
-    headers = {
-        "host": "www.sofascore.com",
-        "connection": "keep-alive",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        "accept": "*/*",
-        "referer": "https://www.sofascore.com/"
-    }
-
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url, params=params)
+    response = session_manager.get(url, params=params)
 
     if response.status_code == 200:
         return response.json()
@@ -0,0 +1,122 @@
+"""
+Execution layer for api_server.py: blocking sofascore calls off the event loop.
+
+The functions in sofascore.py use `requests` and block for the whole upstream
+round trip. Called straight from an `async def` route they stall uvicorn's
+event loop, so one slow SofaScore response delays every other request.
+UpstreamExecutor.run() hands them to a dedicated, sized thread pool instead
+and awaits the result, leaving the loop free to serve other requests
+(cache hits in particular) in the meantime.
+
+Each sofascore function has its own concurrency limit and timeout:
+- at most ROUTE_LIMITS[name] (default API_ROUTE_CONCURRENCY) calls of one
+  function run at once, so a burst on one route cannot occupy every
+  worker thread
+- a call that has not finished within ROUTE_TIMEOUTS[name] (default
+  API_UPSTREAM_TIMEOUT) seconds, queueing included, raises
+  UpstreamTimeout; the route answers right away, while the thread
+  finishes the request in the background and keeps its slot of the
+  function's limit until it does
+
+Configuration via environment variables
+- API_UPSTREAM_WORKERS (default: 32) — worker threads; 0 runs calls inline
+  on the event loop (the old behaviour, kept for benchmarking)
+- API_ROUTE_CONCURRENCY (default: 8) — default per-function limit
+- API_UPSTREAM_TIMEOUT (default: 20) — default per-call timeout in seconds
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+UPSTREAM_WORKERS = int(os.environ.get("API_UPSTREAM_WORKERS", "32"))
+ROUTE_CONCURRENCY = int(os.environ.get("API_ROUTE_CONCURRENCY", "8"))
+UPSTREAM_TIMEOUT = float(os.environ.get("API_UPSTREAM_TIMEOUT", "20"))
+
+# sofascore function -> max concurrent calls (image cache misses hit a slower CDN)
+ROUTE_LIMITS: Dict[str, int] = {
+    "download_player_image": 4,
+    "download_team_image_full": 4,
+    "download_team_image_small": 4,
+    "download_tournament_image": 4,
+    "download_manager_image": 4,
+}
+
+# sofascore function -> timeout in seconds (bulk lists take longer upstream)
+ROUTE_TIMEOUTS: Dict[str, float] = {
+    "get_scheduled_events": 30,
+    "get_football_tournaments": 30,
+    "get_football_categories": 30,
+}
+
+
+class UpstreamTimeout(Exception):
+    pass
+
+
+class UpstreamExecutor:
+    """Runs blocking calls in a thread pool with per-function concurrency limits and timeouts."""
+
+    def __init__(self, workers: int = UPSTREAM_WORKERS, default_limit: int = ROUTE_CONCURRENCY,
+                 default_timeout: float = UPSTREAM_TIMEOUT, limits: Optional[Dict[str, int]] = None,
+                 timeouts: Optional[Dict[str, float]] = None):
+        self.workers = max(0, workers)
+        self.default_limit = max(1, default_limit)
+        self.default_timeout = default_timeout
+        self.limits = ROUTE_LIMITS if limits is None else limits
+        self.timeouts = ROUTE_TIMEOUTS if timeouts is None else timeouts
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="upstream") if self.workers else None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, name: str, key: str) -> None:
+        counts = self.counts.get(name)
+        if counts is None:
+            counts = self.counts[name] = {"calls": 0, "timeouts": 0, "running": 0}
+        counts[key] += 1
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Await func(*args) from a worker thread; `name` selects the limit and timeout."""
+        self._count(name, "calls")
+        if self._pool is None:
+            return func(*args)
+        timeout = self.timeouts.get(name, self.default_timeout)
+        try:
+            return await asyncio.wait_for(self._run_limited(name, func, *args), timeout)
+        except asyncio.TimeoutError:
+            self._count(name, "timeouts")
+            raise UpstreamTimeout(f"{name} did not answer within {timeout:g}s") from None
+
+    async def _run_limited(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = self._semaphores[name] = asyncio.Semaphore(self.limits.get(name, self.default_limit))
+        await semaphore.acquire()
+        counts = self.counts[name]
+        counts["running"] += 1
+
+        def finished(future: "asyncio.Future[Any]") -> None:
+            # The slot belongs to the thread, not to the awaiting request: a
+            # timed-out call keeps it until the blocking function returns
+            counts["running"] -= 1
+            semaphore.release()
+            if not future.cancelled():
+                future.exception()  # retrieved: a timed-out caller no longer awaits it
+
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._pool, functools.partial(func, *args))
+        except BaseException:
+            counts["running"] -= 1
+            semaphore.release()
+            raise
+        future.add_done_callback(finished)
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": self.workers, "routes": self.counts}
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)